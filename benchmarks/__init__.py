@@ -0,0 +1 @@
+"""End-to-end benchmarks against a local stand-in for the Trello API."""
@@ -0,0 +1,260 @@
+"""A local stand-in for the Trello REST API with generated boards.
+
+Serves the routes the MCP tools use. Each response carries Trello's quota headers
+for a configurable quota (enforced with 429s), and requests can be slowed by
+a fixed latency or refused with 429 at random so rate-limit handling is exercised.
+Run it on its own with ``python -m benchmarks.fake_trello --cards 50000 --port 8900``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+# Vocabulary for generated card names and descriptions.
+_VOCABULARY = """
+alpha beta gamma delta deploy release fix bug feature review design api cache login search
+report export import billing invoice customer onboarding mobile web backend frontend database
+migration metrics alert dashboard docs
+"""
+WORDS = tuple(_VOCABULARY.split())
+
+COLORS = ("green", "yellow", "orange", "red", "purple", "blue")
+
+QUOTA_INTERVAL_S = 10.0
+
+# Per-kind prefixes keep generated ids unique, 24 hex characters and time-ordered.
+_KINDS = {"board": 1, "list": 2, "label": 3, "card": 4}
+
+
+def fake_id(kind: str, n: int) -> str:
+    return f"{_KINDS[kind]:x}{n:023x}"
+
+
+def make_board(n: int, cards: int, lists: int = 10, labels: int = 6, seed: int = 0) -> dict:
+    """A generated board: its lists, labels and cards, deterministic for a given seed."""
+    rng = random.Random(seed * 1_000_003 + n)
+    board_id = fake_id("board", n)
+    board_lists = [
+        {"id": fake_id("list", n * 1000 + i), "name": f"List {i}", "idBoard": board_id}
+        for i in range(lists)
+    ]
+    board_labels = [
+        {
+            "id": fake_id("label", n * 1000 + i),
+            "name": WORDS[i % len(WORDS)].title(),
+            "color": COLORS[i % len(COLORS)],
+            "idBoard": board_id,
+        }
+        for i in range(labels)
+    ]
+    board_cards = []
+    for i in range(cards):
+        card_id = fake_id("card", n * 10_000_000 + i)
+        due = None
+        if rng.random() < 0.4:
+            due = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00.000Z"
+        board_cards.append(
+            {
+                "id": card_id,
+                "name": " ".join(rng.choices(WORDS, k=4)),
+                "desc": " ".join(rng.choices(WORDS, k=rng.randint(0, 40))),
+                "idList": rng.choice(board_lists)["id"],
+                "idBoard": board_id,
+                "url": f"https://trello.com/c/{card_id[-8:]}",
+                "closed": rng.random() < 0.05,
+                "labels": rng.sample(board_labels, k=rng.randint(0, min(2, labels))),
+                "due": due,
+                "dueComplete": due is not None and rng.random() < 0.3,
+            }
+        )
+    return {
+        "board": {"id": board_id, "name": f"Board {n}"},
+        "lists": board_lists,
+        "labels": board_labels,
+        "cards": board_cards,
+    }
+
+
+class FakeTrello:
+    """Generated boards served over Trello's URL layout (under ``/1``)."""
+
+    def __init__(
+        self,
+        boards: int = 1,
+        cards: int = 1000,
+        lists: int = 10,
+        labels: int = 6,
+        latency: float = 0.0,
+        throttle: float = 0.0,
+        token_limit: int = 100_000,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.throttle = throttle
+        self.token_limit = token_limit
+        self._window = (0.0, 0)  # start of the current 10s quota window, requests in it
+        self._rng = random.Random(seed)
+        self.boards = {}
+        self.cards: dict[str, dict] = {}
+        for n in range(boards):
+            board = make_board(n, cards, lists, labels, seed)
+            self.boards[board["board"]["id"]] = board
+            self.cards.update((card["id"], card) for card in board["cards"])
+        self.requests = 0
+        self.throttled = 0
+        # Encoded card lists, dropped whenever a card changes.
+        self._encoded: dict[str, bytes] = {}
+        self.app = Starlette(
+            routes=[
+                Route("/", self.root, methods=["GET", "HEAD"]),
+                Route("/1/members/me/boards", self.my_boards),
+                Route("/1/boards/{board_id}", self.board),
+                Route("/1/boards/{board_id}/lists", self.board_lists),
+                Route("/1/boards/{board_id}/labels", self.board_labels),
+                Route("/1/boards/{board_id}/cards", self.board_cards),
+                Route("/1/boards/{board_id}/cards/all", self.board_cards),
+                Route("/1/boards/{board_id}/actions", self.empty),
+                Route("/1/boards/{board_id}/customFields", self.empty),
+                Route("/1/lists/{list_id}/cards", self.list_cards),
+                Route("/1/cards/{card_id}", self.card, methods=["GET", "PUT"]),
+            ],
+            middleware=[Middleware(BaseHTTPMiddleware, dispatch=self._gate)],
+        )
+
+    async def _gate(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        """Apply the latency, quota and random throttling to every API request."""
+        if not request.url.path.startswith("/1/"):
+            return await call_next(request)
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        started, used = self._window
+        now = time.monotonic()
+        if now - started >= QUOTA_INTERVAL_S:
+            started, used = now, 0
+        used += 1
+        self._window = (started, used)
+        if used > self.token_limit or (self.throttle and self._rng.random() < self.throttle):
+            self.throttled += 1
+            response = JSONResponse({"error": "API_TOKEN_LIMIT_EXCEEDED"}, status_code=429)
+        else:
+            response = await call_next(request)
+        # One quota stands in for both of Trello's (per key and per token).
+        for scope in ("api-key", "api-token"):
+            prefix = f"x-rate-limit-{scope}"
+            response.headers[f"{prefix}-max"] = str(self.token_limit)
+            response.headers[f"{prefix}-remaining"] = str(max(0, self.token_limit - used))
+            response.headers[f"{prefix}-interval-ms"] = str(int(QUOTA_INTERVAL_S * 1000))
+        return response
+
+    def _board(self, request: Request) -> dict:
+        return self.boards[request.path_params["board_id"]]
+
+    async def root(self, request: Request) -> Response:
+        return Response()
+
+    async def my_boards(self, request: Request) -> Response:
+        return JSONResponse([b["board"] for b in self.boards.values()])
+
+    async def board(self, request: Request) -> Response:
+        board = self._board(request)
+        body = {**board["board"], "dateLastActivity": "2026-01-01T00:00:00.000Z"}
+        if "lists" in request.query_params:
+            body.update(
+                lists=board["lists"],
+                cards=[c for c in board["cards"] if not c["closed"]],
+                labels=board["labels"],
+                checklists=[],
+                customFields=[],
+            )
+        return JSONResponse(body)
+
+    async def board_lists(self, request: Request) -> Response:
+        return JSONResponse(self._board(request)["lists"])
+
+    async def board_labels(self, request: Request) -> Response:
+        return JSONResponse(self._board(request)["labels"])
+
+    async def board_cards(self, request: Request) -> Response:
+        board_id = request.path_params["board_id"]
+        closed = request.url.path.endswith("/all")
+        limit = request.query_params.get("limit")
+        if limit is None:
+            key = f"{board_id}:{closed}"
+            if key not in self._encoded:
+                cards = [c for c in self.boards[board_id]["cards"] if closed or not c["closed"]]
+                self._encoded[key] = json.dumps(cards).encode()
+            return Response(self._encoded[key], media_type="application/json")
+        # Paged reads: newest first, below the ``before`` id.
+        before = request.query_params.get("before")
+        cards = [
+            c
+            for c in reversed(self.boards[board_id]["cards"])
+            if not c["closed"] and (before is None or c["id"] < before)
+        ]
+        return JSONResponse(cards[: int(limit)])
+
+    async def list_cards(self, request: Request) -> Response:
+        list_id = request.path_params["list_id"]
+        board = next(
+            b for b in self.boards.values() if any(x["id"] == list_id for x in b["lists"])
+        )
+        return JSONResponse([c for c in board["cards"] if c["idList"] == list_id])
+
+    async def card(self, request: Request) -> Response:
+        card = self.cards[request.path_params["card_id"]]
+        if request.method == "PUT":
+            for name, value in request.query_params.items():
+                if name in ("name", "desc", "idList", "due"):
+                    card[name] = value
+                elif name in ("closed", "dueComplete"):
+                    card[name] = value == "true"
+            for closed in (False, True):
+                self._encoded.pop(f"{card['idBoard']}:{closed}", None)
+        return JSONResponse(card)
+
+    async def empty(self, request: Request) -> Response:
+        return JSONResponse([])
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--boards", type=int, default=1)
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--labels", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--throttle", type=float, default=0.0, help="Share answered with 429")
+    parser.add_argument("--token-limit", type=int, default=100_000, help="Requests per 10s")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    started = time.perf_counter()
+    fake = FakeTrello(
+        args.boards,
+        args.cards,
+        args.lists,
+        args.labels,
+        args.latency,
+        args.throttle,
+        args.token_limit,
+        args.seed,
+    )
+    print(f"generated {len(fake.cards)} cards in {time.perf_counter() - started:.1f}s", flush=True)
+    uvicorn.run(fake.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Drive the MCP tools end to end against a local fake Trello API and report the results.
+
+Starts ``benchmarks.fake_trello`` in a subprocess, opens ``--sessions`` concurrent
+in-memory MCP sessions against the server, and has each make ``--calls`` tool calls
+drawn from a fixed, seeded mix of reads and writes. Reports throughput, p50/p99 latency
+(overall and per tool) and the benchmark process's peak RSS::
+
+    python -m benchmarks.run --cards 50000 --sessions 200 --output before.json
+    python -m benchmarks.run --cards 50000 --sessions 200 --compare before.json
+
+Results record the git commit and every parameter, so runs are comparable when the
+parameters match.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmarks.fake_trello import WORDS, fake_id
+
+# (tool, weight): mostly reads, with enough writes to keep invalidating caches.
+MIX = (
+    ("query_cards", 3),
+    ("search_cards", 3),
+    ("list_lists", 2),
+    ("get_board_labels", 1),
+    ("get_board_cards", 1),
+    ("update_card", 1),
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_trello(
+    cards: int,
+    lists: int,
+    latency: float,
+    throttle: float,
+    token_limit: int,
+    seed: int,
+    timeout: float = 300.0,
+) -> tuple[subprocess.Popen, str]:
+    """Spawn the fake API and wait until it answers; returns the process and base URL."""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.fake_trello",
+            f"--port={port}",
+            f"--cards={cards}",
+            f"--lists={lists}",
+            f"--latency={latency}",
+            f"--throttle={throttle}",
+            f"--token-limit={token_limit}",
+            f"--seed={seed}",
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1)
+            return proc, f"http://127.0.0.1:{port}/1"
+        except OSError:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                proc.kill()
+                raise RuntimeError("fake Trello server did not start") from None
+            time.sleep(0.1)
+
+
+def _arguments(tool: str, rng: random.Random, cards: int, lists: int) -> dict:
+    board_id = fake_id("board", 0)
+    if tool == "query_cards":
+        return {"board_id": board_id, "list_ids": [fake_id("list", rng.randrange(lists))]}
+    if tool == "search_cards":
+        return {"board_id": board_id, "query": " ".join(rng.sample(WORDS, 2))}
+    if tool == "get_board_cards":
+        return {"board_id": board_id, "fields": ["id", "name", "id_list"]}
+    if tool == "update_card":
+        return {"card_id": fake_id("card", rng.randrange(cards)), "name": rng.choice(WORDS)}
+    return {"board_id": board_id}
+
+
+async def drive(
+    sessions: int, calls: int, cards: int, lists: int, seed: int
+) -> list[tuple[str, float, bool]]:
+    """Run the sessions concurrently; returns ``(tool, seconds, ok)`` for every call."""
+    from fastmcp import Client
+
+    from trello_mcp.server import mcp
+
+    tools = [tool for tool, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    samples: list[tuple[str, float, bool]] = []
+
+    async def session(n: int):
+        rng = random.Random(seed * 10_007 + n)
+        async with Client(mcp) as client:
+            for tool in rng.choices(tools, weights, k=calls):
+                arguments = _arguments(tool, rng, cards, lists)
+                started = time.perf_counter()
+                result = await client.call_tool(tool, arguments, raise_on_error=False)
+                samples.append((tool, time.perf_counter() - started, not result.is_error))
+
+    await asyncio.gather(*(session(n) for n in range(sessions)))
+    return samples
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _latency(values: list[float]) -> dict[str, float]:
+    return {
+        "p50_ms": _percentile(values, 0.5) * 1000,
+        "p99_ms": _percentile(values, 0.99) * 1000,
+        "mean_ms": statistics.fmean(values) * 1000,
+    }
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def summarize(samples: list[tuple[str, float, bool]], wall: float) -> dict:
+    per_tool: dict[str, list[float]] = {}
+    for tool, seconds, _ in samples:
+        per_tool.setdefault(tool, []).append(seconds)
+    return {
+        "calls": len(samples),
+        "errors": sum(not ok for _, _, ok in samples),
+        "wall_s": wall,
+        "throughput_per_s": len(samples) / wall if wall else 0.0,
+        **_latency([seconds for _, seconds, _ in samples]),
+        "peak_rss_mb": peak_rss() / 2**20,
+        "tools": {tool: {"calls": len(v), **_latency(v)} for tool, v in sorted(per_tool.items())},
+    }
+
+
+# Headline figures compared between runs, and whether higher is better.
+COMPARED = {"throughput_per_s": True, "p50_ms": False, "p99_ms": False, "peak_rss_mb": False}
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """One line per headline figure with its change from ``baseline``."""
+    lines = []
+    if current["params"] != baseline["params"]:
+        lines.append("warning: parameters differ from the baseline run")
+    for name, higher_is_better in COMPARED.items():
+        new, old = current["results"][name], baseline["results"][name]
+        change = (new - old) / old * 100 if old else 0.0
+        better = (change > 0) == higher_is_better
+        verdict = "" if abs(change) < 5 else (" (better)" if better else " (worse)")
+        lines.append(f"{name:>18}: {old:10.2f} -> {new:10.2f}  {change:+6.1f}%{verdict}")
+    return lines
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run one benchmark and return the report."""
+    proc, base_url = start_fake_trello(
+        args.cards, args.lists, args.latency, args.throttle, args.token_limit, args.seed
+    )
+    try:
+        from trello_mcp import server
+        from trello_mcp.models import Settings
+
+        server._settings = Settings(
+            trello_api_key="bench",
+            trello_token="bench",
+            trello_base_url=base_url,
+            trello_warm_up=False,
+            trello_cache_max_bytes=args.cache_bytes,
+        )
+        server._client = None
+        server._pool = None
+        started = time.perf_counter()
+        samples = asyncio.run(drive(args.sessions, args.calls, args.cards, args.lists, args.seed))
+        wall = time.perf_counter() - started
+    finally:
+        proc.terminate()
+        proc.wait()
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "compare")}
+    return {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "params": params,
+        "results": summarize(samples, wall),
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=5000, help="Cards on the board")
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent MCP sessions")
+    parser.add_argument("--calls", type=int, default=10, help="Tool calls per session")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--throttle", type=float, default=0.0, help="Share answered with 429")
+    parser.add_argument(
+        "--token-limit",
+        type=int,
+        default=100_000,
+        help="Fake per-token quota per 10s (Trello's real one is 100)",
+    )
+    parser.add_argument("--cache-bytes", type=int, default=32 * 1024 * 1024)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    parser.add_argument("--compare", help="Compare against a report saved with --output")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    results = report["results"]
+    print(
+        f"{results['calls']} calls ({results['errors']} errors) in {results['wall_s']:.2f}s: "
+        f"{results['throughput_per_s']:.1f}/s, p50 {results['p50_ms']:.1f}ms, "
+        f"p99 {results['p99_ms']:.1f}ms, peak RSS {results['peak_rss_mb']:.0f}MB"
+    )
+    for tool, stats in results["tools"].items():
+        print(
+            f"  {tool:>18}: {stats['calls']:6d} calls, "
+            f"p50 {stats['p50_ms']:8.1f}ms, p99 {stats['p99_ms']:8.1f}ms"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"compared with {baseline.get('commit') or args.compare}:")
+        for line in compare(report, baseline):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Run many client calls with bounded concurrency and per-item results."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from trello_mcp.client import describe_error
+
+# Concurrent calls per bulk operation. The client's rate limiter still paces them;
+# this only caps how many wait on it at once.
+DEFAULT_CONCURRENCY = 8
+
+
+async def run_bulk[T](
+    items: list[T],
+    op: Callable[[T], Awaitable[Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict:
+    """Apply ``op`` to every item, collecting each outcome instead of stopping on errors.
+
+    Returns ``{"succeeded": n, "failed": m, "results": [...]}`` where results are in
+    input order and each has ``index``, ``ok`` and either ``result`` or ``error``.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int, item: T) -> dict:
+        async with semaphore:
+            try:
+                result = await op(item)
+            except Exception as exc:
+                return {"index": index, "ok": False, "error": describe_error(exc)}
+        return {"index": index, "ok": True, "result": result}
+
+    results = await asyncio.gather(*(one(i, item) for i, item in enumerate(items)))
+    failed = sum(not r["ok"] for r in results)
+    return {"succeeded": len(results) - failed, "failed": failed, "results": results}
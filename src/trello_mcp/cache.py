@@ -0,0 +1,236 @@
+"""Read-through response cache backends for TrelloClient."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Seconds a cached response is served without asking Trello again.
+DEFAULT_TTLS = {
+    "boards": 300.0,
+    "lists": 60.0,
+    "labels": 300.0,
+    "custom_fields": 600.0,
+    "cards": 30.0,
+    "checklists": 60.0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response body and the metadata needed to revalidate it."""
+
+    body: bytes
+    kind: str
+    scope: str
+    expires_at: float
+    etag: str | None = None
+    # dateLastActivity of the owning board/card when the body was fetched.
+    activity: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+
+def cache_key(path: str, params: dict | None = None, namespace: str = "") -> str:
+    """Build a stable cache key from a request path and its (non-auth) params.
+
+    ``namespace`` keeps entries fetched with different credentials apart.
+    """
+    key = f"{namespace}:{path}" if namespace else path
+    if not params:
+        return key
+    query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+    return f"{key}?{query}"
+
+
+class ResponseCache(ABC):
+    """Storage backend for cached GET responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, kind: str, scope: str | None = None) -> None:
+        """Drop every entry of ``kind``, optionally only those for one ``scope``."""
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache bounded by the total size of the cached bodies."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._pop(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.size += entry.size
+        while self.size > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+
+    def invalidate(self, kind: str, scope: str | None = None) -> None:
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.kind == kind and (scope is None or entry.scope == scope)
+        ]
+        for key in stale:
+            self._pop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+
+class SqliteCache(ResponseCache):
+    """On-disk LRU cache that survives restarts and is shared by processes on one host.
+
+    The database runs in WAL mode so several server processes can read while one
+    writes. Queries are short local operations and run inline on the event loop, so
+    writes are kept few: hits record their use time in memory and write it back in
+    one transaction every ``touch_interval`` seconds, and the total size is summed
+    only after ``max_bytes / 16`` bytes have been written, so the cache may briefly
+    exceed its bound by that much per process.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, touch_interval: float = 5.0):
+        import sqlite3  # deferred: most deployments use the in-memory cache
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._touched: dict[str, float] = {}
+        self._touched_at = time.monotonic()
+        self._unchecked = 0
+        self._db = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                kind TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                etag TEXT,
+                activity TEXT,
+                size INTEGER NOT NULL,
+                used_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_kind ON entries (kind, scope)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used_at)")
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        return self._db.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0]
+
+    def close(self):
+        self._write_touches()
+        self._db.close()
+
+    def get(self, key: str) -> CacheEntry | None:
+        row = self._db.execute(
+            "SELECT body, kind, scope, expires_at, etag, activity FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        if time.monotonic() - self._touched_at >= self.touch_interval:
+            self._write_touches()
+        return CacheEntry(*row)
+
+    def _write_touches(self):
+        """Record the use times of recent hits, in one write transaction."""
+        self._touched_at = time.monotonic()
+        if not self._touched:
+            return
+        touched = [(used_at, key) for key, used_at in self._touched.items()]
+        self._touched.clear()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.executemany("UPDATE entries SET used_at = ? WHERE key = ?", touched)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.body,
+                entry.kind,
+                entry.scope,
+                entry.expires_at,
+                entry.etag,
+                entry.activity,
+                entry.size,
+                time.time(),
+            ),
+        )
+        self._touched.pop(key, None)
+        self._unchecked += entry.size
+        if self._unchecked < self.max_bytes // 16:
+            return
+        self._unchecked = 0
+        excess = self.size - self.max_bytes
+        if excess > 0:
+            self._write_touches()
+            self._evict(excess)
+
+    def _evict(self, excess: int):
+        """Delete least recently used entries until ``excess`` bytes are freed."""
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY used_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def invalidate(self, kind: str, scope: str | None = None) -> None:
+        if scope is None:
+            self._db.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+        else:
+            self._db.execute("DELETE FROM entries WHERE kind = ? AND scope = ?", (kind, scope))
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM entries")
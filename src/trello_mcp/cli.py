@@ -1,5 +1,9 @@
 """CLI for running the Trello MCP server."""
 
+import contextlib
+import os
+import tempfile
+
 import click
 
 
@@ -9,17 +13,96 @@ def cli():
 
 
 @cli.command()
-@click.option("--transport", default="stdio", type=click.Choice(["stdio", "sse"]))
-@click.option("--port", default=8000, type=int, help="Port for SSE transport")
-def run(transport: str, port: int):
+@click.option(
+    "--transport",
+    default="stdio",
+    type=click.Choice(["stdio", "sse", "http"]),
+    envvar="TRELLO_TRANSPORT",
+    help="stdio, SSE at /sse, or streamable HTTP at /mcp",
+)
+@click.option("--host", default="127.0.0.1", help="Interface for SSE and HTTP transports")
+@click.option("--port", default=8000, type=int, help="Port for SSE and HTTP transports")
+@click.option(
+    "--workers",
+    default=1,
+    type=int,
+    envvar="TRELLO_WORKERS",
+    help="HTTP worker processes (0 for one per CPU)",
+)
+def run(transport: str, host: str, port: int, workers: int):
     """Start the Trello MCP server."""
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and transport != "http":
+        raise click.UsageError("--workers needs --transport http")
+    if transport == "http":
+        _run_http(host, port, workers)
+        return
+
     from trello_mcp.server import mcp
 
     if transport == "sse":
-        mcp.run(transport="sse", port=port)
+        mcp.run(transport="sse", host=host, port=port)
     else:
         mcp.run(transport="stdio")
 
 
+def _run_http(host: str, port: int, workers: int):
+    """Serve streamable HTTP from ``workers`` processes sharing a rate-limit budget and cache."""
+    import uvicorn
+
+    from trello_mcp.models import ServerSettings
+
+    # Workers are spawned processes, so settings reach them through the environment.
+    os.environ["TRELLO_WORKERS"] = str(workers)
+    shared = []
+    if workers > 1:
+        # Unless configured, workers share the rate-limit budget and the response cache
+        # through temporary SQLite files, so a write in one invalidates the others' reads.
+        for env, prefix in (
+            ("TRELLO_RATE_LIMIT_PATH", "trello-mcp-ratelimit-"),
+            ("TRELLO_CACHE_PATH", "trello-mcp-cache-"),
+        ):
+            if not os.environ.get(env):
+                fd, path = tempfile.mkstemp(prefix=prefix, suffix=".db")
+                os.close(fd)
+                os.environ[env] = path
+                shared.append(path)
+    try:
+        uvicorn.run(
+            "trello_mcp.server:create_http_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            timeout_graceful_shutdown=ServerSettings().trello_drain_timeout,
+        )
+    finally:
+        for path in shared:
+            for suffix in ("", "-wal", "-shm"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path + suffix)
+
+
+@cli.command("bench-startup")
+@click.option("--runs", default=5, type=int, help="Number of cold starts to time")
+@click.option("--budget", type=float, help="Fail if the median exceeds this many seconds")
+@click.option("--profile", is_flag=True, help="Also list the slowest imports")
+def bench_startup(runs: int, budget: float | None, profile: bool):
+    """Time cold starts of the stdio server up to its first tools/list response."""
+    from trello_mcp import startup
+
+    stats = startup.bench_startup(runs)
+    click.echo(
+        f"cold start to tools/list over {runs} runs: "
+        f"min {stats['min']:.3f}s, median {stats['median']:.3f}s, max {stats['max']:.3f}s"
+    )
+    if profile:
+        click.echo("slowest imports (cumulative):")
+        for module, seconds in startup.import_profile():
+            click.echo(f"  {seconds:7.3f}s  {module}")
+    if budget is not None and stats["median"] > budget:
+        raise click.ClickException(f"median {stats['median']:.3f}s exceeds budget {budget}s")
+
+
 if __name__ == "__main__":
     cli()
@@ -1,75 +1,429 @@
 """Async Trello API client using httpx."""
 
+import asyncio
+import contextlib
+import hashlib
+import importlib.util
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+
 import httpx
+from pydantic import BaseModel
 
+from trello_mcp.cache import DEFAULT_TTLS, CacheEntry, ResponseCache, cache_key
+from trello_mcp.index import BoardIndex
+from trello_mcp.jsonstream import iter_array_items
+from trello_mcp.metrics import Metrics
 from trello_mcp.models import (
     TrelloBoard,
+    TrelloBoardSnapshot,
     TrelloCard,
     TrelloCheckItem,
     TrelloChecklist,
     TrelloCustomField,
     TrelloLabel,
     TrelloList,
+    TrelloWebhook,
+    api_fields,
+    list_adapter,
 )
+from trello_mcp.query import CardIndex
+from trello_mcp.ratelimit import RateLimiter
+from trello_mcp.resilience import CircuitBreaker, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# Connection pool defaults: enough keep-alive connections for concurrent tool calls
+# without holding idle sockets open longer than Trello's load balancers do.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=10.0)
+
+# Maximum number of routes Trello accepts in a single /batch request.
+BATCH_LIMIT = 10
+
+# Maximum number of cards Trello returns per page.
+CARD_PAGE_LIMIT = 1000
+
+# Card indexes kept for query_cards, least recently used dropped first.
+MAX_CARD_INDEXES = 16
+
+# Cached kinds whose freshness can be checked against their owner's dateLastActivity,
+# and the owning model's collection.
+_ACTIVITY_OWNERS = {
+    "lists": "boards",
+    "labels": "boards",
+    "custom_fields": "boards",
+    "cards": "boards",
+    "checklists": "cards",
+}
+# How long a fetched dateLastActivity is trusted, so bursts of reads share one check.
+ACTIVITY_TTL = 5.0
+
+
+def describe_error(exc: BaseException) -> str:
+    """Summarize a failed call without echoing the request URL (it carries credentials)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        resp = exc.response
+        detail = resp.text.strip()[:200]
+        return f"{resp.status_code} {resp.reason_phrase}" + (f": {detail}" if detail else "")
+    return str(exc) or type(exc).__name__
+
+
+def _batch_result(url: str, item: dict) -> dict:
+    """Map one /batch response entry (``{"200": data}`` or an error) to its route."""
+    if len(item) == 1:
+        code, value = next(iter(item.items()))
+        if code.isdigit():
+            status = int(code)
+            if 200 <= status < 300:
+                return {"url": url, "status": status, "data": value}
+            return {"url": url, "status": status, "error": value}
+    return {"url": url, "status": item.get("statusCode"), "error": item.get("message", item)}
+
+
+def make_http_client(
+    base_url: str,
+    limits: httpx.Limits | None = None,
+    timeout: httpx.Timeout | None = None,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """The pooled HTTP client behind TrelloClient, shareable between several of them."""
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        base_url=base_url,
+        limits=limits or DEFAULT_LIMITS,
+        timeout=timeout or DEFAULT_TIMEOUT,
+        http2=http2,
+    )
+
+
+async def warm_up_connection(http: httpx.AsyncClient):
+    """Open a pooled connection (DNS, TCP and TLS) ahead of the first real call.
+
+    The probe is unauthenticated and bypasses the rate limiter; failures are
+    ignored since the first tool call will simply connect on its own.
+    """
+    with contextlib.suppress(httpx.HTTPError):
+        await http.head("/")
+
+
+def tenant_id(api_key: str, token: str) -> str:
+    """A stable, non-secret identifier for a set of credentials."""
+    return hashlib.sha256(f"{api_key}:{token}".encode()).hexdigest()[:16]
 
 
 class TrelloClient:
     """Async client for the Trello REST API."""
 
-    def __init__(self, api_key: str, token: str, base_url: str = "https://api.trello.com/1"):
+    def __init__(
+        self,
+        api_key: str,
+        token: str,
+        base_url: str = "https://api.trello.com/1",
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        http2: bool = False,
+        metrics: Metrics | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        http: httpx.AsyncClient | None = None,
+    ):
         self.base_url = base_url
         self._auth = {"key": api_key, "token": token}
-        self._client = httpx.AsyncClient(base_url=base_url, timeout=30.0)
+        # A connection pool passed in is shared with other clients and closed by its owner.
+        self._owns_http = http is None
+        self._client = http or make_http_client(base_url, limits, timeout, http2)
+        self._limiter = rate_limiter or RateLimiter()
+        self._retry = retry or RetryPolicy()
+        self._breaker = breaker or CircuitBreaker()
+        self._host = httpx.URL(base_url).host
+        self.metrics = metrics or Metrics()
+        self._cache = cache
+        self._cache_ttls = {**DEFAULT_TTLS, **(cache_ttls or {})}
+        self._board_index = BoardIndex(ttl=self._cache_ttls["boards"])
+        self._namespace = tenant_id(api_key, token)
+        self._activity: dict[str, tuple[float, str | None]] = {}
+        # Bumped by every invalidation of a (kind, scope); scope None covers the whole kind.
+        self._generations: dict[tuple[str, str | None], int] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Path -> (digest of the response body it was built from, index).
+        self._card_indexes: OrderedDict[str, tuple[bytes, CardIndex]] = OrderedDict()
+
+    @property
+    def namespace(self) -> str:
+        """A stable, non-secret identifier for this client's credentials."""
+        return self._namespace
 
     async def close(self):
-        await self._client.aclose()
+        if self._owns_http:
+            await self._client.aclose()
 
-    async def _get(self, path: str, params: dict | None = None) -> list | dict:
+    async def warm_up(self):
+        """Open a pooled connection ahead of the first real call; see warm_up_connection."""
+        await warm_up_connection(self._client)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict | None = None,
+        json_body: dict | None = None,
+        headers: dict | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request through the circuit breaker and rate limiter, with retries.
+
+        429s are retried after the limiter's backoff; transient failures as allowed
+        by the retry policy. With ``stream=True`` the body of a successful response is
+        left unread and the caller must close the response.
+        """
+        key, token = self._auth["key"], self._auth["token"]
         merged = {**self._auth, **(params or {})}
-        resp = await self._client.get(path, params=merged)
-        resp.raise_for_status()
-        return resp.json()
+        throttled = failed = 0
+        while True:
+            self._breaker.check(self._host)
+            await self._limiter.acquire(key, token)
+            request = self._client.build_request(
+                method, path, params=merged, json=json_body, headers=headers
+            )
+            started = time.perf_counter()
+            try:
+                resp = await self._client.send(request, stream=stream)
+            except httpx.HTTPError as exc:
+                elapsed = time.perf_counter() - started
+                self.metrics.observe_request(method, path, None, elapsed, len(request.content))
+                self._breaker.failure(self._host)
+                if failed >= self._retry.max_retries or not self._retry.retries_error(method, exc):
+                    raise
+                self.metrics.observe_retry(type(exc).__name__)
+                await asyncio.sleep(self._retry.backoff(failed))
+                failed += 1
+                continue
+            self.metrics.observe_request(
+                method,
+                path,
+                resp.status_code,
+                time.perf_counter() - started,
+                len(request.content),
+                # A streamed body is still unread, so count what the server announced.
+                int(resp.headers.get("content-length", "0")) if stream else len(resp.content),
+            )
+            self.metrics.observe_headroom(resp.headers)
+            self._limiter.observe(key, token, resp.headers)
+            if resp.status_code >= 500:
+                self._breaker.failure(self._host)
+            else:
+                self._breaker.success(self._host)
+            if resp.status_code == 429 and throttled < self._limiter.max_retries:
+                await resp.aread()
+                self._limiter.throttled(key, token, resp.text)
+                self.metrics.observe_retry("429")
+                retry_after = resp.headers.get("retry-after")
+                await asyncio.sleep(self._limiter.backoff(throttled, retry_after))
+                throttled += 1
+            elif failed < self._retry.max_retries and self._retry.retries_status(
+                method, resp.status_code
+            ):
+                await resp.aclose()
+                self.metrics.observe_retry(str(resp.status_code))
+                await asyncio.sleep(self._retry.backoff(failed, resp.headers.get("retry-after")))
+                failed += 1
+            else:
+                break
+        if resp.status_code != 304 and not resp.is_success:
+            await resp.aread()
+            await resp.aclose()
+            resp.raise_for_status()
+        return resp
+
+    async def _get(
+        self, path: str, params: dict | None = None, *, cache: str | None = None, scope: str = ""
+    ) -> list | dict:
+        return json.loads(await self._get_body(path, params, cache=cache, scope=scope))
+
+    async def _get_models[M: BaseModel](
+        self,
+        model: type[M],
+        path: str,
+        params: dict | None = None,
+        *,
+        cache: str | None = None,
+        scope: str = "",
+    ) -> list[M]:
+        """GET a JSON array and validate it into ``model`` instances straight from the bytes."""
+        body = await self._get_body(path, params, cache=cache, scope=scope)
+        return list_adapter(model).validate_json(body)
+
+    async def _get_body(
+        self, path: str, params: dict | None = None, *, cache: str | None = None, scope: str = ""
+    ) -> bytes:
+        """GET ``path``, sharing one upstream request among identical concurrent calls."""
+        key = cache_key(path, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path, params, cache, scope))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._landed(key, done))
+        # Shielded so one caller's cancellation doesn't fail the others.
+        return await asyncio.shield(task)
+
+    def _landed(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller was cancelled
+
+    async def _fetch(self, path: str, params: dict | None, cache: str | None, scope: str) -> bytes:
+        if cache is None or self._cache is None:
+            resp = await self._request("GET", path, params)
+            return resp.content
+        return await self._cached_get(path, params, cache, scope)
+
+    async def _cached_get(self, path: str, params: dict | None, kind: str, scope: str) -> bytes:
+        """Serve a GET from the cache, revalidating it once it expires.
+
+        An expired entry is renewed without refetching when its board's (or card's)
+        dateLastActivity hasn't moved; otherwise it is refetched with If-None-Match.
+        """
+        key = cache_key(path, params, self._namespace)
+        generation = self._generation(kind, scope)
+        entry = self._cache.get(key)
+        if entry is not None and entry.fresh:
+            self.metrics.observe_cache("hit")
+            return entry.body
+        expires_at = time.time() + self._cache_ttls.get(kind, 0.0)
+        activity = None
+        if entry is not None and kind in _ACTIVITY_OWNERS:
+            activity = await self._last_activity(_ACTIVITY_OWNERS[kind], scope)
+            if activity is not None and activity == entry.activity:
+                entry.expires_at = expires_at
+                self._store(key, entry, generation)
+                self.metrics.observe_cache("revalidated")
+                return entry.body
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        resp = await self._request("GET", path, params, headers=headers)
+        if resp.status_code == 304 and entry is not None:
+            entry.expires_at = expires_at
+            entry.activity = activity
+            self._store(key, entry, generation)
+            self.metrics.observe_cache("revalidated")
+            return entry.body
+        self.metrics.observe_cache("miss")
+        body = resp.content
+        etag = resp.headers.get("etag")
+        self._store(key, CacheEntry(body, kind, scope, expires_at, etag, activity), generation)
+        return body
+
+    def _generation(self, kind: str, scope: str) -> tuple[int, int]:
+        return (
+            self._generations.get((kind, None), 0),
+            self._generations.get((kind, scope or None), 0),
+        )
+
+    def _store(self, key: str, entry: CacheEntry, generation: tuple[int, int]):
+        # A write that landed while this read was in flight may have made it stale.
+        if self._generation(entry.kind, entry.scope) == generation:
+            self._cache.set(key, entry)
+
+    async def _last_activity(self, collection: str, model_id: str) -> str | None:
+        """The model's dateLastActivity, memoized for ``ACTIVITY_TTL`` seconds."""
+        path = f"/{collection}/{model_id}"
+        checked = self._activity.get(path)
+        if checked is not None and time.monotonic() - checked[0] < ACTIVITY_TTL:
+            return checked[1]
+        data = await self._get(path, {"fields": "dateLastActivity"})
+        activity = data.get("dateLastActivity")
+        self._activity[path] = (time.monotonic(), activity)
+        return activity
+
+    def _invalidate(self, kind: str, scope: str | None = None):
+        # Reads issued after a write must not join a request that started before it.
+        self._inflight.clear()
+        generation = (kind, scope or None)
+        self._generations[generation] = self._generations.get(generation, 0) + 1
+        if self._cache is not None:
+            self._cache.invalidate(kind, scope or None)
+
+    def _card_changed(self, card: TrelloCard) -> TrelloCard:
+        self._invalidate("cards", card.id_board)
+        return card
 
     async def _post(self, path: str, params: dict | None = None) -> dict:
-        merged = {**self._auth, **(params or {})}
-        resp = await self._client.post(path, params=merged)
-        resp.raise_for_status()
+        resp = await self._request("POST", path, params)
         return resp.json()
 
     async def _put(self, path: str, params: dict | None = None) -> dict:
-        merged = {**self._auth, **(params or {})}
-        resp = await self._client.put(path, params=merged)
-        resp.raise_for_status()
+        resp = await self._request("PUT", path, params)
         return resp.json()
 
     async def _put_json(self, path: str, body: dict) -> dict:
-        resp = await self._client.put(path, params=self._auth, json=body)
-        resp.raise_for_status()
+        resp = await self._request("PUT", path, json_body=body)
         return resp.json()
 
     async def _delete(self, path: str) -> None:
-        resp = await self._client.delete(path, params=self._auth)
-        resp.raise_for_status()
+        await self._request("DELETE", path)
 
     # --- Boards ---
 
-    async def list_boards(self) -> list[TrelloBoard]:
-        data = await self._get("/members/me/boards", {"fields": "name,desc,url,closed"})
-        return [TrelloBoard(**b) for b in data]
+    async def list_boards(self, fields: list[str] | None = None) -> list[TrelloBoard]:
+        return await self._get_models(
+            TrelloBoard,
+            "/members/me/boards",
+            {"fields": api_fields(TrelloBoard, fields)},
+            cache="boards",
+            scope="me",
+        )
 
     async def search_board(self, query: str) -> list[TrelloBoard]:
-        boards = await self.list_boards()
-        q = query.lower()
-        return [b for b in boards if q in b.name.lower()]
+        if self._board_index.stale:
+            self._board_index.update(await self.list_boards())
+        return self._board_index.search(query)
+
+    async def get_board_snapshot(self, board_id: str) -> TrelloBoardSnapshot:
+        """Fetch a board and its lists, cards, labels, checklists and custom fields at once."""
+        body = await self._get_body(
+            f"/boards/{board_id}",
+            {
+                "fields": api_fields(TrelloBoard),
+                "lists": "open",
+                "list_fields": api_fields(TrelloList),
+                "cards": "open",
+                "card_fields": api_fields(TrelloCard),
+                "labels": "all",
+                "label_fields": api_fields(TrelloLabel),
+                "labels_limit": 1000,
+                "checklists": "all",
+                "checklist_fields": api_fields(TrelloChecklist),
+                "checkItem_fields": api_fields(TrelloCheckItem),
+                "customFields": "true",
+            },
+        )
+        return TrelloBoardSnapshot.model_validate_json(body)
 
     # --- Lists ---
 
-    async def list_lists(self, board_id: str) -> list[TrelloList]:
-        data = await self._get(f"/boards/{board_id}/lists")
-        return [TrelloList(**lst) for lst in data]
+    async def list_lists(self, board_id: str, fields: list[str] | None = None) -> list[TrelloList]:
+        return await self._get_models(
+            TrelloList,
+            f"/boards/{board_id}/lists",
+            {"fields": api_fields(TrelloList, fields)},
+            cache="lists",
+            scope=board_id,
+        )
 
     async def create_list(self, board_id: str, name: str) -> TrelloList:
         data = await self._post("/lists", {"name": name, "idBoard": board_id})
+        self._invalidate("lists", board_id)
         return TrelloList(**data)
 
     async def update_list(
@@ -81,31 +435,113 @@ class TrelloClient:
         if closed is not None:
             params["closed"] = str(closed).lower()
         data = await self._put(f"/lists/{list_id}", params)
-        return TrelloList(**data)
+        lst = TrelloList(**data)
+        self._invalidate("lists", lst.id_board)
+        return lst
 
     async def archive_list(self, list_id: str) -> TrelloList:
         return await self.update_list(list_id, closed=True)
 
     # --- Cards ---
 
-    async def list_cards(self, list_id: str) -> list[TrelloCard]:
-        data = await self._get(f"/lists/{list_id}/cards")
-        return [TrelloCard(**c) for c in data]
+    async def list_cards(self, list_id: str, fields: list[str] | None = None) -> list[TrelloCard]:
+        return await self._get_models(
+            TrelloCard, f"/lists/{list_id}/cards", {"fields": api_fields(TrelloCard, fields)}
+        )
+
+    async def get_board_cards(
+        self, board_id: str, fields: list[str] | None = None
+    ) -> list[TrelloCard]:
+        return await self._get_models(
+            TrelloCard,
+            f"/boards/{board_id}/cards",
+            {"fields": api_fields(TrelloCard, fields)},
+            cache="cards",
+            scope=board_id,
+        )
 
-    async def get_board_cards(self, board_id: str) -> list[TrelloCard]:
-        data = await self._get(f"/boards/{board_id}/cards")
-        return [TrelloCard(**c) for c in data]
+    async def get_board_card_index(self, board_id: str, closed: bool = False) -> CardIndex:
+        """All of a board's cards, indexed for ``query_cards``.
+
+        The index is rebuilt only when the (cached or refetched) response body changes.
+        ``closed`` includes archived cards.
+        """
+        path = f"/boards/{board_id}/cards/all" if closed else f"/boards/{board_id}/cards"
+        body = await self._get_body(
+            path, {"fields": api_fields(TrelloCard)}, cache="cards", scope=board_id
+        )
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._card_indexes.get(path)
+        if cached is not None and cached[0] == digest:
+            self._card_indexes.move_to_end(path)
+            return cached[1]
+        index = CardIndex(list_adapter(TrelloCard).validate_json(body))
+        self._card_indexes[path] = (digest, index)
+        self._card_indexes.move_to_end(path)
+        while len(self._card_indexes) > MAX_CARD_INDEXES:
+            self._card_indexes.popitem(last=False)
+        return index
+
+    async def _stream_cards(self, path: str, params: dict) -> AsyncIterator[TrelloCard]:
+        resp = await self._request("GET", path, params, stream=True)
+        try:
+            async for item in iter_array_items(resp.aiter_bytes()):
+                yield TrelloCard(**item)
+        finally:
+            await resp.aclose()
+
+    async def get_board_cards_page(
+        self,
+        board_id: str,
+        limit: int = CARD_PAGE_LIMIT,
+        before: str | None = None,
+        since: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[TrelloCard]:
+        """Fetch one page of a board's cards, newest first.
+
+        ``before``/``since`` are card IDs (or ISO dates) bounding the page; the body is
+        parsed as it streams in.
+        """
+        params: dict = {"fields": api_fields(TrelloCard, fields), "limit": limit}
+        if before is not None:
+            params["before"] = before
+        if since is not None:
+            params["since"] = since
+        return [card async for card in self._stream_cards(f"/boards/{board_id}/cards", params)]
+
+    async def iter_board_cards(
+        self,
+        board_id: str,
+        page_size: int = CARD_PAGE_LIMIT,
+        since: str | None = None,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[TrelloCard]:
+        """Yield every card on a board, newest first, one page in memory at a time."""
+        before = None
+        while True:
+            page = await self.get_board_cards_page(board_id, page_size, before, since, fields)
+            for card in page:
+                yield card
+            if len(page) < page_size:
+                return
+            # Card IDs are Mongo ObjectIds, which sort by creation time.
+            before = min(card.id for card in page)
 
     async def create_card(self, list_id: str, name: str, desc: str = "") -> TrelloCard:
         params = {"idList": list_id, "name": name}
         if desc:
             params["desc"] = desc
         data = await self._post("/cards", params)
-        return TrelloCard(**data)
+        return self._card_changed(TrelloCard(**data))
+
+    async def put_card(self, card_id: str, params: dict) -> TrelloCard:
+        """Apply raw card parameters (``idList``, ``due``, ...) in one PUT."""
+        data = await self._put(f"/cards/{card_id}", params)
+        return self._card_changed(TrelloCard(**data))
 
     async def move_card(self, card_id: str, list_id: str) -> TrelloCard:
-        data = await self._put(f"/cards/{card_id}", {"idList": list_id})
-        return TrelloCard(**data)
+        return await self.put_card(card_id, {"idList": list_id})
 
     async def update_card(
         self, card_id: str, name: str | None = None, desc: str | None = None
@@ -115,41 +551,59 @@ class TrelloClient:
             params["name"] = name
         if desc is not None:
             params["desc"] = desc
-        data = await self._put(f"/cards/{card_id}", params)
-        return TrelloCard(**data)
+        return await self.put_card(card_id, params)
 
     async def add_comment(self, card_id: str, text: str) -> dict:
         return await self._post(f"/cards/{card_id}/actions/comments", {"text": text})
 
+    async def get_board_comments(self, board_id: str, limit: int = 1000) -> list[dict]:
+        """The board's most recent card comments (``commentCard`` actions), newest first."""
+        return await self._get(
+            f"/boards/{board_id}/actions",
+            {"filter": "commentCard", "fields": "data", "limit": limit},
+        )
+
     async def archive_card(self, card_id: str) -> TrelloCard:
-        data = await self._put(f"/cards/{card_id}", {"closed": "true"})
-        return TrelloCard(**data)
+        return await self.put_card(card_id, {"closed": "true"})
 
     # --- Card Due Dates ---
 
     async def set_due_date(self, card_id: str, due: str) -> TrelloCard:
-        data = await self._put(f"/cards/{card_id}", {"due": due})
-        return TrelloCard(**data)
+        return await self.put_card(card_id, {"due": due})
 
     async def mark_due_complete(self, card_id: str, complete: bool) -> TrelloCard:
-        data = await self._put(f"/cards/{card_id}", {"dueComplete": str(complete).lower()})
-        return TrelloCard(**data)
+        return await self.put_card(card_id, {"dueComplete": str(complete).lower()})
 
     # --- Checklists ---
 
-    async def get_checklists(self, card_id: str) -> list[TrelloChecklist]:
-        data = await self._get(f"/cards/{card_id}/checklists")
-        return [TrelloChecklist(**cl) for cl in data]
+    async def get_checklists(
+        self, card_id: str, fields: list[str] | None = None
+    ) -> list[TrelloChecklist]:
+        params = {
+            "fields": api_fields(TrelloChecklist, fields),
+            "checkItems": "all",
+            "checkItem_fields": api_fields(TrelloCheckItem),
+        }
+        return await self._get_models(
+            TrelloChecklist,
+            f"/cards/{card_id}/checklists",
+            params,
+            cache="checklists",
+            scope=card_id,
+        )
 
     async def create_checklist(self, card_id: str, name: str) -> TrelloChecklist:
         data = await self._post(f"/cards/{card_id}/checklists", {"name": name})
+        self._invalidate("checklists", card_id)
         return TrelloChecklist(**data)
 
     async def delete_checklist(self, checklist_id: str) -> None:
         await self._delete(f"/checklists/{checklist_id}")
+        self._invalidate("checklists")
 
     async def add_check_item(self, checklist_id: str, name: str) -> TrelloCheckItem:
         data = await self._post(f"/checklists/{checklist_id}/checkItems", {"name": name})
+        self._invalidate("checklists")
         return TrelloCheckItem(**data)
 
     async def update_check_item(
@@ -168,34 +622,104 @@ class TrelloClient:
         data = await self._put(
             f"/cards/{card_id}/checklist/{checklist_id}/checkItem/{check_item_id}", params
         )
+        self._invalidate("checklists", card_id)
         return TrelloCheckItem(**data)
 
     async def delete_check_item(self, checklist_id: str, check_item_id: str) -> None:
         await self._delete(f"/checklists/{checklist_id}/checkItems/{check_item_id}")
+        self._invalidate("checklists")
 
     # --- Labels ---
 
-    async def get_board_labels(self, board_id: str) -> list[TrelloLabel]:
-        data = await self._get(f"/boards/{board_id}/labels")
-        return [TrelloLabel(**lbl) for lbl in data]
+    async def get_board_labels(
+        self, board_id: str, fields: list[str] | None = None
+    ) -> list[TrelloLabel]:
+        return await self._get_models(
+            TrelloLabel,
+            f"/boards/{board_id}/labels",
+            {"fields": api_fields(TrelloLabel, fields)},
+            cache="labels",
+            scope=board_id,
+        )
 
     async def create_label(self, board_id: str, name: str, color: str) -> TrelloLabel:
         data = await self._post("/labels", {"idBoard": board_id, "name": name, "color": color})
+        self._invalidate("labels", board_id)
         return TrelloLabel(**data)
 
     async def add_label_to_card(self, card_id: str, label_id: str) -> None:
         await self._post(f"/cards/{card_id}/idLabels", {"value": label_id})
+        self._invalidate("cards")
 
     async def remove_label_from_card(self, card_id: str, label_id: str) -> None:
         await self._delete(f"/cards/{card_id}/idLabels/{label_id}")
+        self._invalidate("cards")
 
     # --- Custom Fields ---
 
     async def get_custom_fields(self, board_id: str) -> list[TrelloCustomField]:
-        data = await self._get(f"/boards/{board_id}/customFields")
-        return [TrelloCustomField(**cf) for cf in data]
+        return await self._get_models(
+            TrelloCustomField,
+            f"/boards/{board_id}/customFields",
+            cache="custom_fields",
+            scope=board_id,
+        )
 
     async def set_card_custom_field(self, card_id: str, field_id: str, value: dict) -> dict:
         return await self._put_json(
             f"/cards/{card_id}/customField/{field_id}/item", {"value": value}
         )
+
+    # --- Webhooks ---
+
+    async def create_webhook(
+        self, callback_url: str, model_id: str, description: str = ""
+    ) -> TrelloWebhook:
+        params = {"callbackURL": callback_url, "idModel": model_id}
+        if description:
+            params["description"] = description
+        data = await self._post("/webhooks", params)
+        return TrelloWebhook(**data)
+
+    async def list_webhooks(self) -> list[TrelloWebhook]:
+        """The webhooks registered with this client's token."""
+        return await self._get_models(TrelloWebhook, f"/tokens/{self._auth['token']}/webhooks")
+
+    async def delete_webhook(self, webhook_id: str) -> None:
+        await self._delete(f"/webhooks/{webhook_id}")
+
+    # --- Batch ---
+
+    async def batch_get(self, urls: list[str]) -> list[dict]:
+        """GET many routes via /batch, returning one result per route in input order.
+
+        Routes are sent in chunks of ``BATCH_LIMIT``, concurrently. Each result has
+        ``url`` and ``status`` plus either ``data`` or ``error``; a chunk that fails
+        as a whole reports its error on every route in it.
+        """
+        routes = [u if u.startswith("/") else f"/{u}" for u in urls]
+        chunks = [routes[i : i + BATCH_LIMIT] for i in range(0, len(routes), BATCH_LIMIT)]
+        # /batch splits its urls on commas, so commas inside a route must be encoded.
+        responses = await asyncio.gather(
+            *(
+                self._get("/batch", {"urls": ",".join(u.replace(",", "%2C") for u in chunk)})
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        results = []
+        for chunk, data in zip(chunks, responses, strict=True):
+            if isinstance(data, BaseException):
+                status = (
+                    data.response.status_code if isinstance(data, httpx.HTTPStatusError) else None
+                )
+                error = describe_error(data)
+                results.extend({"url": u, "status": status, "error": error} for u in chunk)
+                continue
+            if not isinstance(data, list) or len(data) != len(chunk):
+                count = len(data) if isinstance(data, list) else 0
+                error = f"/batch returned {count} results for {len(chunk)} routes"
+                results.extend({"url": u, "status": None, "error": error} for u in chunk)
+                continue
+            results.extend(_batch_result(u, item) for u, item in zip(chunk, data, strict=True))
+        return results
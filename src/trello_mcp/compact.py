@@ -0,0 +1,104 @@
+"""Memory-compact storage for the cards of large boards."""
+
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from trello_mcp.models import TrelloCard
+
+
+@dataclass(slots=True)
+class CompactCard:
+    """A card's fields without per-instance dicts; repeated ids are interned."""
+
+    id: str
+    name: str
+    desc: str
+    id_list: str
+    id_board: str
+    url: str
+    closed: bool
+    label_ids: tuple[str, ...]
+    due: str | None
+    due_complete: bool
+
+
+class CardStore:
+    """Cards keyed by id, held as ``CompactCard`` records and rebuilt as models on demand.
+
+    Label objects are stored once per label rather than once per card.
+    """
+
+    def __init__(self, cards: Iterable[TrelloCard] = ()):
+        self._records: dict[str, CompactCard] = {}
+        self._labels: dict[str, dict] = {}
+        for card in cards:
+            self.put(card)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def put(self, card: TrelloCard):
+        label_ids = []
+        for label in card.labels:
+            label_id = sys.intern(label["id"])
+            self._labels[label_id] = label
+            label_ids.append(label_id)
+        self._records[card.id] = CompactCard(
+            id=card.id,
+            name=card.name,
+            desc=card.desc,
+            id_list=sys.intern(card.id_list),
+            id_board=sys.intern(card.id_board),
+            url=card.url,
+            closed=card.closed,
+            label_ids=tuple(label_ids),
+            due=card.due,
+            due_complete=card.due_complete,
+        )
+
+    def get(self, card_id: str) -> TrelloCard | None:
+        record = self._records.get(card_id)
+        return None if record is None else self.to_card(record)
+
+    def record(self, card_id: str) -> CompactCard | None:
+        return self._records.get(card_id)
+
+    def records(self) -> Iterator[CompactCard]:
+        return iter(self._records.values())
+
+    def pop(self, card_id: str) -> TrelloCard | None:
+        record = self._records.pop(card_id, None)
+        return None if record is None else self.to_card(record)
+
+    def to_card(self, record: CompactCard) -> TrelloCard:
+        """Rebuild the model; fields were validated on the way in, so skip validation."""
+        return TrelloCard.model_construct(
+            id=record.id,
+            name=record.name,
+            desc=record.desc,
+            id_list=record.id_list,
+            id_board=record.id_board,
+            url=record.url,
+            closed=record.closed,
+            labels=[dict(self._labels[label_id]) for label_id in record.label_ids],
+            due=record.due,
+            due_complete=record.due_complete,
+        )
+
+    def remove_list(self, list_id: str):
+        """Drop every card in ``list_id``."""
+        self._records = {cid: r for cid, r in self._records.items() if r.id_list != list_id}
+
+    def drop_label(self, label_id: str):
+        """Remove ``label_id`` from every card that carries it."""
+        for record in self._records.values():
+            if label_id in record.label_ids:
+                record.label_ids = tuple(i for i in record.label_ids if i != label_id)
+        self._labels.pop(label_id, None)
@@ -0,0 +1,43 @@
+"""Bundled Trello API documentation, read once and split into sections."""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import cache
+from importlib import resources as pkg_resources
+
+_HEADING = re.compile(r"^## (.+)$", re.MULTILINE)
+
+
+def section_slug(heading: str) -> str:
+    """``"Error Responses (429)"`` -> ``"error-responses-429"``."""
+    return re.sub(r"[^a-z0-9]+", "-", heading.lower()).strip("-")
+
+
+def split_sections(text: str) -> dict[str, str]:
+    """Map each ``##`` section's slug to its markdown, heading included."""
+    matches = list(_HEADING.finditer(text))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        sections.setdefault(section_slug(match.group(1)), text[match.start() : end].strip())
+    return sections
+
+
+@dataclass(frozen=True)
+class Doc:
+    """One documentation page with its content hash and sections."""
+
+    slug: str
+    text: str
+    sha256: str
+    sections: dict[str, str]
+
+
+@cache
+def load_doc(slug: str) -> Doc:
+    """Read ``resources/<slug>.md`` from the package, once per process."""
+    filename = slug.replace("-", "_")
+    ref = pkg_resources.files("trello_mcp").joinpath(f"resources/{filename}.md")
+    text = ref.read_text(encoding="utf-8")
+    return Doc(slug, text, hashlib.sha256(text.encode()).hexdigest(), split_sections(text))
@@ -0,0 +1,116 @@
+"""In-memory board-name index for ranked, local board search."""
+
+import re
+import time
+import unicodedata
+from bisect import bisect_left
+
+from trello_mcp.models import TrelloBoard
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Case-fold ``text`` and strip accents so "Café" matches "cafe"."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD.findall(normalize(text))
+
+
+class BoardIndex:
+    """Token index over board names, refreshed incrementally from ``list_boards``."""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self.refreshed_at = 0.0
+        self._boards: dict[str, TrelloBoard] = {}
+        self._names: dict[str, str] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._vocab: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self.refreshed_at >= self.ttl
+
+    def update(self, boards: list[TrelloBoard]):
+        """Sync the index with ``boards``, re-tokenizing only renamed or new boards."""
+        seen = set()
+        for board in boards:
+            seen.add(board.id)
+            name = normalize(board.name)
+            if self._names.get(board.id) != name:
+                self._remove(board.id)
+                self._add(board.id, name)
+            self._boards[board.id] = board
+        for board_id in self._boards.keys() - seen:
+            self._remove(board_id)
+            del self._boards[board_id]
+        self._vocab = sorted(self._postings)
+        self.refreshed_at = time.monotonic()
+
+    def _add(self, board_id: str, name: str):
+        self._names[board_id] = name
+        for token in set(_WORD.findall(name)):
+            self._postings.setdefault(token, set()).add(board_id)
+
+    def _remove(self, board_id: str):
+        name = self._names.pop(board_id, None)
+        if name is None:
+            return
+        for token in set(_WORD.findall(name)):
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(board_id)
+                if not ids:
+                    del self._postings[token]
+
+    def _prefixed(self, prefix: str) -> set[str]:
+        ids: set[str] = set()
+        i = bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            ids |= self._postings[self._vocab[i]]
+            i += 1
+        return ids
+
+    def _fuzzy(self, tokens: list[str]) -> dict[str, float]:
+        import difflib  # deferred: only needed when nothing matches exactly
+
+        scores: dict[str, float] = {}
+        for token in tokens:
+            for match in difflib.get_close_matches(token, self._vocab, n=10, cutoff=0.75):
+                ratio = difflib.SequenceMatcher(None, token, match).ratio()
+                for board_id in self._postings[match]:
+                    scores[board_id] = max(scores.get(board_id, 0.0), ratio)
+        return scores
+
+    def search(self, query: str, limit: int | None = None) -> list[TrelloBoard]:
+        """Return boards matching ``query``, best match first.
+
+        Exact names rank above name prefixes, then boards whose words start with
+        every query word, then plain substrings. Typo-tolerant matches are only
+        used when nothing else matches.
+        """
+        q = normalize(query).strip()
+        tokens = _WORD.findall(q)
+        scores: dict[str, float] = {}
+        if tokens:
+            candidates = set.intersection(*(self._prefixed(t) for t in tokens))
+            for board_id in candidates:
+                scores[board_id] = 60.0
+        for board_id, name in self._names.items():
+            if name == q:
+                scores[board_id] = 100.0
+            elif name.startswith(q):
+                scores[board_id] = max(scores.get(board_id, 0.0), 80.0)
+            elif q in name:
+                scores[board_id] = max(scores.get(board_id, 0.0), 40.0)
+        if not scores and tokens:
+            scores = {bid: 20.0 * ratio for bid, ratio in self._fuzzy(tokens).items()}
+        ranked = sorted(scores, key=lambda bid: (-scores[bid], self._names[bid]))
+        return [self._boards[bid] for bid in ranked[:limit]]
@@ -0,0 +1,45 @@
+"""Incremental parsing of large JSON array responses."""
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+_WHITESPACE = " \t\r\n"
+_SEPARATORS = _WHITESPACE + ","
+
+
+async def iter_array_items(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a top-level JSON array as its bytes arrive.
+
+    Only the element currently being received is buffered, so a response with tens
+    of thousands of objects never has to be held in memory as a whole.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    started = False
+    async for chunk in chunks:
+        buf += utf8.decode(chunk)
+        pos = 0
+        while True:
+            skip = _SEPARATORS if started else _WHITESPACE
+            while pos < len(buf) and buf[pos] in skip:
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # the element is incomplete; wait for the next chunk
+            yield item
+        buf = buf[pos:]
+    raise ValueError("truncated JSON array")
@@ -0,0 +1,201 @@
+"""In-process metrics for tool calls, Trello requests, the cache and the rate limit."""
+
+import re
+import time
+from collections.abc import Mapping
+
+# Upper bounds (seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Trello ids are 24 hex characters; folding them keeps route labels low-cardinality.
+_ID = re.compile(r"/[0-9a-f]{24}(?=/|$)")
+# Boards and cards are also addressed by short link, so fold whatever follows these.
+_RESOURCE = re.compile(r"(/(?:boards|cards|lists|checklists))/[^/]+")
+# Token routes carry the token itself, which must never reach a label.
+_TOKEN = re.compile(r"/tokens/[^/]+")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def route_label(path: str) -> str:
+    """``/cards/5f0c.../actions`` -> ``/cards/{id}/actions``."""
+    path = _RESOURCE.sub(r"\1/{id}", _TOKEN.sub("/tokens/{token}", path))
+    return _ID.sub("/{id}", path)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus model."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile as the upper bound of the bucket that holds it.
+
+        Values above the last bucket are reported as its bound, keeping the result finite.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, seen in zip(self.buckets, self.counts, strict=True):
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = {k: v.replace("\\", "\\\\").replace('"', '\\"') for k, v in labels.items()}
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped.items()) + "}"
+
+
+class Metrics:
+    """Counters, gauges and histograms for one server process.
+
+    ``render`` produces the Prometheus text format; ``snapshot`` a JSON-friendly summary.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.tool_calls: dict[tuple[str, str], int] = {}
+        self.tool_latency: dict[str, Histogram] = {}
+        self.upstream_requests: dict[tuple[str, str, str], int] = {}
+        self.upstream_latency: dict[tuple[str, str], Histogram] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries: dict[str, int] = {}
+        self.cache: dict[str, int] = {"hit": 0, "revalidated": 0, "miss": 0}
+        self.rate_limit_remaining: dict[str, int] = {}
+
+    def observe_tool(self, tool: str, seconds: float, error: bool = False):
+        outcome = "error" if error else "ok"
+        self.tool_calls[tool, outcome] = self.tool_calls.get((tool, outcome), 0) + 1
+        self.tool_latency.setdefault(tool, Histogram()).observe(seconds)
+
+    def observe_request(
+        self,
+        method: str,
+        path: str,
+        status: int | None,
+        seconds: float,
+        sent: int = 0,
+        received: int = 0,
+    ):
+        """Record one upstream request; ``status`` is None when no response arrived."""
+        route = route_label(path)
+        key = (method, route, str(status) if status is not None else "error")
+        self.upstream_requests[key] = self.upstream_requests.get(key, 0) + 1
+        self.upstream_latency.setdefault((method, route), Histogram()).observe(seconds)
+        self.bytes_sent += sent
+        self.bytes_received += received
+
+    def observe_retry(self, reason: str):
+        self.retries[reason] = self.retries.get(reason, 0) + 1
+
+    def observe_cache(self, result: str):
+        """Count a cached read served as ``hit``, ``revalidated`` or ``miss``."""
+        self.cache[result] += 1
+
+    def observe_headroom(self, headers: Mapping[str, str]):
+        """Keep the quota Trello last reported as remaining for the key and the token."""
+        for scope in ("api-key", "api-token"):
+            value = headers.get(f"x-rate-limit-{scope}-remaining")
+            if value is not None and value.isdigit():
+                self.rate_limit_remaining[scope] = int(value)
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Share of cached reads answered without downloading the body again."""
+        total = sum(self.cache.values())
+        return (self.cache["hit"] + self.cache["revalidated"]) / total if total else None
+
+    def snapshot(self) -> dict:
+        tools = {}
+        for tool, histogram in sorted(self.tool_latency.items()):
+            tools[tool] = {
+                "calls": histogram.count,
+                "errors": self.tool_calls.get((tool, "error"), 0),
+                "mean_seconds": histogram.sum / histogram.count,
+                "p50_seconds": histogram.quantile(0.5),
+                "p99_seconds": histogram.quantile(0.99),
+            }
+        statuses: dict[str, int] = {}
+        for (_, _, status), count in self.upstream_requests.items():
+            statuses[status] = statuses.get(status, 0) + count
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "tools": tools,
+            "upstream": {
+                "requests": sum(statuses.values()),
+                "statuses": dict(sorted(statuses.items())),
+                "retries": dict(self.retries),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+            },
+            "cache": {**self.cache, "hit_ratio": self.cache_hit_ratio},
+            "rate_limit_remaining": dict(self.rate_limit_remaining),
+        }
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def sample(name: str, value: float, **labels: str):
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        def histogram(name: str, h: Histogram, **labels: str):
+            for bound, count in zip(h.buckets, h.counts, strict=True):
+                sample(f"{name}_bucket", count, **labels, le=repr(bound))
+            sample(f"{name}_bucket", h.count, **labels, le="+Inf")
+            sample(f"{name}_sum", h.sum, **labels)
+            sample(f"{name}_count", h.count, **labels)
+
+        family("trello_mcp_tool_calls_total", "counter", "MCP tool calls by outcome.")
+        for (tool, outcome), count in sorted(self.tool_calls.items()):
+            sample("trello_mcp_tool_calls_total", count, tool=tool, outcome=outcome)
+        family("trello_mcp_tool_duration_seconds", "histogram", "MCP tool call latency.")
+        for tool, h in sorted(self.tool_latency.items()):
+            histogram("trello_mcp_tool_duration_seconds", h, tool=tool)
+
+        family("trello_mcp_upstream_requests_total", "counter", "Trello API requests by status.")
+        for (method, route, status), count in sorted(self.upstream_requests.items()):
+            sample(
+                "trello_mcp_upstream_requests_total",
+                count,
+                method=method,
+                route=route,
+                status=status,
+            )
+        family("trello_mcp_upstream_duration_seconds", "histogram", "Trello API request latency.")
+        for (method, route), h in sorted(self.upstream_latency.items()):
+            histogram("trello_mcp_upstream_duration_seconds", h, method=method, route=route)
+        family("trello_mcp_upstream_sent_bytes_total", "counter", "Request body bytes sent.")
+        sample("trello_mcp_upstream_sent_bytes_total", self.bytes_sent)
+        family("trello_mcp_upstream_received_bytes_total", "counter", "Response bytes received.")
+        sample("trello_mcp_upstream_received_bytes_total", self.bytes_received)
+        family("trello_mcp_upstream_retries_total", "counter", "Trello API retries by reason.")
+        for reason, count in sorted(self.retries.items()):
+            sample("trello_mcp_upstream_retries_total", count, reason=reason)
+
+        family("trello_mcp_cache_reads_total", "counter", "Cached reads by result.")
+        for result, count in self.cache.items():
+            sample("trello_mcp_cache_reads_total", count, result=result)
+        family("trello_mcp_rate_limit_remaining", "gauge", "Quota Trello last reported left.")
+        for scope, value in sorted(self.rate_limit_remaining.items()):
+            sample("trello_mcp_rate_limit_remaining", value, scope=scope)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,373 @@
+"""In-memory board mirrors kept current by Trello webhook actions."""
+
+import base64
+import hashlib
+import hmac
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import ClassVar
+
+from pydantic import BaseModel
+
+from trello_mcp.client import TrelloClient
+from trello_mcp.compact import CardStore
+from trello_mcp.models import (
+    TrelloBoard,
+    TrelloBoardSnapshot,
+    TrelloCard,
+    TrelloCheckItem,
+    TrelloChecklist,
+    TrelloLabel,
+    TrelloList,
+)
+from trello_mcp.query import CardIndex
+
+# Action types that bring in objects whose fields the payload doesn't fully carry.
+RESYNC_ACTIONS = {
+    "copyCard",
+    "convertToCardFromCheckItem",
+    "moveCardToBoard",
+    "moveListToBoard",
+    "copyChecklist",
+    "updateChecklist",
+}
+
+
+def verify_signature(secret: str, body: bytes, callback_url: str, signature: str) -> bool:
+    """Check Trello's ``X-Trello-Webhook`` header: base64(HMAC-SHA1(secret, body + url))."""
+    digest = hmac.new(secret.encode(), body + callback_url.encode(), hashlib.sha1).digest()
+    return hmac.compare_digest(base64.b64encode(digest).decode(), signature)
+
+
+def _model_fields(model: type[BaseModel], data: dict) -> dict:
+    """Keep only the keys of ``data`` that ``model`` declares (by name or alias)."""
+    known = {info.alias or name for name, info in model.model_fields.items()}
+    return {k: v for k, v in data.items() if k in known}
+
+
+class MirrorGapError(Exception):
+    """An action referenced state the mirror doesn't have, so it must resync."""
+
+
+class BoardMirror:
+    """A local copy of one board, updated by applying webhook actions."""
+
+    def __init__(self, snapshot: TrelloBoardSnapshot, max_age: float = 900.0):
+        self.max_age = max_age
+        self.load(snapshot)
+
+    def load(self, snapshot: TrelloBoardSnapshot):
+        """Replace the mirrored state with a fresh snapshot."""
+        self.board = TrelloBoard(**snapshot.model_dump(include=set(TrelloBoard.model_fields)))
+        self._lists = {lst.id: lst for lst in snapshot.lists}
+        self._cards = CardStore(snapshot.cards)
+        self._labels = {lbl.id: lbl for lbl in snapshot.labels}
+        self._checklists = {cl.id: cl for cl in snapshot.checklists}
+        self._custom_fields = list(snapshot.custom_fields)
+        self._index: CardIndex | None = None
+        self._seen: deque[str] = deque(maxlen=1000)
+        self.synced_at = time.monotonic()
+        self.gap = False
+
+    @property
+    def board_id(self) -> str:
+        return self.board.id
+
+    @property
+    def stale(self) -> bool:
+        return self.gap or time.monotonic() - self.synced_at > self.max_age
+
+    # --- Reads (open objects only, like the API's defaults) ---
+
+    def lists(self) -> list[TrelloList]:
+        return [lst for lst in self._lists.values() if not lst.closed]
+
+    def cards(self, list_id: str | None = None) -> list[TrelloCard]:
+        return [
+            self._cards.to_card(r)
+            for r in self._cards.records()
+            if not r.closed and (list_id is None or r.id_list == list_id)
+        ]
+
+    def card_index(self) -> CardIndex:
+        """A query index over the open cards, built once per change to the mirror."""
+        if self._index is None:
+            self._index = CardIndex(self.cards())
+        return self._index
+
+    def labels(self) -> list[TrelloLabel]:
+        return list(self._labels.values())
+
+    def checklists(self, card_id: str) -> list[TrelloChecklist]:
+        return [cl for cl in self._checklists.values() if cl.id_card == card_id]
+
+    def has_list(self, list_id: str) -> bool:
+        return list_id in self._lists
+
+    def has_card(self, card_id: str) -> bool:
+        return card_id in self._cards
+
+    def snapshot(self) -> TrelloBoardSnapshot:
+        return TrelloBoardSnapshot(
+            **self.board.model_dump(),
+            lists=self.lists(),
+            cards=self.cards(),
+            labels=self.labels(),
+            checklists=[cl for cl in self._checklists.values() if self._is_open(cl.id_card)],
+            custom_fields=self._custom_fields,
+        )
+
+    def _is_open(self, card_id: str) -> bool:
+        record = self._cards.record(card_id)
+        return record is not None and not record.closed
+
+    # --- Writes ---
+
+    def put(self, obj: BaseModel):
+        """Record an object this server just wrote, ahead of its webhook."""
+        self._index = None
+        if isinstance(obj, TrelloCard):
+            self._cards.put(obj)
+        elif isinstance(obj, TrelloList):
+            self._lists[obj.id] = obj
+        elif isinstance(obj, TrelloLabel):
+            self._labels[obj.id] = obj
+
+    def apply(self, action: dict):
+        """Apply one webhook action. Unknown references mark the mirror for resync.
+
+        A malformed action also marks it for resync (it may have been half applied)
+        before its error is raised.
+        """
+        if action.get("id") in self._seen:
+            return
+        self._index = None
+        try:
+            self._apply(action.get("type", ""), action.get("data", {}))
+        except MirrorGapError:
+            self.gap = True
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self.gap = True
+            raise
+        if action.get("id"):
+            self._seen.append(action["id"])
+
+    def _apply(self, kind: str, data: dict):
+        if kind in RESYNC_ACTIONS:
+            raise MirrorGapError(kind)
+        handler = self._HANDLERS.get(kind)
+        if handler is not None:
+            handler(self, data)
+
+    def _card(self, data: dict) -> TrelloCard:
+        card = self._cards.get(data.get("card", {}).get("id", ""))
+        if card is None:
+            raise MirrorGapError("unknown card")
+        return card
+
+    def _list(self, data: dict) -> TrelloList:
+        lst = self._lists.get(data.get("list", {}).get("id", ""))
+        if lst is None:
+            raise MirrorGapError("unknown list")
+        return lst
+
+    def _checklist(self, data: dict) -> TrelloChecklist:
+        checklist = self._checklists.get(data.get("checklist", {}).get("id", ""))
+        if checklist is None:
+            raise MirrorGapError("unknown checklist")
+        return checklist
+
+    def _set_labels(self, card: TrelloCard, labels: list[dict]):
+        self._cards.put(card.model_copy(update={"labels": labels}))
+
+    def _set_items(self, checklist: TrelloChecklist, items: list[TrelloCheckItem]):
+        self._checklists[checklist.id] = checklist.model_copy(update={"check_items": items})
+
+    def _create_card(self, data: dict):
+        # The action only carries the card's id, name and short links, so it can fill in
+        # a card this server already stored from its own write, but not describe a new one.
+        card = self._card(data)
+        fields = _model_fields(TrelloCard, data["card"])
+        self._cards.put(TrelloCard(**{**card.model_dump(by_alias=True), **fields}))
+
+    def _update_card(self, data: dict):
+        card = self._card(data)
+        changes = {k: data["card"][k] for k in data.get("old", {}) if k in data["card"]}
+        self._cards.put(TrelloCard(**{**card.model_dump(by_alias=True), **changes}))
+
+    def _delete_card(self, data: dict):
+        self._cards.pop(data.get("card", {}).get("id", ""))
+
+    def _add_label_to_card(self, data: dict):
+        card = self._card(data)
+        label = data["label"]
+        if all(lbl.get("id") != label["id"] for lbl in card.labels):
+            self._set_labels(card, [*card.labels, label])
+
+    def _remove_label_from_card(self, data: dict):
+        card = self._card(data)
+        label_id = data["label"]["id"]
+        self._set_labels(card, [lbl for lbl in card.labels if lbl.get("id") != label_id])
+
+    def _create_list(self, data: dict):
+        fields = {"idBoard": self.board_id, **_model_fields(TrelloList, data["list"])}
+        self._lists[fields["id"]] = TrelloList(**fields)
+
+    def _update_list(self, data: dict):
+        lst = self._list(data)
+        changes = {k: data["list"][k] for k in data.get("old", {}) if k in data["list"]}
+        self._lists[lst.id] = TrelloList(**{**lst.model_dump(by_alias=True), **changes})
+
+    def _remove_list(self, data: dict):
+        list_id = self._list(data).id
+        del self._lists[list_id]
+        self._cards.remove_list(list_id)
+
+    def _put_label(self, data: dict):
+        fields = {"idBoard": self.board_id, **_model_fields(TrelloLabel, data["label"])}
+        label = self._labels.get(fields["id"])
+        base = label.model_dump(by_alias=True) if label is not None else {}
+        self._labels[fields["id"]] = TrelloLabel(**{**base, **fields})
+
+    def _delete_label(self, data: dict):
+        label_id = data["label"]["id"]
+        self._labels.pop(label_id, None)
+        self._cards.drop_label(label_id)
+
+    def _add_checklist(self, data: dict):
+        card = self._card(data)
+        checklist = data["checklist"]
+        self._checklists[checklist["id"]] = TrelloChecklist(
+            id=checklist["id"], name=checklist.get("name", ""), idCard=card.id
+        )
+
+    def _remove_checklist(self, data: dict):
+        self._checklists.pop(data.get("checklist", {}).get("id", ""), None)
+
+    def _create_check_item(self, data: dict):
+        checklist = self._checklist(data)
+        fields = {"idChecklist": checklist.id, **_model_fields(TrelloCheckItem, data["checkItem"])}
+        item = TrelloCheckItem(**fields)
+        items = [i for i in checklist.check_items if i.id != item.id]
+        self._set_items(checklist, [*items, item])
+
+    def _update_check_item(self, data: dict):
+        checklist = self._checklist(data)
+        changes = _model_fields(TrelloCheckItem, data["checkItem"])
+        items = [
+            TrelloCheckItem(**{**i.model_dump(by_alias=True), **changes})
+            if i.id == changes.get("id")
+            else i
+            for i in checklist.check_items
+        ]
+        self._set_items(checklist, items)
+
+    def _delete_check_item(self, data: dict):
+        checklist = self._checklist(data)
+        item_id = data["checkItem"]["id"]
+        self._set_items(checklist, [i for i in checklist.check_items if i.id != item_id])
+
+    def _update_board(self, data: dict):
+        changes = {k: data["board"][k] for k in data.get("old", {}) if k in data["board"]}
+        self.board = TrelloBoard(
+            **{**self.board.model_dump(), **_model_fields(TrelloBoard, changes)}
+        )
+
+    _HANDLERS: ClassVar[dict[str, Callable[["BoardMirror", dict], None]]] = {
+        "createCard": _create_card,
+        "updateCard": _update_card,
+        "deleteCard": _delete_card,
+        "moveCardFromBoard": _delete_card,
+        "addLabelToCard": _add_label_to_card,
+        "removeLabelFromCard": _remove_label_from_card,
+        "createList": _create_list,
+        "updateList": _update_list,
+        "moveListFromBoard": _remove_list,
+        "createLabel": _put_label,
+        "updateLabel": _put_label,
+        "deleteLabel": _delete_label,
+        "addChecklistToCard": _add_checklist,
+        "removeChecklistFromCard": _remove_checklist,
+        "createCheckItem": _create_check_item,
+        "updateCheckItem": _update_check_item,
+        "updateCheckItemStateOnCard": _update_check_item,
+        "deleteCheckItem": _delete_check_item,
+        "updateBoard": _update_board,
+    }
+
+
+class MirrorRegistry:
+    """The boards this server mirrors and the webhooks that feed them."""
+
+    def __init__(self, max_age: float = 900.0):
+        self.max_age = max_age
+        self._mirrors: dict[str, BoardMirror] = {}
+        self._webhooks: dict[str, str] = {}
+
+    def __contains__(self, board_id: str) -> bool:
+        return board_id in self._mirrors
+
+    def __len__(self) -> int:
+        return len(self._mirrors)
+
+    @property
+    def board_ids(self) -> list[str]:
+        return list(self._mirrors)
+
+    async def track(self, client: TrelloClient, board_id: str, callback_url: str) -> BoardMirror:
+        """Register a webhook for ``board_id`` and load its initial snapshot.
+
+        The webhook is created first so no change can slip in between the two. One left
+        registered by an earlier run (Trello refuses duplicates) is reused instead.
+        """
+        if board_id not in self._webhooks:
+            webhook = next(
+                (
+                    w
+                    for w in await client.list_webhooks()
+                    if w.callback_url == callback_url and w.id_model == board_id
+                ),
+                None,
+            ) or await client.create_webhook(
+                callback_url, board_id, description=f"trello-mcp mirror {board_id}"
+            )
+            self._webhooks[board_id] = webhook.id
+        snapshot = await client.get_board_snapshot(board_id)
+        mirror = self._mirrors[board_id] = BoardMirror(snapshot, self.max_age)
+        return mirror
+
+    async def untrack(self, client: TrelloClient, board_id: str):
+        self._mirrors.pop(board_id, None)
+        webhook_id = self._webhooks.pop(board_id, None)
+        if webhook_id is not None:
+            await client.delete_webhook(webhook_id)
+
+    async def get(self, client: TrelloClient, board_id: str) -> BoardMirror | None:
+        """Return the mirror for ``board_id``, resyncing it first if it is stale."""
+        mirror = self._mirrors.get(board_id)
+        if mirror is not None and mirror.stale:
+            mirror.load(await client.get_board_snapshot(board_id))
+        return mirror
+
+    def board_for_list(self, list_id: str) -> str | None:
+        return next((b for b, m in self._mirrors.items() if m.has_list(list_id)), None)
+
+    def board_for_card(self, card_id: str) -> str | None:
+        return next((b for b, m in self._mirrors.items() if m.has_card(card_id)), None)
+
+    def handle(self, payload: dict):
+        """Apply a webhook payload (``{"action": ..., "model": ...}``) to its mirror."""
+        action = payload.get("action", {})
+        board_id = action.get("data", {}).get("board", {}).get("id") or payload.get(
+            "model", {}
+        ).get("id")
+        mirror = self._mirrors.get(board_id or "")
+        if mirror is not None:
+            mirror.apply(action)
+
+    def observe(self, obj: BaseModel):
+        """Reflect an object returned by one of this server's writes."""
+        mirror = self._mirrors.get(getattr(obj, "id_board", ""))
+        if mirror is not None:
+            mirror.put(obj)
@@ -1,15 +1,101 @@
 """Pydantic models for Trello entities and settings."""
 
-from pydantic import BaseModel, Field
+from functools import cache, cached_property
+from typing import Literal, get_args
+
+from pydantic import BaseModel, Field, TypeAdapter
 from pydantic_settings import BaseSettings
 
 
-class Settings(BaseSettings):
+class ServerSettings(BaseSettings):
+    """Server options that don't depend on Trello credentials."""
+
+    trello_output_max_bytes: int = Field(
+        default=256 * 1024, description="Byte budget per list tool response (0 for no limit)"
+    )
+    trello_output_max_items: int = Field(
+        default=1000, description="Item budget per list tool response (0 for no limit)"
+    )
+    trello_output_desc_chars: int = Field(
+        default=0, description="Truncate descriptions to this many characters (0 keeps them)"
+    )
+    trello_output_profile: Literal["full", "compact"] = Field(
+        default="full", description="Fields list tools return when none are requested"
+    )
+    trello_transport: Literal["stdio", "sse", "http"] = Field(
+        default="stdio", description="Transport `run` serves when --transport isn't given"
+    )
+    trello_workers: int = Field(
+        default=1, description="HTTP worker processes serving this server (set by `run`)"
+    )
+    trello_drain_timeout: float = Field(
+        default=30.0, description="Seconds a stopping HTTP worker lets in-flight requests finish"
+    )
+
+    model_config = {"env_file": ".env", "extra": "ignore"}
+
+
+class Settings(ServerSettings):
     """Application settings loaded from environment variables."""
 
-    trello_api_key: str = Field(description="Trello API key")
-    trello_token: str = Field(description="Trello OAuth token")
+    trello_api_key: str | None = Field(
+        default=None, description="Trello API key (clients may send X-Trello-Key instead)"
+    )
+    trello_token: str | None = Field(
+        default=None, description="Trello OAuth token (clients may send X-Trello-Token instead)"
+    )
     trello_base_url: str = Field(default="https://api.trello.com/1")
+    trello_webhook_url: str | None = Field(
+        default=None, description="Public URL of this server's /webhooks/trello route"
+    )
+    trello_api_secret: str | None = Field(
+        default=None, description="Trello API secret, used to verify webhook signatures"
+    )
+    trello_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024, description="Size cap for cached reads (0 disables caching)"
+    )
+    trello_cache_path: str | None = Field(
+        default=None, description="SQLite file for a persistent cache shared across processes"
+    )
+    trello_rate_limit_path: str | None = Field(
+        default=None, description="SQLite file holding a rate-limit budget shared across processes"
+    )
+    trello_max_clients: int = Field(
+        default=256, description="Per-credential clients kept for callers sending their own token"
+    )
+    trello_http_max_connections: int = Field(default=100)
+    trello_http_max_keepalive: int = Field(
+        default=20, description="Idle connections kept open for reuse"
+    )
+    trello_http_keepalive_expiry: float = Field(default=30.0)
+    trello_http2: bool = Field(
+        default=False, description="Multiplex requests over HTTP/2 (needs the http2 extra)"
+    )
+    trello_connect_timeout: float = Field(default=5.0)
+    trello_read_timeout: float = Field(default=30.0)
+    trello_write_timeout: float = Field(default=30.0)
+    trello_pool_timeout: float = Field(
+        default=10.0, description="Seconds to wait for a free pooled connection"
+    )
+    trello_max_retries: int = Field(
+        default=3, description="Retries for transient failures (idempotent requests only)"
+    )
+    trello_retry_backoff: float = Field(
+        default=0.5, description="Base of the exponential backoff between retries (seconds)"
+    )
+    trello_breaker_threshold: int = Field(
+        default=5, description="Consecutive failures that pause requests to Trello (0 disables)"
+    )
+    trello_breaker_reset: float = Field(
+        default=30.0, description="Seconds requests stay paused before Trello is probed again"
+    )
+    trello_warm_up: bool = Field(
+        default=True, description="Open a connection to Trello when the server starts"
+    )
+    trello_write_delay: float = Field(
+        default=0.0,
+        description="Seconds card updates are queued and merged before sending (0 sends at once)",
+    )
 
     model_config = {"env_file": ".env"}
 
@@ -94,3 +180,99 @@ class TrelloCustomField(BaseModel):
     id_model: str = Field(alias="idModel", default="")
 
     model_config = {"populate_by_name": True}
+
+
+class TrelloWebhook(BaseModel):
+    """A webhook delivering a model's actions to a callback URL."""
+
+    id: str
+    description: str = ""
+    id_model: str = Field(alias="idModel", default="")
+    callback_url: str = Field(alias="callbackURL", default="")
+    active: bool = True
+
+    model_config = {"populate_by_name": True}
+
+
+class TrelloBoardSnapshot(TrelloBoard):
+    """A board with its lists, cards, labels, checklists and custom fields."""
+
+    lists: list[TrelloList] = Field(default_factory=list)
+    cards: list[TrelloCard] = Field(default_factory=list)
+    labels: list[TrelloLabel] = Field(default_factory=list)
+    checklists: list[TrelloChecklist] = Field(default_factory=list)
+    custom_fields: list[TrelloCustomField] = Field(alias="customFields", default_factory=list)
+
+    model_config = {"populate_by_name": True}
+
+    @cached_property
+    def lists_by_id(self) -> dict[str, TrelloList]:
+        return {lst.id: lst for lst in self.lists}
+
+    @cached_property
+    def cards_by_id(self) -> dict[str, TrelloCard]:
+        return {card.id: card for card in self.cards}
+
+    @cached_property
+    def labels_by_id(self) -> dict[str, TrelloLabel]:
+        return {lbl.id: lbl for lbl in self.labels}
+
+    @cached_property
+    def custom_fields_by_id(self) -> dict[str, TrelloCustomField]:
+        return {cf.id: cf for cf in self.custom_fields}
+
+    @cached_property
+    def cards_by_list(self) -> dict[str, list[TrelloCard]]:
+        grouped: dict[str, list[TrelloCard]] = {}
+        for card in self.cards:
+            grouped.setdefault(card.id_list, []).append(card)
+        return grouped
+
+    @cached_property
+    def checklists_by_card(self) -> dict[str, list[TrelloChecklist]]:
+        grouped: dict[str, list[TrelloChecklist]] = {}
+        for cl in self.checklists:
+            grouped.setdefault(cl.id_card, []).append(cl)
+        return grouped
+
+
+class CardUpdate(BaseModel):
+    """A requested change to one card, used by bulk update tools."""
+
+    card_id: str
+    name: str | None = None
+    desc: str | None = None
+
+
+def _is_nested(annotation) -> bool:
+    return any(isinstance(a, type) and issubclass(a, BaseModel) for a in get_args(annotation))
+
+
+def api_fields(model: type[BaseModel], fields: list[str] | None = None) -> str:
+    """Build a Trello ``fields=`` projection for ``model``.
+
+    ``fields`` may use model names (``id_list``) or Trello names (``idList``) and
+    defaults to every field the model declares. Required fields are always included
+    so the response still validates; ``id`` is always returned by Trello. Nested
+    models (a checklist's check items) have their own parameters, not ``fields=``.
+    """
+    aliases = {name: info.alias or name for name, info in model.model_fields.items()}
+    nested = {aliases[n] for n, info in model.model_fields.items() if _is_nested(info.annotation)}
+    if fields is None:
+        wanted = list(aliases.values())
+    else:
+        required = [aliases[n] for n, info in model.model_fields.items() if info.is_required()]
+        wanted = [*required, *(aliases.get(f, f) for f in fields)]
+    return ",".join(dict.fromkeys(f for f in wanted if f != "id" and f not in nested))
+
+
+def field_names(model: type[BaseModel], fields: list[str]) -> set[str]:
+    """Map model or Trello field names to the model's attribute names."""
+    by_alias = {info.alias or name: name for name, info in model.model_fields.items()}
+    return {by_alias.get(f, f) for f in fields} | {"id"}
+
+
+@cache
+def list_adapter[M: BaseModel](model: type[M]) -> TypeAdapter[list[M]]:
+    """Shared validator and serializer for a list of ``model`` (building one is costly)."""
+    return TypeAdapter(list[model])
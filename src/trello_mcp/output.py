@@ -0,0 +1,117 @@
+"""Size budgets for list-returning tool outputs, with continuation handles."""
+
+import secrets
+import time
+from collections import OrderedDict
+
+import pydantic_core
+from pydantic import BaseModel
+
+from trello_mcp.models import (
+    TrelloBoard,
+    TrelloCard,
+    TrelloChecklist,
+    TrelloCustomField,
+    TrelloLabel,
+    TrelloList,
+)
+
+# Fields kept by the "compact" profile when a tool call doesn't ask for specific ones.
+COMPACT_FIELDS: dict[type[BaseModel], list[str]] = {
+    TrelloBoard: ["id", "name", "closed"],
+    TrelloList: ["id", "name", "closed"],
+    TrelloCard: ["id", "name", "id_list", "due", "due_complete", "closed"],
+    TrelloChecklist: ["id", "name", "id_card", "check_items"],
+    TrelloLabel: ["id", "name", "color"],
+    TrelloCustomField: ["id", "name", "type"],
+}
+
+ELLIPSIS = "…"
+
+
+class OutputBudget:
+    """Caps the items and serialized bytes a list tool returns in one response.
+
+    Whatever doesn't fit is held under a continuation handle, announced by a final
+    ``{"continuation": handle, "remaining": n}`` item, and served by ``resume``.
+    Handles only work in the process that issued them, so with ``continuations`` off
+    (several workers) the final item is ``{"continuation": None, "remaining": n}``.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024,
+        max_items: int = 1000,
+        desc_chars: int = 0,
+        compact: bool = False,
+        ttl: float = 600.0,
+        max_pending: int = 100,
+        continuations: bool = True,
+    ):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.desc_chars = desc_chars
+        self.compact = compact
+        self.ttl = ttl
+        self.max_pending = max_pending
+        self.continuations = continuations
+        self._pending: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+
+    def fields(self, model: type[BaseModel], fields: list[str] | None) -> list[str] | None:
+        """The projection to apply: the caller's, else the compact profile if enabled."""
+        if fields is None and self.compact:
+            return COMPACT_FIELDS.get(model)
+        return fields
+
+    def apply(self, items: list[dict]) -> list[dict]:
+        """Return as many ``items`` as fit the budget, plus a continuation item if needed."""
+        if not self.max_bytes:
+            # Only an item cap: no need to serialize anything to measure it.
+            cut = self.max_items if self.max_items and len(items) > self.max_items else len(items)
+            page = self.shorten(items[:cut])
+            return page if cut == len(items) else [*page, self._hold(items[cut:])]
+        page = []
+        used = 2  # the enclosing brackets
+        for i, item in enumerate(items):
+            item = self._shorten(item)
+            size = len(pydantic_core.to_json(item)) + 1
+            full = (self.max_items and len(page) >= self.max_items) or used + size > self.max_bytes
+            if full and page:
+                return [*page, self._hold(items[i:])]
+            page.append(item)
+            used += size
+        return page
+
+    def shorten(self, items: list[dict]) -> list[dict]:
+        """``items`` with long descriptions truncated, for tools that page on their own."""
+        return [self._shorten(item) for item in items] if self.desc_chars else items
+
+    def resume(self, handle: str) -> list[dict]:
+        """The next page of a truncated output. Raises KeyError for unknown handles."""
+        self._expire()
+        _, rest = self._pending.pop(handle)
+        return self.apply(rest)
+
+    def _shorten(self, item: dict) -> dict:
+        desc = item.get("desc")
+        if self.desc_chars and isinstance(desc, str) and len(desc) > self.desc_chars:
+            return {**item, "desc": desc[: self.desc_chars] + ELLIPSIS}
+        return item
+
+    def _hold(self, rest: list[dict]) -> dict:
+        if not self.continuations:
+            return {"continuation": None, "remaining": len(rest)}
+        self._expire()
+        handle = secrets.token_urlsafe(12)
+        self._pending[handle] = (time.monotonic() + self.ttl, rest)
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+        return {"continuation": handle, "remaining": len(rest)}
+
+    def _expire(self):
+        now = time.monotonic()
+        while self._pending:
+            handle, (expires_at, _) = next(iter(self._pending.items()))
+            if expires_at > now:
+                break
+            del self._pending[handle]
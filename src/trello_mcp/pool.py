@@ -0,0 +1,60 @@
+"""Per-credential Trello clients for serving many users from one process."""
+
+from collections import OrderedDict
+
+import httpx
+
+from trello_mcp.client import TrelloClient, make_http_client, tenant_id, warm_up_connection
+from trello_mcp.ratelimit import RateLimiter
+
+
+class ClientPool:
+    """An LRU pool of TrelloClients, one per API key and token.
+
+    The clients share one connection pool, rate limiter, response cache, retry policy,
+    circuit breaker and metrics. Rate-limit buckets are keyed by key and by token, and
+    cache entries are namespaced by credentials, so tenants keep separate quotas and
+    never see each other's cached responses. Evicted clients hold no resources of
+    their own, so eviction just drops them.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.trello.com/1",
+        max_clients: int = 256,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        http2: bool = False,
+        **shared,
+    ):
+        self.base_url = base_url
+        self.max_clients = max_clients
+        self.http = make_http_client(base_url, limits, timeout, http2)
+        shared.setdefault("rate_limiter", RateLimiter())
+        self._shared = shared
+        self._clients: OrderedDict[str, TrelloClient] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, api_key: str, token: str) -> TrelloClient:
+        """The client for these credentials, created on first use."""
+        tenant = tenant_id(api_key, token)
+        client = self._clients.get(tenant)
+        if client is not None:
+            self._clients.move_to_end(tenant)
+            return client
+        client = self._clients[tenant] = TrelloClient(
+            api_key, token, self.base_url, http=self.http, **self._shared
+        )
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    async def warm_up(self):
+        """Open a pooled connection ahead of the first request; see warm_up_connection."""
+        await warm_up_connection(self.http)
+
+    async def close(self):
+        self._clients.clear()
+        await self.http.aclose()
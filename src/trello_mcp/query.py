@@ -0,0 +1,112 @@
+"""Filtering, sorting and grouping of a board's cards on the server."""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Literal
+
+from trello_mcp.index import normalize
+from trello_mcp.models import TrelloCard
+
+SortKey = Literal["id", "name", "due", "list"]
+GroupKey = Literal["list", "label"]
+
+
+class CardIndex:
+    """A board's cards with secondary indexes on list, label and due date."""
+
+    def __init__(self, cards: Iterable[TrelloCard]):
+        self._cards: dict[str, TrelloCard] = {}
+        self._by_list: dict[str, set[str]] = {}
+        self._by_label: dict[str, set[str]] = {}
+        self._text: dict[str, str] = {}
+        dues = []
+        for card in cards:
+            self._cards[card.id] = card
+            self._by_list.setdefault(card.id_list, set()).add(card.id)
+            for label in card.labels:
+                self._by_label.setdefault(label.get("id", ""), set()).add(card.id)
+            if card.due:
+                dues.append((card.due, card.id))
+            self._text[card.id] = normalize(f"{card.name}\n{card.desc}")
+        dues.sort()
+        self._dues = [due for due, _ in dues]
+        self._due_ids = [card_id for _, card_id in dues]
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def _due_between(self, after: str | None, before: str | None) -> set[str]:
+        lo = bisect_left(self._dues, after) if after else 0
+        hi = bisect_left(self._dues, before) if before else len(self._dues)
+        return set(self._due_ids[lo:hi])
+
+    def query(
+        self,
+        *,
+        list_ids: list[str] | None = None,
+        label_ids: list[str] | None = None,
+        due_after: str | None = None,
+        due_before: str | None = None,
+        due_complete: bool | None = None,
+        closed: bool | None = False,
+        text: str | None = None,
+    ) -> list[TrelloCard]:
+        """Cards matching every given filter, in no particular order.
+
+        ``list_ids`` and ``label_ids`` match any of the ids. The due range is
+        ``due_after <= due < due_before`` on ISO 8601 strings, so plain dates work.
+        """
+        candidates: set[str] | None = None
+        narrowing = []
+        if list_ids is not None:
+            narrowing.append(set().union(*(self._by_list.get(i, ()) for i in list_ids)))
+        if label_ids is not None:
+            narrowing.append(set().union(*(self._by_label.get(i, ()) for i in label_ids)))
+        if due_after or due_before:
+            narrowing.append(self._due_between(due_after, due_before))
+        for ids in sorted(narrowing, key=len):
+            candidates = ids if candidates is None else candidates & ids
+        needle = normalize(text) if text else None
+        matches = []
+        for card_id in self._cards if candidates is None else candidates:
+            card = self._cards[card_id]
+            if closed is not None and card.closed != closed:
+                continue
+            if due_complete is not None and card.due_complete != due_complete:
+                continue
+            if needle is not None and needle not in self._text[card_id]:
+                continue
+            matches.append(card)
+        return matches
+
+
+def sort_cards(
+    cards: list[TrelloCard], sort_by: SortKey = "id", descending: bool = False
+) -> list[TrelloCard]:
+    """Sort ``cards``; cards without a due date sort last either way when sorting by due."""
+    if sort_by == "due":
+        dated = sorted((c for c in cards if c.due), key=lambda c: c.due, reverse=descending)
+        return dated + [c for c in cards if not c.due]
+    keys = {
+        "id": lambda c: c.id,
+        "name": lambda c: normalize(c.name),
+        "list": lambda c: (c.id_list, c.id),
+    }
+    return sorted(cards, key=keys[sort_by], reverse=descending)
+
+
+def group_cards(cards: list[TrelloCard], group_by: GroupKey) -> dict[str, list[TrelloCard]]:
+    """Group ``cards`` by list id or label id, keeping their order within each group.
+
+    A card with several labels appears in each of their groups; unlabeled cards are
+    grouped under ``""``.
+    """
+    groups: dict[str, list[TrelloCard]] = {}
+    for card in cards:
+        if group_by == "list":
+            keys = [card.id_list]
+        else:
+            keys = [label.get("id", "") for label in card.labels] or [""]
+        for key in keys:
+            groups.setdefault(key, []).append(card)
+    return groups
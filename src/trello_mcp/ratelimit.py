@@ -0,0 +1,236 @@
+"""Client-side rate limiting for the Trello API."""
+
+import asyncio
+import hashlib
+import random
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+# Trello quotas: 300 requests per 10s per API key, 100 requests per 10s per token.
+KEY_LIMIT = 300
+TOKEN_LIMIT = 100
+INTERVAL_S = 10.0
+
+
+class TokenBucket:
+    """A token bucket that refills continuously up to its capacity."""
+
+    def __init__(
+        self, capacity: int, interval: float, clock: Callable[[], float] = time.monotonic
+    ):
+        self.capacity = capacity
+        self.interval = interval
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.interval
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return seconds until one is."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self):
+        """Wait for a token. Waiters are served in FIFO order."""
+        async with self._lock:
+            while (delay := self.try_acquire()) > 0:
+                await asyncio.sleep(delay)
+
+    def sync(self, limit: int | None, remaining: int | None, interval_ms: int | None):
+        """Align the bucket with the quota the server reports."""
+        self._refill()
+        if limit:
+            self.capacity = limit
+        if interval_ms:
+            self.interval = interval_ms / 1000
+        if remaining is not None:
+            self._tokens = min(self._tokens, float(remaining))
+
+    def drain(self):
+        """Empty the bucket, e.g. after the server rejected a request with 429."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+class SharedTokenBucket(TokenBucket):
+    """A token bucket stored in SQLite so several processes draw from one quota.
+
+    Each operation runs in an immediate transaction that loads the shared state,
+    applies the in-memory bucket logic and writes the result back. Wall-clock time
+    is used since monotonic clocks aren't comparable across processes.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        name: str,
+        capacity: int,
+        interval: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(capacity, interval, clock)
+        self.name = name
+        self._db = db
+        db.execute(
+            "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?, ?, ?)",
+            (name, float(capacity), self._updated, capacity, interval),
+        )
+
+    def _shared[T](self, op: Callable[[], T]) -> T:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._tokens, self._updated, self.capacity, self.interval = self._db.execute(
+                "SELECT tokens, updated, capacity, interval FROM buckets WHERE name = ?",
+                (self.name,),
+            ).fetchone()
+            result = op()
+            self._db.execute(
+                "UPDATE buckets SET tokens = ?, updated = ?, capacity = ?, interval = ? "
+                "WHERE name = ?",
+                (self._tokens, self._updated, self.capacity, self.interval, self.name),
+            )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        return result
+
+    @property
+    def available(self) -> float:
+        return self._shared(lambda: TokenBucket.available.fget(self))
+
+    def try_acquire(self) -> float:
+        return self._shared(super().try_acquire)
+
+    def sync(self, limit: int | None, remaining: int | None, interval_ms: int | None):
+        self._shared(lambda: TokenBucket.sync(self, limit, remaining, interval_ms))
+
+    def drain(self):
+        self._shared(super().drain)
+
+
+def open_shared_state(path: str):
+    """Open (creating if needed) the SQLite file that holds shared token buckets."""
+    import sqlite3  # deferred: only multi-process deployments share buckets
+
+    db = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(
+        """CREATE TABLE IF NOT EXISTS buckets (
+            name TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated REAL NOT NULL,
+            capacity INTEGER NOT NULL,
+            interval REAL NOT NULL
+        )"""
+    )
+    return db
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token buckets keyed by API key and by token, shared by every client that uses them."""
+
+    def __init__(
+        self,
+        key_limit: int = KEY_LIMIT,
+        token_limit: int = TOKEN_LIMIT,
+        interval: float = INTERVAL_S,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        shared_path: str | None = None,
+    ):
+        self.key_limit = key_limit
+        self.token_limit = token_limit
+        self.interval = interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._key_buckets: dict[str, TokenBucket] = {}
+        self._token_buckets: dict[str, TokenBucket] = {}
+        # With a shared path, buckets live in SQLite and are shared by every process
+        # (e.g. HTTP workers) that opens the same file.
+        self._shared = open_shared_state(shared_path) if shared_path else None
+
+    def _bucket(self, scope: str, secret: str, capacity: int) -> TokenBucket:
+        if self._shared is None:
+            return TokenBucket(capacity, self.interval)
+        name = f"{scope}:{hashlib.sha256(secret.encode()).hexdigest()[:16]}"
+        return SharedTokenBucket(self._shared, name, capacity, self.interval)
+
+    def buckets(self, api_key: str, token: str) -> tuple[TokenBucket, TokenBucket]:
+        """Return the (key, token) bucket pair, creating them on first use."""
+        key_bucket = self._key_buckets.get(api_key)
+        if key_bucket is None:
+            key_bucket = self._key_buckets[api_key] = self._bucket("key", api_key, self.key_limit)
+        token_bucket = self._token_buckets.get(token)
+        if token_bucket is None:
+            token_bucket = self._token_buckets[token] = self._bucket(
+                "token", token, self.token_limit
+            )
+        return key_bucket, token_bucket
+
+    async def acquire(self, api_key: str, token: str):
+        """Wait until both the key and the token quota allow another request."""
+        key_bucket, token_bucket = self.buckets(api_key, token)
+        await token_bucket.acquire()
+        await key_bucket.acquire()
+
+    def observe(self, api_key: str, token: str, headers: Mapping[str, str]):
+        """Update the buckets from Trello's ``x-rate-limit-*`` response headers."""
+        key_bucket, token_bucket = self.buckets(api_key, token)
+        for scope, bucket in (("api-key", key_bucket), ("api-token", token_bucket)):
+            prefix = f"x-rate-limit-{scope}"
+            remaining = _int_header(headers, f"{prefix}-remaining")
+            limit = _int_header(headers, f"{prefix}-max")
+            if remaining is None and limit is None:
+                continue
+            bucket.sync(limit, remaining, _int_header(headers, f"{prefix}-interval-ms"))
+
+    def throttled(self, api_key: str, token: str, body: str = ""):
+        """Record a 429 so queued requests wait for the quota to refill."""
+        key_bucket, token_bucket = self.buckets(api_key, token)
+        if "API_KEY_LIMIT" in body:
+            key_bucket.drain()
+        else:
+            token_bucket.drain()
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before retry ``attempt`` (0-based), with full jitter.
+
+        A ``Retry-After`` value is honoured up to ``backoff_cap``.
+        """
+        if retry_after is not None:
+            try:
+                return min(self.backoff_cap, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        ceiling = min(self.backoff_cap, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
@@ -0,0 +1,104 @@
+"""Retries for transient Trello failures and a circuit breaker for outages."""
+
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+# Methods that can be repeated without changing the outcome.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Errors raised before a request reached the server, so even a POST can be resent.
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which failed requests to resend, and how long to wait in between.
+
+    Idempotent requests are retried on transport errors and 5xx gateway statuses.
+    Other methods (POSTs such as ``create_card`` or ``add_comment``) are retried only
+    when the request never left this process, since Trello may already have applied it.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 10.0
+    statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+
+    def retries_error(self, method: str, exc: Exception) -> bool:
+        if isinstance(exc, UNSENT_ERRORS):
+            return True
+        return method in IDEMPOTENT_METHODS and isinstance(exc, httpx.TransportError)
+
+    def retries_status(self, method: str, status: int) -> bool:
+        return method in IDEMPOTENT_METHODS and status in self.statuses
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before retry ``attempt`` (0-based), with full jitter."""
+        if retry_after is not None and retry_after.isdigit():
+            return min(self.backoff_cap, float(retry_after))
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(
+            f"Trello API at {host} is failing; requests are paused for {retry_in:.0f}s"
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker, shared by every client that uses it.
+
+    After ``failure_threshold`` consecutive failures (transport errors or 5xx) a host's
+    circuit opens and requests fail fast. Once ``reset_timeout`` has passed one request
+    is let through as a probe; its success closes the circuit, a failure reopens it.
+    A threshold of 0 disables the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+
+    def is_open(self, host: str) -> bool:
+        opened_at = self._opened_at.get(host)
+        return opened_at is not None and self._clock() - opened_at < self.reset_timeout
+
+    def check(self, host: str):
+        """Raise CircuitOpenError if ``host``'s circuit is open; otherwise allow the request."""
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return
+        now = self._clock()
+        retry_in = opened_at + self.reset_timeout - now
+        if retry_in > 0:
+            raise CircuitOpenError(host, retry_in)
+        # Let this request probe the host; others keep failing fast until it reports back
+        # (or, if it never does, until the next timeout lets another probe through).
+        self._opened_at[host] = now
+
+    def success(self, host: str):
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+
+    def failure(self, host: str):
+        if not self.failure_threshold:
+            return
+        failures = self._failures[host] = self._failures.get(host, 0) + 1
+        if failures >= self.failure_threshold:
+            self._opened_at[host] = self._clock()
@@ -0,0 +1,158 @@
+"""Ranked full-text search over the cards of a board."""
+
+import math
+import time
+from collections import Counter, OrderedDict
+
+from pydantic import BaseModel
+
+from trello_mcp.client import TrelloClient
+from trello_mcp.index import tokenize
+from trello_mcp.models import TrelloCard
+
+# Card names are short and descriptive, so their words count more than body text.
+NAME_WEIGHT = 2
+
+# Board indexes kept per CardSearch, least recently used dropped first.
+MAX_INDEXES = 16
+
+
+class CardSearchIndex:
+    """A BM25-ranked inverted index over card names, descriptions and comments.
+
+    Archived cards are not indexed.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.built_at = time.monotonic()
+        self._cards: dict[str, TrelloCard] = {}
+        self._comments: dict[str, list[str]] = {}
+        self._terms: dict[str, Counter[str]] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._cards
+
+    def put(self, card: TrelloCard):
+        """Index ``card``, replacing any previous version of it."""
+        self._unindex(card.id)
+        if card.closed:
+            self._cards.pop(card.id, None)
+            return
+        self._cards[card.id] = card
+        self._index(card.id)
+
+    def remove(self, card_id: str):
+        self._unindex(card_id)
+        self._cards.pop(card_id, None)
+        self._comments.pop(card_id, None)
+
+    def add_comment(self, card_id: str, text: str):
+        self._comments.setdefault(card_id, []).append(text)
+        if card_id in self._cards:
+            self._unindex(card_id)
+            self._index(card_id)
+
+    def _index(self, card_id: str):
+        card = self._cards[card_id]
+        terms = Counter(tokenize(card.name))
+        for token in terms:
+            terms[token] *= NAME_WEIGHT
+        terms.update(tokenize(card.desc))
+        for comment in self._comments.get(card_id, ()):
+            terms.update(tokenize(comment))
+        self._terms[card_id] = terms
+        self._total_length += terms.total()
+        for token, tf in terms.items():
+            self._postings.setdefault(token, {})[card_id] = tf
+
+    def _unindex(self, card_id: str):
+        terms = self._terms.pop(card_id, None)
+        if terms is None:
+            return
+        self._total_length -= terms.total()
+        for token in terms:
+            docs = self._postings[token]
+            del docs[card_id]
+            if not docs:
+                del self._postings[token]
+
+    def search(self, query: str, limit: int | None = 20) -> list[tuple[TrelloCard, float]]:
+        """Cards containing any word of ``query``, best BM25 score first."""
+        if not self._terms:
+            return []
+        n = len(self._terms)
+        avg_length = self._total_length / n
+        scores: dict[str, float] = {}
+        for token in set(tokenize(query)):
+            docs = self._postings.get(token)
+            if not docs:
+                continue
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for card_id, tf in docs.items():
+                length = self._terms[card_id].total()
+                norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[card_id] = scores.get(card_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = sorted(scores, key=lambda cid: (-scores[cid], cid))[:limit]
+        return [(self._cards[cid], scores[cid]) for cid in ranked]
+
+
+class CardSearch:
+    """Per-board card search indexes, built on first use and kept current by writes.
+
+    At most ``max_indexes`` boards are kept, and indexes past ``max_age`` are dropped.
+    """
+
+    def __init__(self, max_age: float = 300.0, max_indexes: int = MAX_INDEXES):
+        self.max_age = max_age
+        self.max_indexes = max_indexes
+        self._indexes: OrderedDict[str, CardSearchIndex] = OrderedDict()
+
+    def __contains__(self, board_id: object) -> bool:
+        return board_id in self._indexes
+
+    async def get(self, client: TrelloClient, board_id: str) -> CardSearchIndex:
+        """The index for ``board_id``, rebuilt when missing or older than ``max_age``.
+
+        Rebuilding picks up changes made outside this server.
+        """
+        now = time.monotonic()
+        for expired in [b for b, i in self._indexes.items() if now - i.built_at > self.max_age]:
+            del self._indexes[expired]
+        index = self._indexes.get(board_id)
+        if index is not None:
+            self._indexes.move_to_end(board_id)
+        else:
+            index = CardSearchIndex()
+            for action in reversed(await client.get_board_comments(board_id)):
+                data = action.get("data", {})
+                index.add_comment(data.get("card", {}).get("id", ""), data.get("text", ""))
+            for card in await client.get_board_cards(board_id):
+                index.put(card)
+            self._indexes[board_id] = index
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        return index
+
+    def observe(self, obj: BaseModel):
+        """Reflect a card returned by one of this server's writes."""
+        if not isinstance(obj, TrelloCard):
+            return
+        for board_id, index in self._indexes.items():
+            if board_id == obj.id_board or (not obj.id_board and obj.id in index):
+                index.put(obj)
+            elif obj.id in index:
+                index.remove(obj.id)  # moved to another board
+
+    def comment(self, action: dict):
+        """Index a comment action returned by ``add_comment``."""
+        data = action.get("data", {})
+        index = self._indexes.get(data.get("board", {}).get("id", ""))
+        if index is not None:
+            index.add_comment(data.get("card", {}).get("id", ""), data.get("text", ""))
@@ -1,13 +1,92 @@
 """FastMCP server exposing Trello operations as tools."""
 
-from importlib import resources as pkg_resources
-
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from weakref import WeakKeyDictionary
+
+import httpx
 from fastmcp import FastMCP
-
-from trello_mcp.client import TrelloClient
-from trello_mcp.models import Settings
-
-mcp = FastMCP("Trello MCP Server")
+from fastmcp.exceptions import ResourceError, ToolError
+from fastmcp.resources import TextResource
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from pydantic import BaseModel
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+
+from trello_mcp.bulk import run_bulk
+from trello_mcp.cache import MemoryCache, ResponseCache, SqliteCache
+from trello_mcp.client import CARD_PAGE_LIMIT, TrelloClient
+from trello_mcp.docs import load_doc
+from trello_mcp.metrics import CONTENT_TYPE, Metrics
+from trello_mcp.mirror import BoardMirror, MirrorRegistry, verify_signature
+from trello_mcp.models import (
+    CardUpdate,
+    ServerSettings,
+    Settings,
+    TrelloCard,
+    field_names,
+    list_adapter,
+)
+from trello_mcp.output import OutputBudget
+from trello_mcp.pool import ClientPool
+from trello_mcp.query import GroupKey, SortKey, group_cards, sort_cards
+from trello_mcp.ratelimit import RateLimiter
+from trello_mcp.resilience import CircuitBreaker, RetryPolicy
+from trello_mcp.search import CardSearch
+from trello_mcp.writes import WriteQueue
+
+# True while the lifespan runs: set at startup, cleared by its shutdown step, which
+# uvicorn reaches only after in-flight requests have drained. Reported by /readyz.
+_ready = False
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm the Trello connection pool in the background while the server starts.
+
+    On shutdown, queued card updates are sent before the server exits.
+    """
+    global _ready
+    warm_up = None
+    if get_settings().trello_warm_up:
+        warm_up = asyncio.create_task(get_pool().warm_up())
+    _ready = True
+    try:
+        yield
+    finally:
+        _ready = False
+        if warm_up is not None:
+            warm_up.cancel()
+        if _writes is not None:
+            await _writes.flush()
+
+
+mcp = FastMCP("Trello MCP Server", lifespan=_lifespan)
+
+# Shared by the tool middleware and the Trello client.
+_metrics = Metrics()
+
+
+class _ToolMetrics(Middleware):
+    """Times every tool call, counting calls that raise as errors."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext):
+        started = time.perf_counter()
+        error = True
+        try:
+            result = await call_next(context)
+            error = False
+            return result
+        finally:
+            _metrics.observe_tool(context.message.name, time.perf_counter() - started, error)
+
+
+mcp.add_middleware(_ToolMetrics())
 
 # --- Resources: Trello API documentation ---
 
@@ -23,99 +102,359 @@ _RESOURCES = {
 }
 
 
-def _load_resource(name: str) -> str:
-    filename = name.replace("-", "_")
-    ref = pkg_resources.files("trello_mcp").joinpath(f"resources/{filename}.md")
-    return ref.read_text(encoding="utf-8")
-
-
 def _register_resources():
-    from fastmcp.resources.resource import FunctionResource
+    """Register each document with its content preloaded and hashed.
 
+    ``meta.sha256`` lets clients skip re-reading a document they already have, and
+    ``meta.sections`` lists the section slugs accepted by the section template.
+    """
     for slug, desc in _RESOURCES.items():
-
-        def _reader(s=slug) -> str:
-            return _load_resource(s)
-
-        resource = FunctionResource(
+        doc = load_doc(slug)
+        resource = TextResource(
             uri=f"trello://docs/{slug}",
             name=slug,
             description=desc,
             mime_type="text/markdown",
-            fn=_reader,
+            text=doc.text,
+            meta={"sha256": doc.sha256, "sections": list(doc.sections)},
         )
         mcp.add_resource(resource)
 
 
+@mcp.resource(
+    "trello://docs/{slug}#{section}",
+    name="doc-section",
+    description="One section of a docs page, e.g. trello://docs/rate-limits#error-responses",
+    mime_type="text/markdown",
+)
+def _doc_section(slug: str, section: str) -> str:
+    if slug not in _RESOURCES:
+        raise ResourceError(f"Unknown document {slug!r}")
+    sections = load_doc(slug).sections
+    if section not in sections:
+        raise ResourceError(f"Unknown section {section!r}; available: {', '.join(sections)}")
+    return sections[section]
+
+
 _register_resources()
 
 
+_settings: Settings | None = None
 _client: TrelloClient | None = None
 
 
+def get_settings() -> Settings:
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+# Headers a client sends to use its own Trello credentials instead of the server's.
+KEY_HEADER = "x-trello-key"
+TOKEN_HEADER = "x-trello-token"
+
+_pool: ClientPool | None = None
+# Search indexes of clients from the pool, dropped along with their client.
+_tenant_searches: WeakKeyDictionary[TrelloClient, CardSearch] = WeakKeyDictionary()
+
+
+def get_pool() -> ClientPool:
+    """The clients for every set of credentials, sharing one connection pool and limiter."""
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = ClientPool(
+            base_url=settings.trello_base_url,
+            max_clients=settings.trello_max_clients,
+            limits=httpx.Limits(
+                max_connections=settings.trello_http_max_connections,
+                max_keepalive_connections=settings.trello_http_max_keepalive,
+                keepalive_expiry=settings.trello_http_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.trello_connect_timeout,
+                read=settings.trello_read_timeout,
+                write=settings.trello_write_timeout,
+                pool=settings.trello_pool_timeout,
+            ),
+            http2=settings.trello_http2,
+            cache=_make_cache(settings),
+            rate_limiter=RateLimiter(shared_path=settings.trello_rate_limit_path),
+            metrics=_metrics,
+            retry=RetryPolicy(
+                max_retries=settings.trello_max_retries,
+                backoff_base=settings.trello_retry_backoff,
+            ),
+            breaker=CircuitBreaker(
+                failure_threshold=settings.trello_breaker_threshold,
+                reset_timeout=settings.trello_breaker_reset,
+            ),
+        )
+    return _pool
+
+
+def _tenant_credentials() -> tuple[str, str] | None:
+    """The (key, token) sent with the current HTTP request, if it brought its own token."""
+    headers = get_http_headers()
+    token = headers.get(TOKEN_HEADER)
+    if not token:
+        return None
+    api_key = headers.get(KEY_HEADER) or get_settings().trello_api_key
+    if not api_key:
+        raise ToolError("X-Trello-Token needs X-Trello-Key, or TRELLO_API_KEY on the server")
+    return api_key, token
+
+
 def get_client() -> TrelloClient:
+    """The client for the request's own credentials, else the server's configured ones."""
+    credentials = _tenant_credentials()
+    if credentials is not None:
+        return get_pool().get(*credentials)
     global _client
     if _client is None:
-        settings = Settings()
-        _client = TrelloClient(
-            api_key=settings.trello_api_key,
-            token=settings.trello_token,
-            base_url=settings.trello_base_url,
-        )
+        settings = get_settings()
+        if not settings.trello_api_key or not settings.trello_token:
+            raise ToolError(
+                "No Trello credentials: set TRELLO_API_KEY and TRELLO_TOKEN, "
+                "or send X-Trello-Key and X-Trello-Token headers"
+            )
+        _client = get_pool().get(settings.trello_api_key, settings.trello_token)
     return _client
 
 
+def _card_search_for(client: TrelloClient) -> CardSearch:
+    if client is _client:
+        return _card_search
+    return _tenant_searches.setdefault(client, CardSearch())
+
+
+def _make_cache(settings: Settings) -> ResponseCache | None:
+    if not settings.trello_cache_max_bytes:
+        return None
+    if settings.trello_cache_path:
+        return SqliteCache(settings.trello_cache_path, settings.trello_cache_max_bytes)
+    if settings.trello_workers > 1:
+        # A per-process cache would miss other workers' invalidations.
+        return None
+    return MemoryCache(settings.trello_cache_max_bytes)
+
+
 def set_client(client: TrelloClient):
     """Inject a client instance (for testing)."""
     global _client
     _client = client
 
 
+_output: OutputBudget | None = None
+
+
+def get_output() -> OutputBudget:
+    """The response budget for list tools, configured from ServerSettings."""
+    global _output
+    if _output is None:
+        settings = _settings or ServerSettings()
+        _output = OutputBudget(
+            max_bytes=settings.trello_output_max_bytes,
+            max_items=settings.trello_output_max_items,
+            desc_chars=settings.trello_output_desc_chars,
+            compact=settings.trello_output_profile == "compact",
+            continuations=settings.trello_workers <= 1,
+        )
+    return _output
+
+
+def _dump(models: list[BaseModel], fields: list[str] | None = None) -> list[dict]:
+    """Dump ``models`` in one serializer pass, keeping only the requested fields.
+
+    Without ``fields``, the compact profile applies when it is enabled.
+    """
+    if not models:
+        return []
+    model = type(models[0])
+    fields = get_output().fields(model, fields)
+    include = None if fields is None else {"__all__": field_names(model, fields)}
+    return list_adapter(model).dump_python(models, include=include)
+
+
+# --- Board mirrors ---
+
+WEBHOOK_PATH = "/webhooks/trello"
+
+_mirrors = MirrorRegistry()
+_card_search = CardSearch()
+
+
+async def _mirror(board_id: str | None) -> BoardMirror | None:
+    """The up-to-date mirror of ``board_id``, or None if the board isn't mirrored.
+
+    Mirrors are read with the server's credentials, so requests bringing their own
+    never use them.
+    """
+    if board_id is None or board_id not in _mirrors or _tenant_credentials() is not None:
+        return None
+    return await _mirrors.get(get_client(), board_id)
+
+
+def _observe[M: BaseModel](model: M) -> M:
+    """Reflect a write's result in board mirrors and search indexes."""
+    _mirrors.observe(model)
+    _card_search_for(get_client()).observe(model)
+    return model
+
+
+@mcp.custom_route(WEBHOOK_PATH, methods=["HEAD", "POST"])
+async def trello_webhook(request: Request) -> Response:
+    """Receive Trello webhook deliveries for mirrored boards."""
+    if request.method == "HEAD":
+        return Response()  # Trello probes the callback URL when a webhook is created
+    body = await request.body()
+    settings = get_settings()
+    if not settings.trello_api_secret or not verify_signature(
+        settings.trello_api_secret,
+        body,
+        settings.trello_webhook_url or "",
+        request.headers.get("x-trello-webhook", ""),
+    ):
+        return Response(status_code=401)
+    try:
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("payload is not an object")
+        _mirrors.handle(payload)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return Response(status_code=400)
+    return Response()
+
+
+@mcp.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> Response:
+    """Liveness: the process is up and serving requests."""
+    return JSONResponse({"status": "ok"})
+
+
+@mcp.custom_route("/readyz", methods=["GET"])
+async def readyz(request: Request) -> Response:
+    """Readiness: the server has finished starting and can take new sessions."""
+    if not _ready:
+        return JSONResponse({"status": "unavailable"}, status_code=503)
+    return JSONResponse({"status": "ready"})
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus metrics for this process (each HTTP worker reports its own)."""
+    return PlainTextResponse(_metrics.render(), media_type=CONTENT_TYPE)
+
+
+def create_http_app() -> Starlette:
+    """The streamable HTTP app, for ``uvicorn --factory`` and multi-worker runs.
+
+    Sessions are stateless so any worker can serve any request.
+    """
+    return mcp.http_app(transport="http", stateless_http=True)
+
+
+def _require_server_credentials():
+    # Mirrors are shared by every caller, so only the server's own credentials manage them.
+    if _tenant_credentials() is not None:
+        raise ToolError("Board mirrors are managed with the server's own Trello credentials")
+
+
+@mcp.tool()
+async def mirror_board(board_id: str) -> dict:
+    """Keep a live local copy of a board so its reads no longer call the Trello API.
+
+    The copy is updated by Trello webhooks, so the server must run over HTTP or SSE
+    in a single process, be reachable at TRELLO_WEBHOOK_URL and have TRELLO_API_SECRET
+    to verify deliveries.
+    """
+    callback_url = get_settings().trello_webhook_url
+    if not callback_url:
+        raise ToolError("Board mirroring needs TRELLO_WEBHOOK_URL to be configured")
+    if not get_settings().trello_api_secret:
+        raise ToolError("Board mirroring needs TRELLO_API_SECRET to verify webhook deliveries")
+    if get_settings().trello_workers > 1:
+        raise ToolError("Board mirroring isn't available with more than one worker")
+    _require_server_credentials()
+    mirror = await _mirrors.track(get_client(), board_id, callback_url)
+    return {"board_id": board_id, "lists": len(mirror.lists()), "cards": len(mirror.cards())}
+
+
+@mcp.tool()
+async def unmirror_board(board_id: str) -> dict:
+    """Stop mirroring a board and remove its webhook."""
+    _require_server_credentials()
+    await _mirrors.untrack(get_client(), board_id)
+    return {"removed": True}
+
+
 # --- Board tools ---
 
 
 @mcp.tool()
-async def list_boards() -> list[dict]:
-    """List all boards for the authenticated Trello user."""
-    boards = await get_client().list_boards()
-    return [b.model_dump() for b in boards]
+async def list_boards(fields: list[str] | None = None) -> list[dict]:
+    """List all boards for the authenticated Trello user.
+
+    Pass `fields` (e.g. ['name', 'url']) to fetch and return only those fields.
+    """
+    boards = await get_client().list_boards(fields=fields)
+    return get_output().apply(_dump(boards, fields))
 
 
 @mcp.tool()
 async def search_board(query: str) -> list[dict]:
-    """Find a board by name substring."""
+    """Find boards by name, best match first. Matches word prefixes and tolerates typos."""
     boards = await get_client().search_board(query)
-    return [b.model_dump() for b in boards]
+    return get_output().apply(_dump(boards))
+
+
+@mcp.tool()
+async def get_board_snapshot(board_id: str) -> dict:
+    """Get a board with its open lists and cards, labels, checklists and custom fields.
+
+    One API call instead of one per resource; prefer it when you need the whole board.
+    """
+    mirror = await _mirror(board_id)
+    if mirror is not None:
+        snapshot = mirror.snapshot().model_dump()
+    else:
+        snapshot = (await get_client().get_board_snapshot(board_id)).model_dump()
+    return {**snapshot, "cards": get_output().shorten(snapshot["cards"])}
 
 
 # --- List tools ---
 
 
 @mcp.tool()
-async def list_lists(board_id: str) -> list[dict]:
-    """List all lists in a Trello board."""
-    lists = await get_client().list_lists(board_id)
-    return [lst.model_dump() for lst in lists]
+async def list_lists(board_id: str, fields: list[str] | None = None) -> list[dict]:
+    """List all lists in a Trello board. `fields` limits the fields returned."""
+    mirror = await _mirror(board_id)
+    if mirror is not None:
+        lists = mirror.lists()
+    else:
+        lists = await get_client().list_lists(board_id, fields=fields)
+    return get_output().apply(_dump(lists, fields))
 
 
 @mcp.tool()
 async def create_list(board_id: str, name: str) -> dict:
     """Create a new list on a Trello board."""
-    lst = await get_client().create_list(board_id, name)
+    lst = _observe(await get_client().create_list(board_id, name))
     return lst.model_dump()
 
 
 @mcp.tool()
 async def update_list(list_id: str, name: str | None = None, closed: bool | None = None) -> dict:
     """Update a list's name and/or closed status."""
-    lst = await get_client().update_list(list_id, name=name, closed=closed)
+    lst = _observe(await get_client().update_list(list_id, name=name, closed=closed))
     return lst.model_dump()
 
 
 @mcp.tool()
 async def archive_list(list_id: str) -> dict:
     """Archive (close) a Trello list."""
-    lst = await get_client().archive_list(list_id)
+    lst = _observe(await get_client().archive_list(list_id))
     return lst.model_dump()
 
 
@@ -123,50 +462,149 @@ async def archive_list(list_id: str) -> dict:
 
 
 @mcp.tool()
-async def list_cards(list_id: str) -> list[dict]:
-    """List all cards in a Trello list."""
-    cards = await get_client().list_cards(list_id)
-    return [c.model_dump() for c in cards]
+async def list_cards(list_id: str, fields: list[str] | None = None) -> list[dict]:
+    """List all cards in a Trello list. `fields` (e.g. ['name', 'due']) limits the fields."""
+    mirror = await _mirror(_mirrors.board_for_list(list_id))
+    if mirror is not None:
+        cards = mirror.cards(list_id)
+    else:
+        cards = await get_client().list_cards(list_id, fields=fields)
+    return get_output().apply(_dump(cards, fields))
 
 
 @mcp.tool()
-async def get_board_cards(board_id: str) -> list[dict]:
-    """Get all cards on a Trello board."""
-    cards = await get_client().get_board_cards(board_id)
-    return [c.model_dump() for c in cards]
+async def get_board_cards(board_id: str, fields: list[str] | None = None) -> list[dict]:
+    """Get all cards on a Trello board. `fields` (e.g. ['name', 'id_list']) limits the fields."""
+    mirror = await _mirror(board_id)
+    if mirror is not None:
+        cards = mirror.cards()
+    else:
+        cards = await get_client().get_board_cards(board_id, fields=fields)
+    return get_output().apply(_dump(cards, fields))
+
+
+@mcp.tool()
+async def get_board_cards_page(
+    board_id: str, cursor: str | None = None, limit: int = 100, fields: list[str] | None = None
+) -> dict:
+    """Get one page of a board's cards, newest first. Prefer this on very large boards.
+
+    Pass the returned `next_cursor` back as `cursor` to get the following page; it is
+    null on the last page. `limit` is at most 1000.
+    """
+    limit = max(1, min(limit, CARD_PAGE_LIMIT))
+    cards = await get_client().get_board_cards_page(
+        board_id, limit=limit, before=cursor, fields=fields
+    )
+    next_cursor = min(c.id for c in cards) if len(cards) == limit else None
+    return {"cards": get_output().shorten(_dump(cards, fields)), "next_cursor": next_cursor}
+
+
+@mcp.tool()
+async def query_cards(
+    board_id: str,
+    list_ids: list[str] | None = None,
+    label_ids: list[str] | None = None,
+    due_after: str | None = None,
+    due_before: str | None = None,
+    due_complete: bool | None = None,
+    closed: bool | None = False,
+    text: str | None = None,
+    sort_by: SortKey = "id",
+    descending: bool = False,
+    group_by: GroupKey | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    fields: list[str] | None = None,
+) -> dict:
+    """Filter, sort and group a board's cards on the server instead of fetching them all.
+
+    Filters combine with AND: `list_ids`/`label_ids` match any of the ids, `due_after`
+    <= due < `due_before` (ISO dates), `text` is a case-insensitive match on name or
+    description. `closed` is false by default; pass null for open and archived cards.
+    `sort_by` is id (oldest first), name, due or list. `limit`/`offset` page through
+    the sorted matches; `group_by` (list or label) then groups that page by id.
+    Returns `total` matches and `cards`, or `groups` when grouping.
+    """
+    mirror = await _mirror(board_id) if closed is False else None
+    if mirror is not None:
+        index = mirror.card_index()
+    else:
+        index = await get_client().get_board_card_index(board_id, closed=closed is not False)
+    matches = index.query(
+        list_ids=list_ids,
+        label_ids=label_ids,
+        due_after=due_after,
+        due_before=due_before,
+        due_complete=due_complete,
+        closed=closed,
+        text=text,
+    )
+    offset = max(0, offset)
+    page = sort_cards(matches, sort_by, descending)[offset : offset + max(0, limit)]
+    output = get_output()
+    if group_by is None:
+        return {"total": len(matches), "cards": output.shorten(_dump(page, fields))}
+    groups = {k: output.shorten(_dump(v, fields)) for k, v in group_cards(page, group_by).items()}
+    return {"total": len(matches), "groups": groups}
+
+
+@mcp.tool()
+async def search_cards(
+    board_id: str, query: str, limit: int = 20, fields: list[str] | None = None
+) -> list[dict]:
+    """Full-text search of a board's open cards by name, description and comments.
+
+    Results are ranked best first, each with a relevance `score`. Use this instead of
+    reading every card when looking for cards about a topic.
+    """
+    client = get_client()
+    index = await _card_search_for(client).get(client, board_id)
+    hits = index.search(query, limit=max(1, limit))
+    cards = _dump([card for card, _ in hits], fields)
+    return get_output().apply(
+        [{**card, "score": round(score, 3)} for card, (_, score) in zip(cards, hits, strict=True)]
+    )
 
 
 @mcp.tool()
 async def create_card(list_id: str, name: str, desc: str = "") -> dict:
     """Create a new card in a Trello list."""
-    card = await get_client().create_card(list_id, name, desc)
+    card = _observe(await get_client().create_card(list_id, name, desc))
     return card.model_dump()
 
 
 @mcp.tool()
 async def move_card(card_id: str, list_id: str) -> dict:
     """Move a card to another list."""
-    card = await get_client().move_card(card_id, list_id)
+    if (queued := _queue_card_write(card_id, id_list=list_id)) is not None:
+        return queued
+    card = _observe(await get_client().move_card(card_id, list_id))
     return card.model_dump()
 
 
 @mcp.tool()
 async def update_card(card_id: str, name: str | None = None, desc: str | None = None) -> dict:
     """Update a card's name and/or description."""
-    card = await get_client().update_card(card_id, name=name, desc=desc)
+    changes = {k: v for k, v in {"name": name, "desc": desc}.items() if v is not None}
+    if changes and (queued := _queue_card_write(card_id, **changes)) is not None:
+        return queued
+    card = _observe(await get_client().update_card(card_id, name=name, desc=desc))
     return card.model_dump()
 
 
 @mcp.tool()
 async def add_comment(card_id: str, text: str) -> dict:
     """Add a comment to a Trello card."""
-    return await get_client().add_comment(card_id, text)
+    action = await get_client().add_comment(card_id, text)
+    _card_search_for(get_client()).comment(action)
+    return action
 
 
 @mcp.tool()
 async def archive_card(card_id: str) -> dict:
     """Archive (close) a Trello card."""
-    card = await get_client().archive_card(card_id)
+    card = _observe(await get_client().archive_card(card_id))
     return card.model_dump()
 
 
@@ -176,25 +614,88 @@ async def archive_card(card_id: str) -> dict:
 @mcp.tool()
 async def set_due_date(card_id: str, due: str) -> dict:
     """Set a due date on a card. Use ISO 8601 format (e.g. '2025-12-31T12:00:00Z')."""
-    card = await get_client().set_due_date(card_id, due)
+    if (queued := _queue_card_write(card_id, due=due)) is not None:
+        return queued
+    card = _observe(await get_client().set_due_date(card_id, due))
     return card.model_dump()
 
 
 @mcp.tool()
 async def mark_due_complete(card_id: str, complete: bool) -> dict:
     """Mark a card's due date as complete or incomplete."""
-    card = await get_client().mark_due_complete(card_id, complete)
+    if (queued := _queue_card_write(card_id, due_complete=complete)) is not None:
+        return queued
+    card = _observe(await get_client().mark_due_complete(card_id, complete))
     return card.model_dump()
 
 
+# --- Queued card writes ---
+
+_writes: WriteQueue | None = None
+
+
+def get_writes() -> WriteQueue | None:
+    """The write-behind queue for card updates, or None when updates are sent at once.
+
+    Queueing needs TRELLO_WRITE_DELAY and a single process, since flush_writes can only
+    report failures from the process that queued the updates.
+    """
+    global _writes
+    settings = get_settings()
+    if _writes is None and settings.trello_write_delay > 0 and settings.trello_workers <= 1:
+        _writes = WriteQueue(settings.trello_write_delay)
+    return _writes
+
+
+def _queue_card_write(card_id: str, **changes) -> dict | None:
+    """Queue changes to TrelloCard fields and return the optimistic result.
+
+    Returns None when updates aren't queued, so the caller sends them itself.
+    """
+    writes = get_writes()
+    if writes is None:
+        return None
+    client = get_client()
+    params = {}
+    for name, value in changes.items():
+        param = TrelloCard.model_fields[name].alias or name
+        params[param] = str(value).lower() if isinstance(value, bool) else value
+
+    async def send(merged: dict):
+        card = await client.put_card(card_id, merged)
+        _mirrors.observe(card)
+        _card_search_for(client).observe(card)
+
+    writes.enqueue(card_id, params, send, scope=client.namespace)
+    return {"id": card_id, **changes, "queued": True}
+
+
+@mcp.tool()
+async def flush_writes() -> dict:
+    """Send queued card updates now and report the ones Trello rejected.
+
+    With TRELLO_WRITE_DELAY set, update_card, move_card, set_due_date and
+    mark_due_complete return before Trello has applied the change. Each failure lists
+    the card, the merged parameters and the error.
+    """
+    writes = get_writes()
+    if writes is None:
+        return {"queued": False, "failed": []}
+    return {"queued": True, "failed": await writes.flush(get_client().namespace)}
+
+
 # --- Checklist tools ---
 
 
 @mcp.tool()
-async def get_checklists(card_id: str) -> list[dict]:
-    """Get all checklists on a card."""
-    checklists = await get_client().get_checklists(card_id)
-    return [cl.model_dump() for cl in checklists]
+async def get_checklists(card_id: str, fields: list[str] | None = None) -> list[dict]:
+    """Get all checklists on a card. `fields` limits the fields returned."""
+    mirror = await _mirror(_mirrors.board_for_card(card_id))
+    if mirror is not None:
+        checklists = mirror.checklists(card_id)
+    else:
+        checklists = await get_client().get_checklists(card_id, fields=fields)
+    return get_output().apply(_dump(checklists, fields))
 
 
 @mcp.tool()
@@ -244,16 +745,20 @@ async def delete_check_item(checklist_id: str, check_item_id: str) -> dict:
 
 
 @mcp.tool()
-async def get_board_labels(board_id: str) -> list[dict]:
-    """Get all labels on a board."""
-    labels = await get_client().get_board_labels(board_id)
-    return [lbl.model_dump() for lbl in labels]
+async def get_board_labels(board_id: str, fields: list[str] | None = None) -> list[dict]:
+    """Get all labels on a board. `fields` limits the fields returned."""
+    mirror = await _mirror(board_id)
+    if mirror is not None:
+        labels = mirror.labels()
+    else:
+        labels = await get_client().get_board_labels(board_id, fields=fields)
+    return get_output().apply(_dump(labels, fields))
 
 
 @mcp.tool()
 async def create_label(board_id: str, name: str, color: str) -> dict:
     """Create a new label on a board."""
-    label = await get_client().create_label(board_id, name, color)
+    label = _observe(await get_client().create_label(board_id, name, color))
     return label.model_dump()
 
 
@@ -278,10 +783,111 @@ async def remove_label_from_card(card_id: str, label_id: str) -> dict:
 async def get_custom_fields(board_id: str) -> list[dict]:
     """Get all custom field definitions on a board."""
     fields = await get_client().get_custom_fields(board_id)
-    return [f.model_dump() for f in fields]
+    return get_output().apply(_dump(fields))
 
 
 @mcp.tool()
 async def set_card_custom_field(card_id: str, field_id: str, value: dict) -> dict:
     """Set a custom field value on a card. Value format depends on field type."""
     return await get_client().set_card_custom_field(card_id, field_id, value)
+
+
+# --- Batch tools ---
+
+
+@mcp.tool()
+async def batch_get(urls: list[str]) -> list[dict]:
+    """Fetch many read-only API routes in one go (e.g. ['/cards/abc/checklists', '/lists/xyz']).
+
+    Routes omit the '/1' version prefix. Returns one result per route, in order, with
+    'status' and either 'data' or 'error'.
+    """
+    return get_output().apply(await get_client().batch_get(urls))
+
+
+@mcp.tool()
+async def continue_output(continuation: str) -> list[dict]:
+    """Get the next part of a list result that was cut to fit the response budget.
+
+    A cut-off list ends with {"continuation": ..., "remaining": n}; pass that
+    continuation here. Handles expire after ten minutes and can be used once.
+    With several HTTP workers the continuation is null: page with get_board_cards_page
+    or narrow the query instead.
+    """
+    try:
+        return get_output().resume(continuation)
+    except KeyError:
+        raise ToolError("Unknown or expired continuation; rerun the original tool") from None
+
+
+# --- Diagnostics ---
+
+
+@mcp.tool()
+async def server_stats() -> dict:
+    """Report this server's tool latencies, Trello API traffic, cache hit ratio and quota left."""
+    stats = _metrics.snapshot()
+    if _writes is not None:
+        stats["writes"] = {"pending": len(_writes), "sent": _writes.sent, "merged": _writes.merged}
+    return stats
+
+
+# --- Bulk tools ---
+# Each returns {"succeeded", "failed", "results"}; one failed item never stops the rest.
+
+
+@mcp.tool()
+async def bulk_move_cards(card_ids: list[str], list_id: str) -> dict:
+    """Move many cards to the same list."""
+    client = get_client()
+
+    async def move(card_id: str) -> dict:
+        return _observe(await client.move_card(card_id, list_id)).model_dump()
+
+    return await run_bulk(card_ids, move)
+
+
+@mcp.tool()
+async def bulk_archive_cards(card_ids: list[str]) -> dict:
+    """Archive (close) many cards."""
+    client = get_client()
+
+    async def archive(card_id: str) -> dict:
+        return _observe(await client.archive_card(card_id)).model_dump()
+
+    return await run_bulk(card_ids, archive)
+
+
+@mcp.tool()
+async def bulk_add_label_to_cards(card_ids: list[str], label_id: str) -> dict:
+    """Add the same label to many cards."""
+    client = get_client()
+
+    async def add_label(card_id: str) -> dict:
+        await client.add_label_to_card(card_id, label_id)
+        return {"added": True}
+
+    return await run_bulk(card_ids, add_label)
+
+
+@mcp.tool()
+async def bulk_update_cards(updates: list[CardUpdate]) -> dict:
+    """Update the name and/or description of many cards."""
+    client = get_client()
+
+    async def update(u: CardUpdate) -> dict:
+        return _observe(await client.update_card(u.card_id, name=u.name, desc=u.desc)).model_dump()
+
+    return await run_bulk(updates, update)
+
+
+@mcp.tool()
+async def bulk_add_check_items(checklist_id: str, names: list[str]) -> dict:
+    """Add many items to a checklist, in the given order."""
+    client = get_client()
+
+    async def add_item(name: str) -> dict:
+        return (await client.add_check_item(checklist_id, name)).model_dump()
+
+    # New items are appended at the bottom, so add them one at a time to keep their order.
+    return await run_bulk(names, add_item, concurrency=1)
@@ -0,0 +1,91 @@
+"""Cold-start measurement for the stdio server."""
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+SERVER_COMMAND = [sys.executable, "-m", "trello_mcp.cli", "run"]
+
+_HANDSHAKE = [
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "bench-startup", "version": "0"},
+        },
+    },
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+]
+
+_IMPORTTIME = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+
+
+def _env() -> dict[str, str]:
+    # Measure the server itself, not a network round trip to Trello.
+    return {**os.environ, "TRELLO_WARM_UP": "false"}
+
+
+def measure_startup(command: list[str] | None = None, timeout: float = 60.0) -> float:
+    """Seconds from spawning the stdio server to receiving its ``tools/list`` response."""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        command or SERVER_COMMAND,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_env(),
+    )
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        proc.stdin.write("".join(json.dumps(m) + "\n" for m in _HANDSHAKE).encode())
+        proc.stdin.flush()
+        for line in proc.stdout:
+            if json.loads(line).get("id") == 2:
+                return time.perf_counter() - started
+        raise RuntimeError("server exited before answering tools/list")
+    finally:
+        timer.cancel()
+        proc.kill()
+        proc.wait()
+
+
+def bench_startup(runs: int = 5, command: list[str] | None = None) -> dict[str, float]:
+    """Cold-start times over ``runs`` fresh processes."""
+    times = [measure_startup(command) for _ in range(runs)]
+    return {"min": min(times), "median": statistics.median(times), "max": max(times)}
+
+
+def parse_importtime(stderr: str, top: int = 15, depth: int = 2) -> list[tuple[str, float]]:
+    """The slowest imports (cumulative seconds) from ``-X importtime`` output.
+
+    Only modules nested at most ``depth`` levels deep are considered, so the report
+    names the packages a top-level import pulls in rather than their internals.
+    """
+    totals = []
+    for match in _IMPORTTIME.finditer(stderr):
+        cumulative, indent, module = match.groups()
+        if len(indent) // 2 < depth:
+            totals.append((module, int(cumulative) / 1e6))
+    return sorted(totals, key=lambda t: -t[1])[:top]
+
+
+def import_profile(module: str = "trello_mcp.server", top: int = 15) -> list[tuple[str, float]]:
+    """Profile importing ``module`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    return parse_importtime(result.stderr, top)
@@ -0,0 +1,93 @@
+"""Write-behind queue that merges pending card updates into one request per card."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from trello_mcp.bulk import run_bulk
+
+# Failures kept until reported by ``flush``; the oldest are dropped beyond this.
+MAX_FAILURES = 100
+
+type Send = Callable[[dict], Awaitable[Any]]
+
+
+class WriteQueue:
+    """Holds card updates for ``delay`` seconds, merging those to the same card.
+
+    Later values for a parameter replace earlier ones, so several updates to one card
+    cost a single request. Once the delay has passed the pending updates are sent
+    together, paced by the client's rate limiter. Updates queued while a round is being
+    sent wait for the next round, so each card's updates reach Trello in order.
+
+    Entries are keyed by a ``scope`` (the credentials' namespace) as well as the card,
+    and failures are only reported back to the scope that queued them.
+    """
+
+    def __init__(self, delay: float = 0.5):
+        self.delay = delay
+        self.sent = 0
+        self.merged = 0
+        self._pending: dict[tuple[str, str], tuple[dict, Send]] = {}
+        self._failures: deque[dict] = deque(maxlen=MAX_FAILURES)
+        self._task: asyncio.Task | None = None
+        self._timer: asyncio.Future | None = None
+        self._flushing = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, card_id: str, params: dict, send: Send, scope: str = ""):
+        """Queue ``params`` for ``card_id``; ``send`` applies the merged parameters."""
+        key = (scope, card_id)
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = ({**params}, send)
+        else:
+            pending[0].update(params)
+            self.merged += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._pending:
+            if not self._flushing:
+                self._timer = asyncio.ensure_future(asyncio.sleep(self.delay))
+                await asyncio.wait([self._timer])
+            await self._send_round()
+
+    async def _send_round(self):
+        batch = list(self._pending.items())
+        self._pending = {}
+
+        async def send(entry: tuple[tuple[str, str], tuple[dict, Send]]):
+            _, (params, op) = entry
+            await op(params)
+
+        report = await run_bulk(batch, send)
+        self.sent += report["succeeded"]
+        for result in report["results"]:
+            if not result["ok"]:
+                (scope, card_id), (params, _) = batch[result["index"]]
+                failure = {"card_id": card_id, "params": params, "error": result["error"]}
+                self._failures.append({"scope": scope, **failure})
+
+    async def flush(self, scope: str | None = None) -> list[dict]:
+        """Send every pending update now and return the failures not yet reported.
+
+        With a ``scope``, only that scope's failures are returned (and forgotten).
+        """
+        self._flushing += 1
+        try:
+            while self._task is not None and not self._task.done():
+                if self._timer is not None:
+                    self._timer.cancel()
+                await asyncio.shield(self._task)
+        finally:
+            self._flushing -= 1
+        reported, kept = [], deque(maxlen=MAX_FAILURES)
+        for failure in self._failures:
+            (reported if scope in (None, failure["scope"]) else kept).append(failure)
+        self._failures = kept
+        return [{k: v for k, v in f.items() if k != "scope"} for f in reported]
@@ -73,6 +73,21 @@ SAMPLE_CUSTOM_FIELDS = [
     {"id": "cf2", "name": "Story Points", "type": "number", "idModel": "board1"},
 ]
 
+SAMPLE_BOARD_SNAPSHOT = {
+    **SAMPLE_BOARDS[0],
+    "lists": SAMPLE_LISTS,
+    "cards": SAMPLE_CARDS,
+    "labels": SAMPLE_LABELS,
+    "checklists": SAMPLE_CHECKLISTS,
+    "customFields": SAMPLE_CUSTOM_FIELDS,
+}
+
+
+@pytest.fixture(autouse=True)
+def no_warm_up(monkeypatch):
+    """Keep the server lifespan from opening connections to the real Trello API."""
+    monkeypatch.setenv("TRELLO_WARM_UP", "false")
+
 
 @pytest.fixture
 def trello_client():
@@ -0,0 +1,73 @@
+"""Tests for the benchmark harness and its fake Trello API."""
+
+import httpx
+import pytest
+
+from benchmarks.fake_trello import FakeTrello, fake_id, make_board
+from benchmarks.run import compare, summarize
+from trello_mcp.client import TrelloClient
+from trello_mcp.ratelimit import RateLimiter
+
+
+def _client(fake: FakeTrello, **kwargs) -> TrelloClient:
+    client = TrelloClient(api_key="k", token="t", base_url="http://fake/1", **kwargs)
+    client._client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fake.app), base_url="http://fake/1"
+    )
+    return client
+
+
+def test_boards_are_deterministic():
+    assert make_board(0, 50, seed=1) == make_board(0, 50, seed=1)
+    assert make_board(0, 50, seed=1) != make_board(0, 50, seed=2)
+    assert len(fake_id("card", 7)) == 24
+
+
+async def test_client_reads_and_writes_the_fake_board():
+    fake = FakeTrello(cards=300, lists=4)
+    client = _client(fake)
+    board_id = fake_id("board", 0)
+    cards = await client.get_board_cards(board_id)
+    assert len(cards) == sum(not c["closed"] for c in fake.boards[board_id]["cards"])
+    assert len(await client.list_lists(board_id)) == 4
+    paged = [card async for card in client.iter_board_cards(board_id, page_size=100)]
+    assert {c.id for c in paged} == {c.id for c in cards}
+    card = await client.update_card(cards[0].id, name="renamed")
+    assert card.name == "renamed"
+    assert (await client.get_board_cards(board_id))[0].name == "renamed"
+
+
+async def test_quota_is_advertised_and_enforced():
+    fake = FakeTrello(cards=10, token_limit=2)
+    transport = httpx.ASGITransport(app=fake.app)
+    path = f"/1/boards/{fake_id('board', 0)}/lists"
+    async with httpx.AsyncClient(transport=transport, base_url="http://fake") as http:
+        first = await http.get(path)
+        assert first.headers["x-rate-limit-api-token-remaining"] == "1"
+        assert first.headers["x-rate-limit-api-key-max"] == "2"
+        assert (await http.get(path)).status_code == 200
+        assert (await http.get(path)).status_code == 429
+
+
+async def test_injected_throttling_reaches_the_client():
+    fake = FakeTrello(cards=10, throttle=1.0)
+    client = _client(fake, rate_limiter=RateLimiter(max_retries=0))
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.list_lists(fake_id("board", 0))
+    assert fake.throttled == 1
+
+
+def test_summarize_and_compare():
+    samples = [("list_lists", 0.01, True)] * 99 + [("update_card", 1.0, False)]
+    results = summarize(samples, wall=2.0)
+    assert results["calls"] == 100
+    assert results["errors"] == 1
+    assert results["throughput_per_s"] == 50
+    assert results["p50_ms"] == pytest.approx(10)
+    assert results["p99_ms"] == pytest.approx(1000)
+    assert results["tools"]["update_card"]["calls"] == 1
+    baseline = {"params": {"cards": 10}, "results": results}
+    faster = {"params": {"cards": 10}, "results": {**results, "throughput_per_s": 100}}
+    lines = compare(faster, baseline)
+    assert "+100.0% (better)" in lines[0]
+    assert compare({**faster, "params": {"cards": 20}}, baseline)[0].startswith("warning")
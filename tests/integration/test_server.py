@@ -1,21 +1,39 @@
 """Integration tests for MCP tools using fastmcp.Client."""
 
-from unittest.mock import AsyncMock
-
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
 import pytest
 from fastmcp import Client
+from mcp import McpError
 
-from tests.conftest import SAMPLE_BOARDS, SAMPLE_CARDS, SAMPLE_LISTS
+from tests.conftest import SAMPLE_BOARD_SNAPSHOT, SAMPLE_BOARDS, SAMPLE_CARDS, SAMPLE_LISTS
+from trello_mcp import server
+from trello_mcp.cache import MemoryCache, SqliteCache
+from trello_mcp.metrics import Metrics
+from trello_mcp.mirror import MirrorRegistry
 from trello_mcp.models import (
+    Settings,
     TrelloBoard,
+    TrelloBoardSnapshot,
     TrelloCard,
     TrelloCheckItem,
     TrelloChecklist,
     TrelloCustomField,
     TrelloLabel,
     TrelloList,
+    TrelloWebhook,
 )
+from trello_mcp.output import OutputBudget
+from trello_mcp.query import CardIndex
+from trello_mcp.search import CardSearch
 from trello_mcp.server import mcp, set_client
+from trello_mcp.writes import WriteQueue
 
 
 @pytest.fixture
@@ -26,6 +44,7 @@ def mock_trello():
     client.list_lists.return_value = [TrelloList(**lst) for lst in SAMPLE_LISTS]
     client.list_cards.return_value = [TrelloCard(**c) for c in SAMPLE_CARDS]
     client.get_board_cards.return_value = [TrelloCard(**c) for c in SAMPLE_CARDS]
+    client.get_board_cards_page.return_value = [TrelloCard(**c) for c in SAMPLE_CARDS]
     client.create_card.return_value = TrelloCard(
         id="card3", name="New", desc="", idList="list1", idBoard="board1"
     )
@@ -40,6 +59,7 @@ def mock_trello():
         id="card1", name="Task 1", idList="list1", idBoard="board1", closed=True
     )
     client.search_board.return_value = [TrelloBoard(**SAMPLE_BOARDS[0])]
+    client.get_board_snapshot.return_value = TrelloBoardSnapshot(**SAMPLE_BOARD_SNAPSHOT)
     # Lists management
     client.create_list.return_value = TrelloList(id="list3", name="Done", idBoard="board1")
     client.update_list.return_value = TrelloList(id="list1", name="Renamed", idBoard="board1")
@@ -80,6 +100,8 @@ def mock_trello():
         TrelloCustomField(id="cf1", name="Priority", type="list", idModel="board1")
     ]
     client.set_card_custom_field.return_value = {"id": "cf1", "value": {"number": "5"}}
+    # Batch
+    client.batch_get.return_value = [{"url": "/cards/card1", "status": 200, "data": {}}]
     set_client(client)
     yield client
     set_client(None)
@@ -107,6 +129,14 @@ async def test_search_board_tool(mock_trello):
         assert_tool_success(result)
 
 
+async def test_get_board_snapshot_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool("get_board_snapshot", {"board_id": "board1"})
+        assert_tool_success(result)
+        assert len(result.data["cards"]) == 2
+        mock_trello.get_board_snapshot.assert_awaited_once_with("board1")
+
+
 # --- List tools ---
 
 
@@ -114,7 +144,7 @@ async def test_list_lists_tool(mock_trello):
     async with Client(mcp) as c:
         result = await c.call_tool("list_lists", {"board_id": "board1"})
         assert_tool_success(result)
-        mock_trello.list_lists.assert_awaited_once_with("board1")
+        mock_trello.list_lists.assert_awaited_once_with("board1", fields=None)
 
 
 async def test_create_list_tool(mock_trello):
@@ -145,7 +175,7 @@ async def test_list_cards_tool(mock_trello):
     async with Client(mcp) as c:
         result = await c.call_tool("list_cards", {"list_id": "list1"})
         assert_tool_success(result)
-        mock_trello.list_cards.assert_awaited_once_with("list1")
+        mock_trello.list_cards.assert_awaited_once_with("list1", fields=None)
 
 
 async def test_get_board_cards_tool(mock_trello):
@@ -154,6 +184,65 @@ async def test_get_board_cards_tool(mock_trello):
         assert_tool_success(result)
 
 
+async def test_get_board_cards_tool_with_fields(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "get_board_cards", {"board_id": "board1", "fields": ["name", "idList"]}
+        )
+        assert_tool_success(result)
+        cards = result.structured_content["result"]
+        assert cards[0] == {"id": "card1", "name": "Task 1", "id_list": "list1"}
+        mock_trello.get_board_cards.assert_awaited_once_with("board1", fields=["name", "idList"])
+
+
+async def test_get_board_cards_page_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool("get_board_cards_page", {"board_id": "board1", "limit": 2})
+        assert_tool_success(result)
+        assert result.data["next_cursor"] == "card1"
+        mock_trello.get_board_cards_page.assert_awaited_once_with(
+            "board1", limit=2, before=None, fields=None
+        )
+        result = await c.call_tool("get_board_cards_page", {"board_id": "board1", "limit": 5})
+        assert result.data["next_cursor"] is None
+
+
+async def test_query_cards_tool(mock_trello):
+    mock_trello.get_board_card_index.return_value = CardIndex(
+        TrelloCard(**c) for c in SAMPLE_CARDS
+    )
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "query_cards",
+            {"board_id": "board1", "text": "task", "sort_by": "name", "descending": True},
+        )
+        assert_tool_success(result)
+        assert result.data["total"] == 2
+        assert [card["id"] for card in result.data["cards"]] == ["card2", "card1"]
+        mock_trello.get_board_card_index.assert_awaited_once_with("board1", closed=False)
+
+        result = await c.call_tool(
+            "query_cards",
+            {"board_id": "board1", "group_by": "list", "limit": 1, "fields": ["name"]},
+        )
+        assert result.data["groups"] == {"list1": [{"id": "card1", "name": "Task 1"}]}
+
+
+async def test_search_cards_tool(monkeypatch, mock_trello):
+    monkeypatch.setattr(server, "_card_search", CardSearch())
+    mock_trello.get_board_comments.return_value = []
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "search_cards", {"board_id": "board1", "query": "stuff", "fields": ["name"]}
+        )
+        assert_tool_success(result)
+        [hit] = result.structured_content["result"]
+        assert hit["id"] == "card1"
+        assert hit["name"] == "Task 1"
+        assert hit["score"] > 0
+        mock_trello.get_board_cards.assert_awaited_once_with("board1")
+
+
 async def test_create_card_tool(mock_trello):
     async with Client(mcp) as c:
         result = await c.call_tool("create_card", {"list_id": "list1", "name": "New"})
@@ -214,7 +303,7 @@ async def test_get_checklists_tool(mock_trello):
     async with Client(mcp) as c:
         result = await c.call_tool("get_checklists", {"card_id": "card1"})
         assert_tool_success(result)
-        mock_trello.get_checklists.assert_awaited_once_with("card1")
+        mock_trello.get_checklists.assert_awaited_once_with("card1", fields=None)
 
 
 async def test_create_checklist_tool(mock_trello):
@@ -271,7 +360,7 @@ async def test_get_board_labels_tool(mock_trello):
     async with Client(mcp) as c:
         result = await c.call_tool("get_board_labels", {"board_id": "board1"})
         assert_tool_success(result)
-        mock_trello.get_board_labels.assert_awaited_once_with("board1")
+        mock_trello.get_board_labels.assert_awaited_once_with("board1", fields=None)
 
 
 async def test_create_label_tool(mock_trello):
@@ -319,6 +408,443 @@ async def test_set_card_custom_field_tool(mock_trello):
         mock_trello.set_card_custom_field.assert_awaited_once_with("card1", "cf1", {"number": "5"})
 
 
+# --- Batch tools ---
+
+
+async def test_batch_get_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool("batch_get", {"urls": ["/cards/card1"]})
+        assert_tool_success(result)
+        mock_trello.batch_get.assert_awaited_once_with(["/cards/card1"])
+
+
+# --- Bulk tools ---
+
+
+async def test_bulk_move_cards_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "bulk_move_cards", {"card_ids": ["card1", "card2"], "list_id": "list2"}
+        )
+        assert_tool_success(result)
+        assert result.data["succeeded"] == 2
+        assert mock_trello.move_card.await_count == 2
+
+
+async def test_bulk_tool_reports_partial_failure(mock_trello):
+    mock_trello.archive_card.side_effect = [
+        TrelloCard(id="card1", name="Task 1", closed=True),
+        RuntimeError("boom"),
+    ]
+    async with Client(mcp) as c:
+        result = await c.call_tool("bulk_archive_cards", {"card_ids": ["card1", "card2"]})
+        assert_tool_success(result)
+        assert result.data["failed"] == 1
+        assert result.data["results"][1] == {"index": 1, "ok": False, "error": "boom"}
+
+
+async def test_bulk_add_label_to_cards_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "bulk_add_label_to_cards", {"card_ids": ["card1", "card2"], "label_id": "lbl1"}
+        )
+        assert_tool_success(result)
+        mock_trello.add_label_to_card.assert_any_await("card2", "lbl1")
+
+
+async def test_bulk_update_cards_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "bulk_update_cards", {"updates": [{"card_id": "card1", "name": "Updated"}]}
+        )
+        assert_tool_success(result)
+        mock_trello.update_card.assert_awaited_once_with("card1", name="Updated", desc=None)
+
+
+async def test_bulk_add_check_items_tool(mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool(
+            "bulk_add_check_items", {"checklist_id": "cl1", "names": ["A", "B"]}
+        )
+        assert_tool_success(result)
+        assert [call.args for call in mock_trello.add_check_item.await_args_list] == [
+            ("cl1", "A"),
+            ("cl1", "B"),
+        ]
+
+
+# --- Client configuration ---
+
+
+def test_cache_backend_follows_settings(tmp_path):
+    settings = Settings(trello_api_key="key", trello_token="tok")
+    assert isinstance(server._make_cache(settings), MemoryCache)
+    settings.trello_cache_path = str(tmp_path / "cache.db")
+    assert isinstance(server._make_cache(settings), SqliteCache)
+    settings.trello_cache_max_bytes = 0
+    assert server._make_cache(settings) is None
+
+
+def test_multiple_workers_keep_no_per_process_state(monkeypatch):
+    settings = Settings(
+        trello_api_key="key", trello_token="tok", trello_workers=4, trello_write_delay=1.0
+    )
+    monkeypatch.setattr(server, "_settings", settings)
+    monkeypatch.setattr(server, "_output", None)
+    monkeypatch.setattr(server, "_writes", None)
+    assert server._make_cache(settings) is None
+    assert not server.get_output().continuations
+    assert server.get_writes() is None
+
+
+async def test_lifespan_warms_up_client(monkeypatch):
+    pool = AsyncMock()
+    settings = Settings(trello_api_key="key", trello_token="tok", trello_warm_up=True)
+    monkeypatch.setattr(server, "_settings", settings)
+    monkeypatch.setattr(server, "_pool", pool)
+    async with server._lifespan(mcp):
+        await asyncio.sleep(0)
+    pool.warm_up.assert_awaited_once()
+
+
+async def test_lifespan_tolerates_missing_credentials(monkeypatch):
+    monkeypatch.delenv("TRELLO_API_KEY", raising=False)
+    monkeypatch.delenv("TRELLO_TOKEN", raising=False)
+    monkeypatch.setattr(server, "_settings", None)
+    monkeypatch.setattr(server, "_pool", None)
+    async with server._lifespan(mcp):
+        pass
+
+
+async def test_lifespan_marks_readiness(monkeypatch):
+    monkeypatch.setattr(
+        server, "_settings", Settings(trello_api_key="k", trello_token="t", trello_warm_up=False)
+    )
+    monkeypatch.setattr(server, "_ready", False)
+    async with server._lifespan(mcp):
+        assert server._ready
+    assert not server._ready
+
+
+async def test_health_and_readiness_routes(monkeypatch):
+    transport = httpx.ASGITransport(app=server.create_http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as http:
+        monkeypatch.setattr(server, "_ready", False)
+        assert (await http.get("/healthz")).status_code == 200
+        assert (await http.get("/readyz")).status_code == 503
+        monkeypatch.setattr(server, "_ready", True)
+        assert (await http.get("/readyz")).json() == {"status": "ready"}
+
+
+# --- Per-request credentials ---
+
+
+@pytest.fixture
+def tenant(monkeypatch):
+    """Send X-Trello-Token with every call; returns the pool's client for it."""
+    client = AsyncMock()
+    client.list_boards.return_value = [TrelloBoard(**SAMPLE_BOARDS[1])]
+    pool = MagicMock()
+    pool.get.return_value = client
+    monkeypatch.setattr(server, "_pool", pool)
+    monkeypatch.setattr(server, "_settings", Settings(trello_api_key="key", trello_token="tok"))
+    monkeypatch.setattr(server, "get_http_headers", lambda: {"x-trello-token": "user-token"})
+    return client
+
+
+async def test_request_credentials_use_the_pool(tenant, mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool("list_boards", {})
+    assert [b["id"] for b in result.structured_content["result"]] == [SAMPLE_BOARDS[1]["id"]]
+    server._pool.get.assert_called_with("key", "user-token")
+    mock_trello.list_boards.assert_not_awaited()
+
+
+async def test_request_credentials_need_an_api_key(tenant, monkeypatch):
+    monkeypatch.delenv("TRELLO_API_KEY", raising=False)
+    monkeypatch.setattr(server, "_settings", Settings())
+    async with Client(mcp) as c:
+        result = await c.call_tool("list_boards", {}, raise_on_error=False)
+    assert result.is_error
+    assert "X-Trello-Key" in result.content[0].text
+
+
+async def test_tenants_cannot_manage_mirrors(tenant, mirror_settings):
+    async with Client(mcp) as c:
+        result = await c.call_tool("mirror_board", {"board_id": "board1"}, raise_on_error=False)
+    assert result.is_error
+
+
+async def test_tenant_searches_are_separate(tenant, mock_trello, monkeypatch):
+    monkeypatch.setattr(server, "_card_search", CardSearch())
+    tenant.get_board_comments.return_value = []
+    tenant.get_board_cards.return_value = [TrelloCard(**SAMPLE_CARDS[0])]
+    async with Client(mcp) as c:
+        await c.call_tool("search_cards", {"board_id": "board1", "query": "task"})
+    assert "board1" not in server._card_search
+    assert "board1" in server._tenant_searches[tenant]
+
+
+async def test_missing_credentials_are_reported(monkeypatch):
+    monkeypatch.delenv("TRELLO_TOKEN", raising=False)
+    monkeypatch.setattr(server, "_settings", Settings())
+    monkeypatch.setattr(server, "_client", None)
+    async with Client(mcp) as c:
+        result = await c.call_tool("list_boards", {}, raise_on_error=False)
+    assert result.is_error
+    assert "TRELLO_TOKEN" in result.content[0].text
+
+
+# --- Metrics ---
+
+
+async def test_server_stats_reports_tool_calls(monkeypatch, mock_trello):
+    monkeypatch.setattr(server, "_metrics", Metrics())
+    mock_trello.list_cards.side_effect = httpx.ConnectError("down")
+    async with Client(mcp) as c:
+        await c.call_tool("list_lists", {"board_id": "board1"})
+        await c.call_tool("list_cards", {"list_id": "list1"}, raise_on_error=False)
+        result = await c.call_tool("server_stats", {})
+    tools = result.data["tools"]
+    assert tools["list_lists"]["calls"] == 1
+    assert tools["list_lists"]["errors"] == 0
+    assert tools["list_cards"]["errors"] == 1
+
+
+async def test_metrics_route(monkeypatch):
+    metrics = Metrics()
+    metrics.observe_tool("list_boards", 0.01)
+    monkeypatch.setattr(server, "_metrics", metrics)
+    transport = httpx.ASGITransport(app=server.create_http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as http:
+        resp = await http.get("/metrics")
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'trello_mcp_tool_calls_total{tool="list_boards",outcome="ok"} 1' in resp.text
+
+
+# --- Queued writes ---
+
+
+@pytest.fixture
+def write_queue(monkeypatch, mock_trello):
+    queue = WriteQueue(delay=60)
+    monkeypatch.setattr(server, "_writes", queue)
+    mock_trello.namespace = "server"
+    mock_trello.put_card.return_value = TrelloCard(
+        id="card1", name="Renamed", idList="list2", idBoard="board1", dueComplete=True
+    )
+    return queue
+
+
+async def test_card_updates_are_queued_and_merged(mock_trello, write_queue):
+    async with Client(mcp) as c:
+        result = await c.call_tool("update_card", {"card_id": "card1", "name": "Renamed"})
+        assert result.data == {"id": "card1", "name": "Renamed", "queued": True}
+        await c.call_tool("move_card", {"card_id": "card1", "list_id": "list2"})
+        await c.call_tool("mark_due_complete", {"card_id": "card1", "complete": True})
+        mock_trello.put_card.assert_not_called()
+        stats = (await c.call_tool("server_stats", {})).data["writes"]
+        assert stats == {"pending": 1, "sent": 0, "merged": 2}
+        result = await c.call_tool("flush_writes", {})
+    assert result.data == {"queued": True, "failed": []}
+    mock_trello.put_card.assert_awaited_once_with(
+        "card1", {"name": "Renamed", "idList": "list2", "dueComplete": "true"}
+    )
+    mock_trello.update_card.assert_not_called()
+
+
+async def test_empty_card_update_is_not_queued(mock_trello, write_queue):
+    async with Client(mcp) as c:
+        result = await c.call_tool("update_card", {"card_id": "card1"})
+    assert "queued" not in result.data
+    assert len(write_queue) == 0
+
+
+async def test_flush_writes_reports_failures(mock_trello, write_queue):
+    mock_trello.put_card.side_effect = httpx.ConnectError("down")
+    async with Client(mcp) as c:
+        await c.call_tool("set_due_date", {"card_id": "card1", "due": "2026-01-01"})
+        result = await c.call_tool("flush_writes", {})
+    assert result.data["failed"] == [
+        {"card_id": "card1", "params": {"due": "2026-01-01"}, "error": "down"}
+    ]
+
+
+async def test_card_updates_are_sent_at_once_by_default(mock_trello, monkeypatch):
+    monkeypatch.setattr(server, "_writes", None)
+    async with Client(mcp) as c:
+        result = await c.call_tool("move_card", {"card_id": "card1", "list_id": "list2"})
+        assert result.data["id_list"] == "list2"
+        assert (await c.call_tool("flush_writes", {})).data == {"queued": False, "failed": []}
+
+
+# --- Output budgets ---
+
+
+async def test_list_tools_continue_past_the_budget(monkeypatch, mock_trello):
+    monkeypatch.setattr(server, "_output", OutputBudget(max_items=1))
+    async with Client(mcp) as c:
+        result = await c.call_tool("list_cards", {"list_id": "list1"})
+        first, marker = result.structured_content["result"]
+        assert first["id"] == "card1"
+        assert marker["remaining"] == 1
+        result = await c.call_tool("continue_output", {"continuation": marker["continuation"]})
+        assert [card["id"] for card in result.structured_content["result"]] == ["card2"]
+        result = await c.call_tool(
+            "continue_output", {"continuation": marker["continuation"]}, raise_on_error=False
+        )
+        assert result.is_error
+
+
+async def test_compact_profile(monkeypatch, mock_trello):
+    monkeypatch.setattr(server, "_output", OutputBudget(compact=True))
+    async with Client(mcp) as c:
+        result = await c.call_tool("get_board_cards", {"board_id": "board1"})
+        card = result.structured_content["result"][0]
+        assert "desc" not in card
+        assert card["id_list"] == "list1"
+
+
+async def test_self_paging_tools_truncate_descriptions(monkeypatch, mock_trello):
+    monkeypatch.setattr(server, "_output", OutputBudget(desc_chars=2))
+    mock_trello.get_board_card_index.return_value = CardIndex(
+        TrelloCard(**c) for c in SAMPLE_CARDS
+    )
+    async with Client(mcp) as c:
+        page = await c.call_tool("get_board_cards_page", {"board_id": "board1"})
+        query = await c.call_tool("query_cards", {"board_id": "board1", "group_by": "list"})
+        snapshot = await c.call_tool("get_board_snapshot", {"board_id": "board1"})
+    assert page.data["next_cursor"] is None
+    assert page.structured_content["cards"][0]["desc"] == "Do…"
+    assert query.structured_content["groups"]["list1"][0]["desc"] == "Do…"
+    assert all(len(card["desc"]) <= 3 for card in snapshot.structured_content["cards"])
+
+
+def test_output_budget_follows_settings(monkeypatch):
+    settings = Settings(trello_api_key="key", trello_token="tok", trello_output_profile="compact")
+    monkeypatch.setattr(server, "_settings", settings)
+    monkeypatch.setattr(server, "_output", None)
+    assert server.get_output().compact
+
+
+# --- Board mirrors ---
+
+WEBHOOK_URL = "https://mcp.example.com/webhooks/trello"
+
+
+def _signed(body: bytes, secret: str = "secret") -> dict:
+    digest = hmac.new(secret.encode(), body + WEBHOOK_URL.encode(), hashlib.sha1).digest()
+    return {"x-trello-webhook": base64.b64encode(digest).decode()}
+
+
+@pytest.fixture
+def mirror_settings(monkeypatch, mock_trello):
+    settings = Settings(
+        trello_api_key="key",
+        trello_token="tok",
+        trello_webhook_url=WEBHOOK_URL,
+        trello_api_secret="secret",
+    )
+    monkeypatch.setattr(server, "_settings", settings)
+    monkeypatch.setattr(server, "_mirrors", MirrorRegistry())
+    mock_trello.create_webhook.return_value = TrelloWebhook(id="wh1", idModel="board1")
+    mock_trello.list_webhooks.return_value = []
+    return settings
+
+
+async def test_mirror_board_requires_webhook_url(monkeypatch, mock_trello):
+    monkeypatch.setattr(server, "_settings", Settings(trello_api_key="key", trello_token="tok"))
+    async with Client(mcp) as c:
+        result = await c.call_tool("mirror_board", {"board_id": "board1"}, raise_on_error=False)
+        assert result.is_error
+
+
+async def test_mirror_board_requires_api_secret(mirror_settings, monkeypatch):
+    monkeypatch.setattr(mirror_settings, "trello_api_secret", None)
+    async with Client(mcp) as c:
+        result = await c.call_tool("mirror_board", {"board_id": "board1"}, raise_on_error=False)
+        assert result.is_error
+        assert "TRELLO_API_SECRET" in result.content[0].text
+
+
+async def test_mirror_board_refuses_multiple_workers(mirror_settings, monkeypatch):
+    monkeypatch.setattr(mirror_settings, "trello_workers", 4)
+    async with Client(mcp) as c:
+        result = await c.call_tool("mirror_board", {"board_id": "board1"}, raise_on_error=False)
+        assert result.is_error
+        assert "worker" in result.content[0].text
+
+
+async def test_mirrored_board_reads_skip_the_api(mirror_settings, mock_trello):
+    async with Client(mcp) as c:
+        result = await c.call_tool("mirror_board", {"board_id": "board1"})
+        assert result.data == {"board_id": "board1", "lists": 2, "cards": 2}
+        await c.call_tool("get_board_cards", {"board_id": "board1"})
+        await c.call_tool("list_cards", {"list_id": "list1"})
+        await c.call_tool("list_lists", {"board_id": "board1"})
+        mock_trello.get_board_cards.assert_not_awaited()
+        mock_trello.list_cards.assert_not_awaited()
+        mock_trello.list_lists.assert_not_awaited()
+        await c.call_tool("unmirror_board", {"board_id": "board1"})
+        mock_trello.delete_webhook.assert_awaited_once_with("wh1")
+
+
+async def test_webhook_route_applies_actions(mirror_settings, mock_trello):
+    async with Client(mcp) as c:
+        await c.call_tool("mirror_board", {"board_id": "board1"})
+        transport = httpx.ASGITransport(app=mcp.http_app(transport="sse"))
+        async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as http:
+            assert (await http.head("/webhooks/trello")).status_code == 200
+            payload = {
+                "action": {
+                    "id": "a1",
+                    "type": "deleteCard",
+                    "data": {"board": {"id": "board1"}, "card": {"id": "card1"}},
+                },
+                "model": {"id": "board1"},
+            }
+            body = json.dumps(payload).encode()
+            resp = await http.post("/webhooks/trello", content=body, headers=_signed(body))
+            assert resp.status_code == 200
+        result = await c.call_tool("get_board_cards", {"board_id": "board1"})
+        assert [card["id"] for card in result.structured_content["result"]] == ["card2"]
+
+
+async def test_webhook_route_rejects_bad_signature(mirror_settings, monkeypatch):
+    monkeypatch.setattr(mirror_settings, "trello_api_secret", "secret")
+    transport = httpx.ASGITransport(app=mcp.http_app(transport="sse"))
+    async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as http:
+        resp = await http.post(
+            "/webhooks/trello", json={"action": {}}, headers={"x-trello-webhook": "bogus"}
+        )
+        assert resp.status_code == 401
+
+
+async def test_webhook_route_requires_a_secret(mirror_settings, monkeypatch):
+    monkeypatch.setattr(mirror_settings, "trello_api_secret", None)
+    transport = httpx.ASGITransport(app=mcp.http_app(transport="sse"))
+    async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as http:
+        body = b'{"action": {}}'
+        resp = await http.post("/webhooks/trello", content=body, headers=_signed(body))
+        assert resp.status_code == 401
+
+
+async def test_webhook_route_rejects_malformed_payloads(mirror_settings, mock_trello):
+    async with Client(mcp) as c:
+        await c.call_tool("mirror_board", {"board_id": "board1"})
+    transport = httpx.ASGITransport(app=mcp.http_app(transport="sse"))
+    async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as http:
+        for body in (b"not json", b"[]", b'{"action": "x"}'):
+            resp = await http.post("/webhooks/trello", content=body, headers=_signed(body))
+            assert resp.status_code == 400
+        data = {"board": {"id": "board1"}, "card": "card1"}
+        payload = {"action": {"type": "updateCard", "data": data}}
+        body = json.dumps(payload).encode()
+        resp = await http.post("/webhooks/trello", content=body, headers=_signed(body))
+        assert resp.status_code == 400
+    assert server._mirrors._mirrors["board1"].gap
+
+
 # --- Resources ---
 
 
@@ -337,3 +863,19 @@ async def test_resource_content_readable():
         result = await c.read_resource("trello://docs/api-introduction")
         text = result[0].content if hasattr(result[0], "content") else str(result[0])
         assert "Trello API Introduction" in text
+
+
+async def test_resources_carry_hash_and_sections():
+    async with Client(mcp) as c:
+        resources = {str(r.uri): r for r in await c.list_resources()}
+        meta = resources["trello://docs/rate-limits"].meta
+        assert len(meta["sha256"]) == 64
+        assert "error-responses" in meta["sections"]
+
+
+async def test_resource_section_readable():
+    async with Client(mcp) as c:
+        result = await c.read_resource("trello://docs/rate-limits#error-responses")
+        assert result[0].text.startswith("## Error Responses")
+        with pytest.raises(McpError):
+            await c.read_resource("trello://docs/rate-limits#nope")
@@ -0,0 +1,21 @@
+"""Cold-start budget for the stdio server."""
+
+import os
+import subprocess
+import sys
+
+from trello_mcp.startup import measure_startup
+
+# Generous enough for shared CI runners; tighten locally with TRELLO_MCP_STARTUP_BUDGET.
+STARTUP_BUDGET_S = float(os.environ.get("TRELLO_MCP_STARTUP_BUDGET", "6.0"))
+
+
+def test_cold_start_to_tools_list_within_budget():
+    elapsed = measure_startup()
+    assert elapsed < STARTUP_BUDGET_S, f"cold start took {elapsed:.2f}s"
+
+
+def test_cli_import_does_not_load_the_server():
+    code = "import sys, trello_mcp.cli; print('trello_mcp.server' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.strip() == "False"
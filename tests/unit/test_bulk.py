@@ -0,0 +1,50 @@
+"""Tests for bounded-concurrency bulk execution."""
+
+import asyncio
+
+import httpx
+
+from trello_mcp.bulk import run_bulk
+
+
+async def test_collects_per_item_results_in_order():
+    async def op(n: int) -> int:
+        if n == 2:
+            raise ValueError("bad item")
+        return n * 10
+
+    outcome = await run_bulk([1, 2, 3], op)
+    assert outcome["succeeded"] == 2
+    assert outcome["failed"] == 1
+    assert outcome["results"] == [
+        {"index": 0, "ok": True, "result": 10},
+        {"index": 1, "ok": False, "error": "bad item"},
+        {"index": 2, "ok": True, "result": 30},
+    ]
+
+
+async def test_concurrency_is_bounded():
+    running = peak = 0
+
+    async def op(_: int):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await run_bulk(list(range(10)), op, concurrency=3)
+    assert peak == 3
+
+
+async def test_http_errors_do_not_leak_credentials():
+    request = httpx.Request("PUT", "https://api.trello.com/1/cards/x?key=k&token=secret")
+
+    async def op(_: str):
+        response = httpx.Response(404, text="card not found", request=request)
+        response.raise_for_status()
+
+    outcome = await run_bulk(["x"], op)
+    error = outcome["results"][0]["error"]
+    assert error == "404 Not Found: card not found"
+    assert "secret" not in error
@@ -0,0 +1,126 @@
+"""Tests for the response cache backends."""
+
+import sqlite3
+import time
+
+from trello_mcp.cache import CacheEntry, MemoryCache, SqliteCache, cache_key
+
+
+def entry(body: bytes = b"[]", kind: str = "lists", scope: str = "board1", ttl: float = 60):
+    return CacheEntry(body, kind, scope, time.time() + ttl)
+
+
+def test_cache_key_sorts_params():
+    assert cache_key("/boards") == "/boards"
+    assert cache_key("/boards", {"b": 1, "a": 2}) == "/boards?a=2&b=1"
+    assert cache_key("/boards", {"a": 1}, namespace="ns") == "ns:/boards?a=1"
+
+
+def test_entry_freshness():
+    assert entry().fresh
+    assert not entry(ttl=-1).fresh
+
+
+class TestMemoryCache:
+    def test_get_and_set(self):
+        cache = MemoryCache()
+        cache.set("k", entry(b"abc"))
+        assert cache.get("k").body == b"abc"
+        assert cache.size == 3
+
+    def test_lru_eviction_by_size(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", entry(b"x" * 4))
+        cache.set("b", entry(b"x" * 4))
+        cache.get("a")
+        cache.set("c", entry(b"x" * 4))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size == 8
+
+    def test_oversized_entry_is_not_stored(self):
+        cache = MemoryCache(max_bytes=2)
+        cache.set("a", entry(b"abc"))
+        assert len(cache) == 0
+
+    def test_invalidate_by_kind_and_scope(self):
+        cache = MemoryCache()
+        cache.set("a", entry(scope="board1"))
+        cache.set("b", entry(scope="board2"))
+        cache.set("c", entry(kind="labels"))
+        cache.invalidate("lists", "board1")
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        cache.invalidate("lists")
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_clear(self):
+        cache = MemoryCache()
+        cache.set("a", entry())
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestSqliteCache:
+    def test_round_trip_and_persistence(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = SqliteCache(path)
+        cache.set("k", CacheEntry(b"abc", "lists", "board1", 1.0, etag='"e"', activity="t1"))
+        cache.close()
+        reopened = SqliteCache(path)
+        got = reopened.get("k")
+        assert got == CacheEntry(b"abc", "lists", "board1", 1.0, etag='"e"', activity="t1")
+
+    def test_shared_between_connections_in_wal_mode(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        writer, reader = SqliteCache(path), SqliteCache(path)
+        writer.set("k", entry(b"shared"))
+        assert reader.get("k").body == b"shared"
+        mode = sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = SqliteCache(str(tmp_path / "cache.db"), max_bytes=10)
+        cache.set("a", entry(b"x" * 4))
+        cache.set("b", entry(b"x" * 4))
+        cache.get("a")
+        cache.set("c", entry(b"x" * 4))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size == 8
+
+    def test_hits_are_recorded_in_batches(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = SqliteCache(path, touch_interval=60)
+        cache.set("a", entry())
+
+        def used_at() -> float:
+            return sqlite3.connect(path).execute("SELECT used_at FROM entries").fetchone()[0]
+
+        stored = used_at()
+        cache.get("a")
+        assert used_at() == stored
+        hit = cache._touched["a"]
+        cache.close()
+        assert used_at() == hit
+
+    def test_size_is_checked_after_enough_writes(self, tmp_path):
+        cache = SqliteCache(str(tmp_path / "cache.db"), max_bytes=64)  # checks every 4 bytes
+        cache.set("a", entry(b"x" * 63))
+        cache.set("b", entry(b"x" * 3))
+        assert cache.size == 66
+        cache.set("c", entry(b"x"))
+        assert cache.get("a") is None
+        assert cache.size == 4
+
+    def test_invalidate_and_clear(self, tmp_path):
+        cache = SqliteCache(str(tmp_path / "cache.db"))
+        cache.set("a", entry(scope="board1"))
+        cache.set("b", entry(scope="board2"))
+        cache.invalidate("lists", "board1")
+        assert cache.get("a") is None
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
@@ -1,10 +1,13 @@
 """Tests for TrelloClient with mocked HTTP."""
 
+import asyncio
+
 import httpx
 import pytest
 import respx
 
 from tests.conftest import (
+    SAMPLE_BOARD_SNAPSHOT,
     SAMPLE_BOARDS,
     SAMPLE_CARDS,
     SAMPLE_CHECKLISTS,
@@ -12,12 +15,20 @@ from tests.conftest import (
     SAMPLE_LABELS,
     SAMPLE_LISTS,
 )
+from trello_mcp.cache import MemoryCache
 from trello_mcp.client import TrelloClient
+from trello_mcp.ratelimit import RateLimiter
+from trello_mcp.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 
 @pytest.fixture
 def mock_client():
-    client = TrelloClient(api_key="key", token="tok", base_url="https://api.trello.com/1")
+    client = TrelloClient(
+        api_key="key",
+        token="tok",
+        base_url="https://api.trello.com/1",
+        retry=RetryPolicy(backoff_base=0),
+    )
     return client
 
 
@@ -47,6 +58,31 @@ async def test_search_board(mock_client):
     assert results[0].name == "Project Alpha"
 
 
+@respx.mock
+async def test_search_board_reuses_index(mock_client):
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_BOARDS)
+    )
+    await mock_client.search_board("alpha")
+    results = await mock_client.search_board("beta")
+    assert [b.name for b in results] == ["Beta Tasks"]
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_get_board_snapshot(mock_client):
+    route = respx.get(f"{BASE}/boards/board1").mock(
+        return_value=httpx.Response(200, json=SAMPLE_BOARD_SNAPSHOT)
+    )
+    snapshot = await mock_client.get_board_snapshot("board1")
+    params = route.calls[0].request.url.params
+    assert params["cards"] == "open"
+    assert params["checklists"] == "all"
+    assert params["customFields"] == "true"
+    assert len(snapshot.cards) == 2
+    assert snapshot.custom_fields[0].name == "Priority"
+
+
 # --- Lists ---
 
 
@@ -107,6 +143,51 @@ async def test_get_board_cards(mock_client):
     assert len(cards) == 2
 
 
+def _paged_cards_handler(cards: list[dict]):
+    """Serve ``cards`` like Trello: newest first, honouring ``limit`` and ``before``."""
+
+    def handler(request):
+        limit = int(request.url.params["limit"])
+        before = request.url.params.get("before")
+        page = sorted(
+            (c for c in cards if before is None or c["id"] < before), key=lambda c: c["id"]
+        )
+        return httpx.Response(200, json=page[::-1][:limit])
+
+    return handler
+
+
+@respx.mock
+async def test_iter_board_cards_pages_with_before_cursor(mock_client):
+    cards = [{**SAMPLE_CARDS[0], "id": f"{i:024x}", "name": f"Card {i}"} for i in range(5)]
+    route = respx.get(f"{BASE}/boards/board1/cards").mock(side_effect=_paged_cards_handler(cards))
+    seen = [card.name async for card in mock_client.iter_board_cards("board1", page_size=2)]
+    assert seen == ["Card 4", "Card 3", "Card 2", "Card 1", "Card 0"]
+    assert route.call_count == 3
+    assert route.calls[1].request.url.params["before"] == f"{3:024x}"
+
+
+@respx.mock
+async def test_stream_error_raises(mock_client):
+    respx.get(f"{BASE}/boards/board1/cards").mock(
+        return_value=httpx.Response(404, text="board not found")
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await mock_client.get_board_cards_page("board1")
+
+
+@respx.mock
+async def test_reads_project_model_fields(mock_client):
+    route = respx.get(f"{BASE}/boards/board1/cards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_CARDS)
+    )
+    await mock_client.get_board_cards("board1")
+    await mock_client.get_board_cards("board1", fields=["due", "id_list"])
+    default, custom = (call.request.url.params["fields"] for call in route.calls)
+    assert default == "name,desc,idList,idBoard,url,closed,labels,due,dueComplete"
+    assert custom == "name,due,idList"
+
+
 @respx.mock
 async def test_create_card(mock_client):
     new_card = {
@@ -314,3 +395,471 @@ async def test_delete_error_raises(mock_client):
     )
     with pytest.raises(httpx.HTTPStatusError):
         await mock_client.delete_checklist("bad")
+
+
+# --- Connection pool ---
+
+
+def test_split_timeouts_are_applied():
+    timeout = httpx.Timeout(connect=1.0, read=20.0, write=5.0, pool=2.0)
+    client = TrelloClient(api_key="key", token="tok", timeout=timeout)
+    assert client._client.timeout == timeout
+
+
+def test_http2_falls_back_without_h2(monkeypatch, caplog):
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    client = TrelloClient(api_key="key", token="tok", http2=True)
+    assert "HTTP/2 requested" in caplog.text
+    assert client._client is not None
+
+
+@respx.mock
+async def test_warm_up_opens_a_connection(mock_client):
+    route = respx.head(f"{BASE}/").mock(return_value=httpx.Response(404))
+    await mock_client.warm_up()
+    assert route.called
+
+
+@respx.mock
+async def test_warm_up_ignores_connection_errors(mock_client):
+    respx.head(f"{BASE}/").mock(side_effect=httpx.ConnectError("unreachable"))
+    await mock_client.warm_up()
+
+
+# --- Request coalescing ---
+
+
+@respx.mock
+async def test_concurrent_identical_reads_share_one_request(mock_client):
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_BOARDS)
+    )
+    results = await asyncio.gather(*(mock_client.list_boards() for _ in range(5)))
+    assert route.call_count == 1
+    assert all(len(boards) == 2 for boards in results)
+    await mock_client.list_boards()
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_coalescing_is_keyed_on_params(mock_client):
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_BOARDS)
+    )
+    await asyncio.gather(mock_client.list_boards(), mock_client.list_boards(fields=["name"]))
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_coalesced_failure_reaches_every_caller(mock_client):
+    respx.get(f"{BASE}/members/me/boards").mock(return_value=httpx.Response(500))
+    results = await asyncio.gather(
+        mock_client.list_boards(), mock_client.list_boards(), return_exceptions=True
+    )
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+@respx.mock
+async def test_cancelled_caller_does_not_cancel_joined_reads(mock_client):
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_BOARDS)
+    )
+    first = asyncio.create_task(mock_client.list_boards())
+    second = asyncio.create_task(mock_client.list_boards())
+    await asyncio.sleep(0)
+    first.cancel()
+    assert len(await second) == 2
+    assert route.call_count == 1
+
+
+# --- Rate limiting ---
+
+
+@respx.mock
+async def test_429_is_retried():
+    client = TrelloClient(
+        api_key="key", token="tok", rate_limiter=RateLimiter(backoff_base=0, backoff_cap=0)
+    )
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        side_effect=[
+            httpx.Response(429, json={"error": "API_TOKEN_LIMIT_EXCEEDED"}),
+            httpx.Response(200, json=SAMPLE_BOARDS),
+        ]
+    )
+    boards = await client.list_boards()
+    assert len(boards) == 2
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_429_gives_up_after_max_retries():
+    client = TrelloClient(
+        api_key="key",
+        token="tok",
+        rate_limiter=RateLimiter(max_retries=2, backoff_base=0, backoff_cap=0),
+    )
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(429, json={"error": "API_TOKEN_LIMIT_EXCEEDED"})
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.list_boards()
+    assert route.call_count == 3
+    assert client.metrics.retries == {"429": 2}
+
+
+# --- Metrics ---
+
+
+@respx.mock
+async def test_requests_are_measured(mock_client):
+    respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(
+            200, json=SAMPLE_BOARDS, headers={"x-rate-limit-api-token-remaining": "97"}
+        )
+    )
+    respx.post(f"{BASE}/lists").mock(return_value=httpx.Response(400, text="invalid"))
+    await mock_client.list_boards()
+    with pytest.raises(httpx.HTTPStatusError):
+        await mock_client.create_list("board1", "New")
+    metrics = mock_client.metrics
+    assert metrics.upstream_requests == {
+        ("GET", "/members/me/boards", "200"): 1,
+        ("POST", "/lists", "400"): 1,
+    }
+    assert metrics.bytes_received > 0
+    assert metrics.rate_limit_remaining == {"api-token": 97}
+
+
+@respx.mock
+async def test_transport_errors_are_measured(mock_client):
+    respx.get(f"{BASE}/members/me/boards").mock(side_effect=httpx.ConnectError("boom"))
+    with pytest.raises(httpx.ConnectError):
+        await mock_client.list_boards()
+    assert mock_client.metrics.upstream_requests == {("GET", "/members/me/boards", "error"): 4}
+    assert mock_client.metrics.retries == {"ConnectError": 3}
+
+
+# --- Retries and circuit breaker ---
+
+
+@respx.mock
+async def test_transient_get_failures_are_retried(mock_client):
+    route = respx.get(f"{BASE}/members/me/boards").mock(
+        side_effect=[
+            httpx.ReadTimeout("slow"),
+            httpx.Response(503),
+            httpx.Response(200, json=SAMPLE_BOARDS),
+        ]
+    )
+    assert len(await mock_client.list_boards()) == 2
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_put_is_retried_on_5xx(mock_client):
+    route = respx.put(f"{BASE}/cards/card1").mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json=SAMPLE_CARDS[0])]
+    )
+    await mock_client.update_card("card1", name="x")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_post_is_not_retried_once_sent(mock_client):
+    route = respx.post(f"{BASE}/cards").mock(side_effect=httpx.ReadTimeout("slow"))
+    with pytest.raises(httpx.ReadTimeout):
+        await mock_client.create_card("list1", "New")
+    assert route.call_count == 1
+    route.side_effect = [httpx.Response(500)]
+    with pytest.raises(httpx.HTTPStatusError):
+        await mock_client.create_card("list1", "New")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_post_is_retried_when_never_sent(mock_client):
+    route = respx.post(f"{BASE}/cards").mock(
+        side_effect=[httpx.ConnectError("refused"), httpx.Response(200, json=SAMPLE_CARDS[0])]
+    )
+    await mock_client.create_card("list1", "New")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_open_circuit_fails_fast():
+    client = TrelloClient(
+        api_key="key",
+        token="tok",
+        retry=RetryPolicy(max_retries=0),
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+    )
+    route = respx.get(f"{BASE}/members/me/boards").mock(return_value=httpx.Response(500))
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.list_boards()
+    with pytest.raises(CircuitOpenError, match=r"api\.trello\.com"):
+        await client.list_boards()
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_cache_results_are_measured():
+    client = TrelloClient(api_key="key", token="tok", cache=MemoryCache())
+    respx.get(f"{BASE}/members/me/boards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_BOARDS)
+    )
+    await client.list_boards()
+    await client.list_boards()
+    assert client.metrics.cache == {"hit": 1, "revalidated": 0, "miss": 1}
+    assert client.metrics.cache_hit_ratio == 0.5
+
+
+# --- Caching ---
+
+
+@pytest.fixture
+def cached_client():
+    return TrelloClient(api_key="key", token="tok", cache=MemoryCache())
+
+
+@respx.mock
+async def test_card_index_is_reused_while_cards_are_unchanged(cached_client):
+    respx.get(f"{BASE}/boards/board1/cards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_CARDS)
+    )
+    index = await cached_client.get_board_card_index("board1")
+    assert len(index) == 2
+    assert await cached_client.get_board_card_index("board1") is index
+
+
+@respx.mock
+async def test_card_indexes_are_bounded(cached_client, monkeypatch):
+    monkeypatch.setattr("trello_mcp.client.MAX_CARD_INDEXES", 2)
+    respx.get(url__regex=rf"{BASE}/boards/\w+/cards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_CARDS)
+    )
+    first = await cached_client.get_board_card_index("board1")
+    await cached_client.get_board_card_index("board2")
+    await cached_client.get_board_card_index("board1")
+    await cached_client.get_board_card_index("board3")
+    assert list(cached_client._card_indexes) == ["/boards/board1/cards", "/boards/board3/cards"]
+    assert await cached_client.get_board_card_index("board1") is first
+
+
+@respx.mock
+async def test_card_index_with_closed_cards(mock_client):
+    route = respx.get(f"{BASE}/boards/board1/cards/all").mock(
+        return_value=httpx.Response(200, json=SAMPLE_CARDS)
+    )
+    await mock_client.get_board_card_index("board1", closed=True)
+    assert route.called
+
+
+@respx.mock
+async def test_cached_reads_hit_api_once(cached_client):
+    route = respx.get(f"{BASE}/boards/board1/lists").mock(
+        return_value=httpx.Response(200, json=SAMPLE_LISTS)
+    )
+    await cached_client.list_lists("board1")
+    lists = await cached_client.list_lists("board1")
+    assert len(lists) == 2
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_read_in_flight_during_a_write_is_not_cached(cached_client):
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_lists(request):
+        started.set()
+        await release.wait()
+        return httpx.Response(200, json=SAMPLE_LISTS)
+
+    route = respx.get(f"{BASE}/boards/board1/lists").mock(side_effect=slow_lists)
+    respx.post(f"{BASE}/lists").mock(
+        return_value=httpx.Response(200, json={"id": "list3", "name": "Done", "idBoard": "board1"})
+    )
+    before = asyncio.create_task(cached_client.list_lists("board1"))
+    await started.wait()
+    await cached_client.create_list("board1", "Done")
+    release.set()
+    assert len(await before) == 2
+    await cached_client.list_lists("board1")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_write_invalidates_cached_reads(cached_client):
+    route = respx.get(f"{BASE}/boards/board1/lists").mock(
+        return_value=httpx.Response(200, json=SAMPLE_LISTS)
+    )
+    respx.post(f"{BASE}/lists").mock(
+        return_value=httpx.Response(200, json={"id": "list3", "name": "Done", "idBoard": "board1"})
+    )
+    await cached_client.list_lists("board1")
+    await cached_client.create_list("board1", "Done")
+    await cached_client.list_lists("board1")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_expired_entry_revalidates_with_etag():
+    client = TrelloClient(
+        api_key="key", token="tok", cache=MemoryCache(), cache_ttls={"labels": 0}
+    )
+    respx.get(f"{BASE}/boards/board1").mock(
+        return_value=httpx.Response(200, json={"dateLastActivity": "2025-01-01T00:00:00.000Z"})
+    )
+    route = respx.get(f"{BASE}/boards/board1/labels").mock(
+        side_effect=[
+            httpx.Response(200, json=SAMPLE_LABELS, headers={"etag": 'W/"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+    await client.get_board_labels("board1")
+    labels = await client.get_board_labels("board1")
+    assert len(labels) == 2
+    assert route.calls[1].request.headers["if-none-match"] == 'W/"v1"'
+
+
+@respx.mock
+async def test_expired_entry_renewed_while_board_activity_unchanged():
+    client = TrelloClient(api_key="key", token="tok", cache=MemoryCache(), cache_ttls={"cards": 0})
+    activity = respx.get(f"{BASE}/boards/board1").mock(
+        return_value=httpx.Response(200, json={"dateLastActivity": "2025-01-01T00:00:00.000Z"})
+    )
+    route = respx.get(f"{BASE}/boards/board1/cards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_CARDS)
+    )
+    for _ in range(4):
+        cards = await client.get_board_cards("board1")
+    assert len(cards) == 2
+    # Fetched once, refetched once to record the activity, then renewed from it.
+    assert route.call_count == 2
+    assert activity.call_count == 1
+    assert activity.calls[0].request.url.params["fields"] == "dateLastActivity"
+
+
+@respx.mock
+async def test_card_writes_invalidate_cached_board_cards(cached_client):
+    route = respx.get(f"{BASE}/boards/board1/cards").mock(
+        return_value=httpx.Response(200, json=SAMPLE_CARDS)
+    )
+    respx.put(f"{BASE}/cards/card1").mock(
+        return_value=httpx.Response(200, json={**SAMPLE_CARDS[0], "idList": "list2"})
+    )
+    await cached_client.get_board_cards("board1")
+    await cached_client.move_card("card1", "list2")
+    await cached_client.get_board_cards("board1")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_cache_is_namespaced_by_credentials():
+    cache = MemoryCache()
+    route = respx.get(f"{BASE}/boards/board1/lists").mock(
+        return_value=httpx.Response(200, json=SAMPLE_LISTS)
+    )
+    await TrelloClient(api_key="key", token="alice", cache=cache).list_lists("board1")
+    await TrelloClient(api_key="key", token="bob", cache=cache).list_lists("board1")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_get_board_comments(mock_client):
+    route = respx.get(f"{BASE}/boards/board1/actions").mock(
+        return_value=httpx.Response(200, json=[{"data": {"text": "Hi"}}])
+    )
+    comments = await mock_client.get_board_comments("board1")
+    assert comments[0]["data"]["text"] == "Hi"
+    assert route.calls[0].request.url.params["filter"] == "commentCard"
+
+
+# --- Webhooks ---
+
+
+@respx.mock
+async def test_create_webhook(mock_client):
+    route = respx.post(f"{BASE}/webhooks").mock(
+        return_value=httpx.Response(
+            200,
+            json={"id": "wh1", "idModel": "board1", "callbackURL": "https://x/webhooks/trello"},
+        )
+    )
+    webhook = await mock_client.create_webhook("https://x/webhooks/trello", "board1", "mirror")
+    assert webhook.id == "wh1"
+    assert route.calls[0].request.url.params["idModel"] == "board1"
+
+
+@respx.mock
+async def test_list_webhooks(mock_client):
+    respx.get(f"{BASE}/tokens/tok/webhooks").mock(
+        return_value=httpx.Response(
+            200, json=[{"id": "wh1", "idModel": "board1", "callbackURL": "https://x/hook"}]
+        )
+    )
+    [webhook] = await mock_client.list_webhooks()
+    assert (webhook.id_model, webhook.callback_url) == ("board1", "https://x/hook")
+
+
+@respx.mock
+async def test_delete_webhook(mock_client):
+    respx.delete(f"{BASE}/webhooks/wh1").mock(return_value=httpx.Response(200))
+    await mock_client.delete_webhook("wh1")
+
+
+# --- Batch ---
+
+
+@respx.mock
+async def test_batch_get_chunks_and_maps_results(mock_client):
+    def handler(request):
+        urls = request.url.params["urls"].split(",")
+        body = [
+            {"404": "not found"} if u.endswith("missing") else {"200": {"route": u}} for u in urls
+        ]
+        return httpx.Response(200, json=body)
+
+    route = respx.get(f"{BASE}/batch").mock(side_effect=handler)
+    urls = [f"/cards/card{i}/checklists" for i in range(12)] + ["cards/missing"]
+    results = await mock_client.batch_get(urls)
+    assert route.call_count == 2
+    assert len(results) == 13
+    assert results[11] == {
+        "url": "/cards/card11/checklists",
+        "status": 200,
+        "data": {"route": "/cards/card11/checklists"},
+    }
+    assert results[12] == {"url": "/cards/missing", "status": 404, "error": "not found"}
+
+
+@respx.mock
+async def test_batch_get_reports_failed_chunk_per_route(mock_client):
+    respx.get(f"{BASE}/batch").mock(return_value=httpx.Response(400, json={"error": "bad"}))
+    results = await mock_client.batch_get(["/cards/a", "/cards/b"])
+    assert [r["status"] for r in results] == [400, 400]
+    assert all("error" in r for r in results)
+
+
+@respx.mock
+async def test_batch_get_encodes_commas_in_routes(mock_client):
+    def handler(request):
+        urls = request.url.params["urls"].split(",")
+        return httpx.Response(200, json=[{"200": {"route": u}} for u in urls])
+
+    route = respx.get(f"{BASE}/batch").mock(side_effect=handler)
+    results = await mock_client.batch_get(["/cards/a?fields=name,desc", "/cards/b"])
+    assert route.call_count == 1
+    assert results[0] == {
+        "url": "/cards/a?fields=name,desc",
+        "status": 200,
+        "data": {"route": "/cards/a?fields=name%2Cdesc"},
+    }
+
+
+@respx.mock
+async def test_batch_get_reports_a_short_response_per_route(mock_client):
+    respx.get(f"{BASE}/batch").mock(return_value=httpx.Response(200, json=[{"200": {}}]))
+    results = await mock_client.batch_get(["/cards/a", "/cards/b"])
+    assert [r["status"] for r in results] == [None, None]
+    assert results[0]["error"] == "/batch returned 1 results for 2 routes"
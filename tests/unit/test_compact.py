@@ -0,0 +1,63 @@
+"""Tests for the compact card store."""
+
+from tests.conftest import SAMPLE_CARDS
+from trello_mcp.compact import CardStore
+from trello_mcp.models import TrelloCard
+
+BUG = {"id": "lbl1", "idBoard": "board1", "name": "Bug", "color": "red"}
+UI = {"id": "lbl2", "idBoard": "board1", "name": "UI", "color": "blue"}
+
+
+def _card(card_id: str, list_id: str = "list1", labels: list[dict] | None = None) -> TrelloCard:
+    return TrelloCard(
+        id=card_id,
+        name=card_id,
+        idList=list_id,
+        idBoard="board1",
+        labels=labels or [],
+        due="2025-12-31T12:00:00.000Z",
+    )
+
+
+def test_round_trips_cards():
+    cards = [TrelloCard(**c) for c in SAMPLE_CARDS] + [_card("card3", labels=[BUG, UI])]
+    store = CardStore(cards)
+    assert len(store) == 3
+    assert [store.get(c.id) for c in cards] == cards
+    assert store.get("missing") is None
+
+
+def test_shares_repeated_ids_and_labels():
+    store = CardStore([_card("a", labels=[BUG]), _card("b", labels=[BUG])])
+    a, b = store.record("a"), store.record("b")
+    assert a.id_list is b.id_list
+    assert a.label_ids[0] is b.label_ids[0]
+    assert len(store._labels) == 1
+
+
+def test_returned_labels_are_copies():
+    store = CardStore([_card("a", labels=[BUG])])
+    store.get("a").labels[0]["name"] = "Changed"
+    assert store.get("a").labels[0]["name"] == "Bug"
+
+
+def test_put_replaces_and_pop_removes():
+    store = CardStore([_card("a")])
+    store.put(_card("a", list_id="list2"))
+    assert store.get("a").id_list == "list2"
+    assert store.pop("a").id == "a"
+    assert "a" not in store
+    assert store.pop("a") is None
+
+
+def test_remove_list():
+    store = CardStore([_card("a"), _card("b", list_id="list2")])
+    store.remove_list("list1")
+    assert list(store) == ["b"]
+
+
+def test_drop_label():
+    store = CardStore([_card("a", labels=[BUG, UI]), _card("b", labels=[UI])])
+    store.drop_label("lbl2")
+    assert store.get("a").labels == [BUG]
+    assert store.get("b").labels == []
@@ -0,0 +1,24 @@
+"""Tests for the bundled documentation loader."""
+
+import hashlib
+
+from trello_mcp.docs import load_doc, section_slug, split_sections
+
+
+def test_section_slug():
+    assert section_slug("Error Responses (429)") == "error-responses-429"
+
+
+def test_split_sections_keeps_subsections_with_their_parent():
+    text = "# Title\n\nIntro\n\n## First\n\nOne\n\n### Detail\n\nMore\n\n## Second\n\nTwo\n"
+    sections = split_sections(text)
+    assert list(sections) == ["first", "second"]
+    assert sections["first"].endswith("More")
+    assert sections["second"] == "## Second\n\nTwo"
+
+
+def test_load_doc_is_memoized_and_hashed():
+    doc = load_doc("rate-limits")
+    assert load_doc("rate-limits") is doc
+    assert doc.sha256 == hashlib.sha256(doc.text.encode()).hexdigest()
+    assert "error-responses" in doc.sections
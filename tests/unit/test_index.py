@@ -0,0 +1,54 @@
+"""Tests for the board-name index."""
+
+from trello_mcp.index import BoardIndex, normalize, tokenize
+from trello_mcp.models import TrelloBoard
+
+
+def boards(*names: str) -> list[TrelloBoard]:
+    return [TrelloBoard(id=f"b{i}", name=name) for i, name in enumerate(names)]
+
+
+def names(results: list[TrelloBoard]) -> list[str]:
+    return [b.name for b in results]
+
+
+def test_normalize_strips_case_and_accents():
+    assert normalize("Café ÉTÉ") == "cafe ete"
+    assert tokenize("Q3-Roadmap (draft)") == ["q3", "roadmap", "draft"]
+
+
+class TestBoardIndex:
+    def test_ranks_exact_then_prefix_then_word_then_substring(self):
+        index = BoardIndex()
+        index.update(boards("Team Alpha", "Alpha", "Alphabet Soup", "Betalpha"))
+        assert names(index.search("alpha")) == ["Alpha", "Alphabet Soup", "Team Alpha", "Betalpha"]
+
+    def test_multi_word_prefix_query(self):
+        index = BoardIndex()
+        index.update(boards("Project Alpha", "Project Beta", "Alpha Project Plan"))
+        assert names(index.search("proj alp")) == ["Alpha Project Plan", "Project Alpha"]
+
+    def test_fuzzy_fallback(self):
+        index = BoardIndex()
+        index.update(boards("Marketing", "Engineering"))
+        assert names(index.search("enginering")) == ["Engineering"]
+
+    def test_limit(self):
+        index = BoardIndex()
+        index.update(boards("A1", "A2", "A3"))
+        assert len(index.search("a", limit=2)) == 2
+
+    def test_incremental_update_handles_renames_and_removals(self):
+        index = BoardIndex()
+        index.update(boards("Old Name", "Other"))
+        index.update([TrelloBoard(id="b0", name="New Name")])
+        assert len(index) == 1
+        assert index.search("old") == []
+        assert names(index.search("new")) == ["New Name"]
+
+    def test_staleness(self):
+        index = BoardIndex(ttl=0)
+        assert index.stale
+        index = BoardIndex(ttl=60)
+        index.update([])
+        assert not index.stale
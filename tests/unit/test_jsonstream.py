@@ -0,0 +1,36 @@
+"""Tests for incremental JSON array parsing."""
+
+import json
+
+import pytest
+
+from trello_mcp.jsonstream import iter_array_items
+
+
+async def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def collect(data: bytes, size: int) -> list:
+    return [item async for item in iter_array_items(chunked(data, size))]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1024])
+async def test_yields_items_across_chunk_boundaries(size):
+    items = [{"id": str(i), "name": f"Café ☕ {i}", "labels": [{"n": i}]} for i in range(5)]
+    assert await collect(json.dumps(items).encode(), size) == items
+
+
+async def test_empty_array():
+    assert await collect(b" [ ] ", 2) == []
+
+
+async def test_rejects_non_array():
+    with pytest.raises(ValueError, match="expected a JSON array"):
+        await collect(b'{"id": 1}', 4)
+
+
+async def test_rejects_truncated_array():
+    with pytest.raises(ValueError, match="truncated"):
+        await collect(b'[{"id": 1}, {"id"', 4)
@@ -0,0 +1,78 @@
+"""Tests for the in-process metrics."""
+
+import pytest
+
+from trello_mcp.metrics import Histogram, Metrics, route_label
+
+
+def test_route_label_folds_ids():
+    card = "5f0c1a2b3c4d5e6f7a8b9c0d"
+    assert route_label(f"/cards/{card}/actions") == "/cards/{id}/actions"
+    assert route_label(f"/boards/{card}") == "/boards/{id}"
+    assert route_label("/members/me/boards") == "/members/me/boards"
+    assert route_label("/tokens/s3cret/webhooks") == "/tokens/{token}/webhooks"
+    assert route_label("/boards/AbCd1234/lists") == "/boards/{id}/lists"
+    assert route_label("/cards/xYz98765") == "/cards/{id}"
+    assert route_label(f"/checklists/{card}/checkItems/{card}") == (
+        "/checklists/{id}/checkItems/{id}"
+    )
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        h = Histogram((0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            h.observe(value)
+        assert h.counts == [1, 2]
+        assert h.count == 3
+        assert h.sum == pytest.approx(5.55)
+
+    def test_quantile(self):
+        h = Histogram((0.1, 1.0))
+        assert h.quantile(0.5) is None
+        for value in (0.05, 0.05, 0.5, 5.0):
+            h.observe(value)
+        assert h.quantile(0.5) == 0.1
+        assert h.quantile(0.75) == 1.0
+        assert h.quantile(0.99) == 1.0
+
+
+class TestMetrics:
+    def test_snapshot(self):
+        metrics = Metrics()
+        metrics.observe_tool("list_cards", 0.02)
+        metrics.observe_tool("list_cards", 0.04, error=True)
+        metrics.observe_request("GET", "/lists/abc/cards", 200, 0.01, received=100)
+        metrics.observe_request("PUT", "/cards/abc", None, 5.0, sent=20)
+        metrics.observe_cache("miss")
+        metrics.observe_cache("revalidated")
+        snapshot = metrics.snapshot()
+        assert snapshot["tools"]["list_cards"]["calls"] == 2
+        assert snapshot["tools"]["list_cards"]["errors"] == 1
+        assert snapshot["tools"]["list_cards"]["mean_seconds"] == pytest.approx(0.03)
+        assert snapshot["upstream"]["statuses"] == {"200": 1, "error": 1}
+        assert snapshot["upstream"]["bytes_sent"] == 20
+        assert snapshot["upstream"]["bytes_received"] == 100
+        assert snapshot["cache"]["hit_ratio"] == 0.5
+
+    def test_headroom_ignores_missing_and_malformed_headers(self):
+        metrics = Metrics()
+        metrics.observe_headroom({"x-rate-limit-api-key-remaining": "280"})
+        metrics.observe_headroom({"x-rate-limit-api-token-remaining": "n/a"})
+        assert metrics.rate_limit_remaining == {"api-key": 280}
+
+    def test_render_prometheus_text(self):
+        metrics = Metrics()
+        metrics.observe_tool('odd"name', 0.02)
+        metrics.observe_request("GET", "/boards/5f0c1a2b3c4d5e6f7a8b9c0d", 429, 0.2)
+        metrics.observe_retry("429")
+        text = metrics.render()
+        assert "# TYPE trello_mcp_tool_duration_seconds histogram" in text
+        assert 'trello_mcp_tool_calls_total{tool="odd\\"name",outcome="ok"} 1' in text
+        assert 'trello_mcp_tool_duration_seconds_bucket{tool="odd\\"name",le="+Inf"} 1' in text
+        assert (
+            'trello_mcp_upstream_requests_total{method="GET",route="/boards/{id}",status="429"} 1'
+            in text
+        )
+        assert 'trello_mcp_upstream_retries_total{reason="429"} 1' in text
+        assert text.endswith("\n")
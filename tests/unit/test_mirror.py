@@ -0,0 +1,216 @@
+"""Tests for webhook-driven board mirrors."""
+
+import base64
+import hashlib
+import hmac
+from unittest.mock import AsyncMock
+
+from tests.conftest import SAMPLE_BOARD_SNAPSHOT
+from trello_mcp.mirror import BoardMirror, MirrorRegistry, verify_signature
+from trello_mcp.models import TrelloBoardSnapshot, TrelloCard, TrelloWebhook
+
+
+def make_mirror() -> BoardMirror:
+    return BoardMirror(TrelloBoardSnapshot(**SAMPLE_BOARD_SNAPSHOT))
+
+
+def action(kind: str, action_id: str = "a1", **data) -> dict:
+    return {"id": action_id, "type": kind, "data": {"board": {"id": "board1"}, **data}}
+
+
+def test_loads_snapshot():
+    mirror = make_mirror()
+    assert mirror.board_id == "board1"
+    assert [lst.id for lst in mirror.lists()] == ["list1", "list2"]
+    assert len(mirror.cards("list1")) == 2
+    assert mirror.checklists("card1")[0].id == "cl1"
+    assert not mirror.stale
+
+
+def test_created_card_from_elsewhere_triggers_resync():
+    mirror = make_mirror()
+    mirror.apply(
+        action("createCard", "a1", card={"id": "card3", "name": "New"}, list={"id": "list2"})
+    )
+    assert mirror.stale
+    assert not mirror.has_card("card3")
+
+
+def test_create_action_after_write_result_keeps_the_full_card():
+    mirror = make_mirror()
+    mirror.put(
+        TrelloCard(
+            id="card3",
+            name="New",
+            desc="Details",
+            url="https://trello.com/c/card3",
+            due="2026-01-01T00:00:00.000Z",
+            idList="list2",
+            idBoard="board1",
+        )
+    )
+    mirror.apply(
+        action(
+            "createCard",
+            "a1",
+            card={"id": "card3", "name": "New", "idShort": 7, "shortLink": "AbCd1234"},
+            list={"id": "list2"},
+        )
+    )
+    [card] = mirror.cards("list2")
+    assert (card.desc, card.url, card.due) == (
+        "Details",
+        "https://trello.com/c/card3",
+        "2026-01-01T00:00:00.000Z",
+    )
+    assert not mirror.stale
+
+
+def test_update_and_delete_card():
+    mirror = make_mirror()
+    mirror.put(TrelloCard(id="card3", name="New", idList="list2", idBoard="board1"))
+    mirror.apply(
+        action(
+            "updateCard",
+            "a2",
+            card={"id": "card3", "idList": "list1", "dueComplete": True},
+            old={"idList": "list2", "dueComplete": False},
+        )
+    )
+    card = next(c for c in mirror.cards("list1") if c.id == "card3")
+    assert card.due_complete is True
+    mirror.apply(action("deleteCard", "a3", card={"id": "card3"}))
+    assert not mirror.has_card("card3")
+
+
+def test_archived_cards_are_hidden():
+    mirror = make_mirror()
+    mirror.apply(action("updateCard", card={"id": "card1", "closed": True}, old={"closed": False}))
+    assert [c.id for c in mirror.cards()] == ["card2"]
+
+
+def test_labels_on_cards():
+    mirror = make_mirror()
+    label = {"id": "lbl1", "name": "Bug", "color": "red"}
+    mirror.apply(action("addLabelToCard", "a1", card={"id": "card1"}, label=label))
+    mirror.apply(action("addLabelToCard", "a2", card={"id": "card2"}, label=label))
+    mirror.apply(action("removeLabelFromCard", "a3", card={"id": "card2"}, label=label))
+    assert [c.labels for c in mirror.cards()] == [[label], []]
+    mirror.apply(action("deleteLabel", "a4", label={"id": "lbl1"}))
+    assert mirror.cards()[0].labels == []
+    assert [lbl.id for lbl in mirror.labels()] == ["lbl2"]
+
+
+def test_lists_and_check_items():
+    mirror = make_mirror()
+    mirror.apply(action("createList", "a1", list={"id": "list3", "name": "Done"}))
+    mirror.apply(
+        action("updateList", "a2", list={"id": "list1", "closed": True}, old={"closed": False})
+    )
+    assert [lst.id for lst in mirror.lists()] == ["list2", "list3"]
+    mirror.apply(
+        action(
+            "updateCheckItemStateOnCard",
+            "a3",
+            checklist={"id": "cl1"},
+            checkItem={"id": "ci1", "state": "complete"},
+        )
+    )
+    assert mirror.checklists("card1")[0].check_items[0].state == "complete"
+
+
+def test_unknown_reference_marks_gap():
+    mirror = make_mirror()
+    mirror.apply(action("updateCard", card={"id": "nope", "name": "x"}, old={"name": "y"}))
+    assert mirror.stale
+
+
+def test_resync_action_marks_gap():
+    mirror = make_mirror()
+    mirror.apply(action("copyCard", card={"id": "card9"}))
+    assert mirror.stale
+
+
+def test_duplicate_deliveries_are_ignored():
+    mirror = make_mirror()
+    rename = action("updateCard", "a1", card={"id": "card1", "name": "One"}, old={"name": ""})
+    mirror.apply(rename)
+    mirror.apply(
+        action("updateCard", "a2", card={"id": "card1", "name": "Two"}, old={"name": "One"})
+    )
+    mirror.apply(rename)
+    assert next(c.name for c in mirror.cards() if c.id == "card1") == "Two"
+
+
+def test_put_reflects_local_writes():
+    mirror = make_mirror()
+    mirror.put(TrelloCard(id="card1", name="Renamed", idList="list2", idBoard="board1"))
+    assert [c.name for c in mirror.cards("list2")] == ["Renamed"]
+
+
+def test_card_index_is_kept_until_the_mirror_changes():
+    mirror = make_mirror()
+    index = mirror.card_index()
+    assert mirror.card_index() is index
+    mirror.put(TrelloCard(id="card1", name="Renamed", idList="list2", idBoard="board1"))
+    assert [c.name for c in mirror.card_index().query(list_ids=["list2"])] == ["Renamed"]
+    index = mirror.card_index()
+    mirror.apply(action("updateCard", card={"id": "card1", "name": "Again"}, old={"name": "x"}))
+    assert mirror.card_index() is not index
+
+
+def test_verify_signature():
+    body, url = b'{"action": {}}', "https://example.com/webhooks/trello"
+    digest = hmac.new(b"secret", body + url.encode(), hashlib.sha1).digest()
+    signature = base64.b64encode(digest).decode()
+    assert verify_signature("secret", body, url, signature)
+    assert not verify_signature("other", body, url, signature)
+
+
+class TestMirrorRegistry:
+    def client(self) -> AsyncMock:
+        client = AsyncMock()
+        client.create_webhook.return_value = TrelloWebhook(id="wh1", idModel="board1")
+        client.list_webhooks.return_value = []
+        client.get_board_snapshot.return_value = TrelloBoardSnapshot(**SAMPLE_BOARD_SNAPSHOT)
+        return client
+
+    async def test_track_registers_webhook_then_snapshots(self):
+        registry, client = MirrorRegistry(), self.client()
+        await registry.track(client, "board1", "https://example.com/webhooks/trello")
+        assert "board1" in registry
+        assert client.create_webhook.await_args.args[:2] == (
+            "https://example.com/webhooks/trello",
+            "board1",
+        )
+        assert registry.board_for_list("list2") == "board1"
+        assert registry.board_for_card("card1") == "board1"
+
+    async def test_track_reuses_a_webhook_left_by_an_earlier_run(self):
+        registry, client = MirrorRegistry(), self.client()
+        url = "https://example.com/webhooks/trello"
+        client.list_webhooks.return_value = [
+            TrelloWebhook(id="other", idModel="board2", callbackURL=url),
+            TrelloWebhook(id="wh0", idModel="board1", callbackURL=url),
+        ]
+        await registry.track(client, "board1", url)
+        client.create_webhook.assert_not_awaited()
+        await registry.untrack(client, "board1")
+        client.delete_webhook.assert_awaited_once_with("wh0")
+
+    async def test_handle_routes_payload_and_resyncs_after_gap(self):
+        registry, client = MirrorRegistry(), self.client()
+        await registry.track(client, "board1", "https://example.com/webhooks/trello")
+        registry.handle(
+            {"action": action("copyCard", card={"id": "x"}), "model": {"id": "board1"}}
+        )
+        mirror = await registry.get(client, "board1")
+        assert client.get_board_snapshot.await_count == 2
+        assert not mirror.stale
+
+    async def test_untrack_deletes_webhook(self):
+        registry, client = MirrorRegistry(), self.client()
+        await registry.track(client, "board1", "https://example.com/webhooks/trello")
+        await registry.untrack(client, "board1")
+        assert "board1" not in registry
+        client.delete_webhook.assert_awaited_once_with("wh1")
@@ -1,13 +1,20 @@
 """Tests for Pydantic models."""
 
+import json
+
+from tests.conftest import SAMPLE_BOARD_SNAPSHOT, SAMPLE_CARDS
 from trello_mcp.models import (
     TrelloBoard,
+    TrelloBoardSnapshot,
     TrelloCard,
     TrelloCheckItem,
     TrelloChecklist,
     TrelloCustomField,
     TrelloLabel,
     TrelloList,
+    api_fields,
+    field_names,
+    list_adapter,
 )
 
 
@@ -116,3 +123,52 @@ class TestTrelloCustomField:
         cf = TrelloCustomField(id="cf1", name="Priority")
         assert cf.type == ""
         assert cf.id_model == ""
+
+
+class TestTrelloBoardSnapshot:
+    def test_from_nested_response(self):
+        snapshot = TrelloBoardSnapshot(**SAMPLE_BOARD_SNAPSHOT)
+        assert snapshot.name == "Project Alpha"
+        assert len(snapshot.lists) == 2
+        assert len(snapshot.custom_fields) == 2
+
+    def test_id_lookups(self):
+        snapshot = TrelloBoardSnapshot(**SAMPLE_BOARD_SNAPSHOT)
+        assert snapshot.cards_by_id["card2"].name == "Task 2"
+        assert snapshot.lists_by_id["list2"].name == "In Progress"
+        assert snapshot.labels_by_id["lbl1"].color == "red"
+        assert [c.id for c in snapshot.cards_by_list["list1"]] == ["card1", "card2"]
+        assert snapshot.checklists_by_card["card1"][0].id == "cl1"
+
+    def test_lookups_are_not_serialized(self):
+        snapshot = TrelloBoardSnapshot(**SAMPLE_BOARD_SNAPSHOT)
+        _ = snapshot.cards_by_id
+        assert "cards_by_id" not in snapshot.model_dump()
+
+
+class TestFieldProjection:
+    def test_defaults_to_declared_fields(self):
+        assert api_fields(TrelloList) == "name,idBoard,closed"
+
+    def test_nested_models_are_excluded(self):
+        assert api_fields(TrelloChecklist) == "name,idCard"
+        assert api_fields(TrelloChecklist, ["check_items"]) == "name"
+
+    def test_requested_fields_keep_required_ones(self):
+        assert api_fields(TrelloCard, ["due_complete", "idList"]) == "name,dueComplete,idList"
+
+    def test_field_names_accepts_both_spellings(self):
+        assert field_names(TrelloCard, ["idList", "due"]) == {"id", "id_list", "due"}
+
+
+class TestListAdapter:
+    def test_is_built_once_per_model(self):
+        assert list_adapter(TrelloCard) is list_adapter(TrelloCard)
+
+    def test_validates_raw_json_like_the_constructor(self):
+        cards = list_adapter(TrelloCard).validate_json(json.dumps(SAMPLE_CARDS))
+        assert cards == [TrelloCard(**c) for c in SAMPLE_CARDS]
+
+    def test_dump_matches_model_dump(self):
+        cards = [TrelloCard(**c) for c in SAMPLE_CARDS]
+        assert list_adapter(TrelloCard).dump_python(cards) == [c.model_dump() for c in cards]
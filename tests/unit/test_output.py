@@ -0,0 +1,83 @@
+"""Tests for list output budgets."""
+
+import pytest
+
+from trello_mcp.models import TrelloCard, TrelloChecklist
+from trello_mcp.output import OutputBudget
+
+ITEMS = [{"id": f"c{i}", "desc": "x" * 100} for i in range(10)]
+
+
+def test_everything_fits_without_continuation():
+    assert OutputBudget().apply(ITEMS) == ITEMS
+
+
+def test_item_budget_and_resume():
+    budget = OutputBudget(max_items=4)
+    page = budget.apply(ITEMS)
+    assert [item["id"] for item in page[:-1]] == ["c0", "c1", "c2", "c3"]
+    assert page[-1]["remaining"] == 6
+    page = budget.resume(page[-1]["continuation"])
+    assert len(page) == 5
+    assert [item["id"] for item in budget.resume(page[-1]["continuation"])] == ["c8", "c9"]
+
+
+def test_continuations_can_be_disabled():
+    page = OutputBudget(max_items=4, continuations=False).apply(ITEMS)
+    assert page[-1] == {"continuation": None, "remaining": 6}
+
+
+def test_item_budget_alone_skips_serialization(monkeypatch):
+    monkeypatch.setattr("pydantic_core.to_json", None)
+    budget = OutputBudget(max_bytes=0, max_items=4, desc_chars=10)
+    page = budget.apply(ITEMS)
+    assert [item["id"] for item in page[:-1]] == ["c0", "c1", "c2", "c3"]
+    assert page[0]["desc"] == "x" * 10 + "…"
+    assert len(budget.resume(page[-1]["continuation"])) == 5
+    assert OutputBudget(max_bytes=0, max_items=0).apply(ITEMS) == ITEMS
+
+
+def test_byte_budget_counts_serialized_size():
+    page = OutputBudget(max_bytes=400).apply(ITEMS)
+    assert len(page) == 4  # three ~120-byte items plus the continuation
+    assert "continuation" in page[-1]
+
+
+def test_oversized_item_is_still_returned():
+    page = OutputBudget(max_bytes=10).apply(ITEMS[:1])
+    assert page == ITEMS[:1]
+
+
+def test_descriptions_are_truncated():
+    page = OutputBudget(desc_chars=5).apply(ITEMS[:1])
+    assert page[0]["desc"] == "xxxxx…"
+    assert ITEMS[0]["desc"] == "x" * 100
+    assert OutputBudget(desc_chars=5).shorten(ITEMS[:1]) == page
+
+
+def test_handles_are_single_use_and_expire():
+    budget = OutputBudget(max_items=1, ttl=0)
+    handle = budget.apply(ITEMS)[-1]["continuation"]
+    with pytest.raises(KeyError):
+        budget.resume(handle)
+    budget = OutputBudget(max_items=1)
+    handle = budget.apply(ITEMS)[-1]["continuation"]
+    budget.resume(handle)
+    with pytest.raises(KeyError):
+        budget.resume(handle)
+
+
+def test_pending_outputs_are_capped():
+    budget = OutputBudget(max_items=1, max_pending=2)
+    first = budget.apply(ITEMS)[-1]["continuation"]
+    budget.apply(ITEMS)
+    budget.apply(ITEMS)
+    with pytest.raises(KeyError):
+        budget.resume(first)
+
+
+def test_compact_profile_only_fills_in_missing_fields():
+    budget = OutputBudget(compact=True)
+    assert "desc" not in budget.fields(TrelloCard, None)
+    assert budget.fields(TrelloCard, ["desc"]) == ["desc"]
+    assert OutputBudget().fields(TrelloChecklist, None) is None
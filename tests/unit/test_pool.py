@@ -0,0 +1,61 @@
+"""Tests for the per-credential client pool."""
+
+import httpx
+import respx
+
+from tests.conftest import SAMPLE_BOARDS
+from trello_mcp.cache import MemoryCache
+from trello_mcp.client import tenant_id
+from trello_mcp.pool import ClientPool
+
+BASE = "https://api.trello.com/1"
+
+
+def test_tenant_id_hides_credentials():
+    assert tenant_id("key", "tok") == tenant_id("key", "tok")
+    assert tenant_id("key", "tok") != tenant_id("key", "tok2")
+    assert "tok" not in tenant_id("key", "tok")
+    assert ClientPool().get("key", "tok").namespace == tenant_id("key", "tok")
+
+
+async def test_clients_are_reused_and_share_the_connection_pool():
+    pool = ClientPool()
+    first = pool.get("key", "tok1")
+    assert pool.get("key", "tok1") is first
+    second = pool.get("key", "tok2")
+    assert second is not first
+    assert first._client is second._client is pool.http
+    assert first._limiter is second._limiter
+    key_a, token_a = first._limiter.buckets("key", "tok1")
+    key_b, token_b = second._limiter.buckets("key", "tok2")
+    assert key_a is key_b
+    assert token_a is not token_b
+    await first.close()
+    assert not pool.http.is_closed
+    await pool.close()
+    assert pool.http.is_closed
+
+
+def test_least_recently_used_client_is_evicted():
+    pool = ClientPool(max_clients=2)
+    a = pool.get("key", "a")
+    pool.get("key", "b")
+    pool.get("key", "a")
+    pool.get("key", "c")
+    assert len(pool) == 2
+    assert pool.get("key", "a") is a
+    assert len(pool) == 2
+
+
+@respx.mock
+async def test_tenants_do_not_share_cached_responses():
+    def handler(request):
+        token = request.url.params["token"]
+        return httpx.Response(200, json=SAMPLE_BOARDS[:1] if token == "a" else SAMPLE_BOARDS)
+
+    route = respx.get(f"{BASE}/members/me/boards").mock(side_effect=handler)
+    pool = ClientPool(cache=MemoryCache())
+    assert len(await pool.get("key", "a").list_boards()) == 1
+    assert len(await pool.get("key", "b").list_boards()) == 2
+    assert len(await pool.get("key", "a").list_boards()) == 1
+    assert route.call_count == 2
@@ -0,0 +1,72 @@
+"""Tests for the server-side card query engine."""
+
+import pytest
+
+from trello_mcp.models import TrelloCard
+from trello_mcp.query import CardIndex, group_cards, sort_cards
+
+BUG = {"id": "lbl1", "name": "Bug", "color": "red"}
+UI = {"id": "lbl2", "name": "UI", "color": "blue"}
+
+
+@pytest.fixture
+def cards():
+    return [
+        TrelloCard(id="c1", name="Fix login", idList="todo", labels=[BUG], due="2025-03-01"),
+        TrelloCard(
+            id="c2",
+            name="Redesign header",
+            desc="New café logo",
+            idList="todo",
+            labels=[UI],
+            due="2025-01-15T09:00:00.000Z",
+            dueComplete=True,
+        ),
+        TrelloCard(id="c3", name="Crash on save", idList="doing", labels=[BUG, UI]),
+        TrelloCard(id="c4", name="Old idea", idList="todo", closed=True),
+    ]
+
+
+def _ids(cards):
+    return sorted(c.id for c in cards)
+
+
+def test_defaults_to_open_cards(cards):
+    assert _ids(CardIndex(cards).query()) == ["c1", "c2", "c3"]
+    assert _ids(CardIndex(cards).query(closed=None)) == ["c1", "c2", "c3", "c4"]
+
+
+def test_list_and_label_filters_match_any_and_combine(cards):
+    index = CardIndex(cards)
+    assert _ids(index.query(list_ids=["todo", "doing"])) == ["c1", "c2", "c3"]
+    assert _ids(index.query(label_ids=["lbl1"])) == ["c1", "c3"]
+    assert _ids(index.query(list_ids=["todo"], label_ids=["lbl1"])) == ["c1"]
+    assert index.query(list_ids=["missing"]) == []
+
+
+def test_due_range_and_completion(cards):
+    index = CardIndex(cards)
+    assert _ids(index.query(due_after="2025-02-01")) == ["c1"]
+    assert _ids(index.query(due_before="2025-02-01")) == ["c2"]
+    assert _ids(index.query(due_after="2025-01-15", due_before="2025-03-02")) == ["c1", "c2"]
+    assert _ids(index.query(due_complete=False)) == ["c1", "c3"]
+
+
+def test_text_matches_name_or_desc_ignoring_case_and_accents(cards):
+    index = CardIndex(cards)
+    assert _ids(index.query(text="CAFE")) == ["c2"]
+    assert _ids(index.query(text="crash")) == ["c3"]
+
+
+def test_sort_by_due_puts_undated_last(cards):
+    open_cards = cards[:3]
+    assert [c.id for c in sort_cards(open_cards, "due")] == ["c2", "c1", "c3"]
+    assert [c.id for c in sort_cards(open_cards, "due", descending=True)] == ["c1", "c2", "c3"]
+    assert [c.id for c in sort_cards(open_cards, "name")] == ["c3", "c1", "c2"]
+
+
+def test_group_by_label_repeats_multi_label_cards(cards):
+    groups = group_cards(cards, "label")
+    assert [c.id for c in groups["lbl2"]] == ["c2", "c3"]
+    assert [c.id for c in groups[""]] == ["c4"]
+    assert list(group_cards(cards, "list")) == ["todo", "doing"]
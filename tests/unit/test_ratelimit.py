@@ -0,0 +1,126 @@
+"""Tests for the client-side rate limiter."""
+
+import pytest
+
+from trello_mcp.ratelimit import RateLimiter, SharedTokenBucket, TokenBucket, open_shared_state
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_spends_and_refills(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2, 1.0, clock=clock)
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert bucket.try_acquire() == 0
+
+    def test_sync_caps_tokens_at_remaining(self):
+        bucket = TokenBucket(100, 10.0, clock=FakeClock())
+        bucket.sync(limit=50, remaining=3, interval_ms=5000)
+        assert bucket.capacity == 50
+        assert bucket.interval == 5.0
+        assert bucket.available == 3
+
+    def test_drain(self):
+        bucket = TokenBucket(10, 1.0, clock=FakeClock())
+        bucket.drain()
+        assert bucket.available == 0
+
+    async def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(1, 0.05)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.available < 1
+
+
+class TestSharedTokenBucket:
+    def test_instances_on_one_file_share_tokens(self, tmp_path):
+        path = str(tmp_path / "limits.db")
+        clock = FakeClock()
+        first = SharedTokenBucket(open_shared_state(path), "token:a", 2, 1.0, clock=clock)
+        second = SharedTokenBucket(open_shared_state(path), "token:a", 2, 1.0, clock=clock)
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 0
+        assert first.try_acquire() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert second.try_acquire() == 0
+
+    def test_sync_and_drain_are_shared(self, tmp_path):
+        path = str(tmp_path / "limits.db")
+        clock = FakeClock()
+        first = SharedTokenBucket(open_shared_state(path), "key:a", 100, 10.0, clock=clock)
+        second = SharedTokenBucket(open_shared_state(path), "key:a", 100, 10.0, clock=clock)
+        first.sync(limit=50, remaining=3, interval_ms=5000)
+        assert second.available == 3
+        assert second.capacity == 50
+        second.drain()
+        assert first.available == 0
+
+    def test_names_are_independent(self, tmp_path):
+        db = open_shared_state(str(tmp_path / "limits.db"))
+        SharedTokenBucket(db, "token:a", 1, 10.0).drain()
+        assert SharedTokenBucket(db, "token:b", 1, 10.0).try_acquire() == 0
+
+
+class TestRateLimiter:
+    def test_shared_path_spans_limiters(self, tmp_path):
+        path = str(tmp_path / "limits.db")
+        _, token_a = RateLimiter(shared_path=path).buckets("key", "s3cret")
+        _, token_b = RateLimiter(shared_path=path).buckets("key", "s3cret")
+        assert isinstance(token_a, SharedTokenBucket)
+        assert "s3cret" not in token_a.name
+        token_a.drain()
+        assert token_b.available < 1
+
+    def test_buckets_are_shared_per_key_and_token(self):
+        limiter = RateLimiter()
+        key_a, token_a = limiter.buckets("key", "tok1")
+        key_b, token_b = limiter.buckets("key", "tok2")
+        assert key_a is key_b
+        assert token_a is not token_b
+        assert key_a.capacity == 300
+        assert token_a.capacity == 100
+
+    def test_observe_headers(self):
+        limiter = RateLimiter()
+        limiter.observe(
+            "key",
+            "tok",
+            {
+                "x-rate-limit-api-token-max": "100",
+                "x-rate-limit-api-token-remaining": "7",
+                "x-rate-limit-api-token-interval-ms": "10000",
+                "x-rate-limit-api-key-remaining": "250",
+            },
+        )
+        key_bucket, token_bucket = limiter.buckets("key", "tok")
+        assert token_bucket.available <= 7.1
+        assert key_bucket.available <= 250.1
+
+    def test_throttled_drains_matching_bucket(self):
+        limiter = RateLimiter()
+        limiter.throttled("key", "tok", '{"error": "API_KEY_LIMIT_EXCEEDED"}')
+        key_bucket, token_bucket = limiter.buckets("key", "tok")
+        assert key_bucket.available < 1
+        assert token_bucket.available > 99
+
+    def test_backoff_has_jitter_within_cap(self):
+        limiter = RateLimiter(backoff_base=1.0, backoff_cap=4.0)
+        for attempt in range(6):
+            assert 0 <= limiter.backoff(attempt) <= 4.0
+
+    def test_backoff_honours_retry_after(self):
+        assert RateLimiter().backoff(0, "2") == 2.0
+
+    def test_retry_after_is_capped(self):
+        assert RateLimiter(backoff_cap=30.0).backoff(0, "86400") == 30.0
+        assert RateLimiter(backoff_cap=30.0).backoff(0, "inf") == 30.0
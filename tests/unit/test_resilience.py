@@ -0,0 +1,78 @@
+"""Tests for retry policies and the circuit breaker."""
+
+import httpx
+import pytest
+
+from trello_mcp.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryPolicy:
+    def test_idempotent_methods_retry_transport_errors_and_gateway_statuses(self):
+        policy = RetryPolicy()
+        assert policy.retries_error("GET", httpx.ReadTimeout("slow"))
+        assert policy.retries_error("DELETE", httpx.RemoteProtocolError("reset"))
+        assert policy.retries_status("PUT", 503)
+        assert not policy.retries_status("GET", 404)
+
+    def test_posts_retry_only_unsent_requests(self):
+        policy = RetryPolicy()
+        assert policy.retries_error("POST", httpx.ConnectError("refused"))
+        assert policy.retries_error("POST", httpx.PoolTimeout("busy"))
+        assert not policy.retries_error("POST", httpx.ReadTimeout("slow"))
+        assert not policy.retries_status("POST", 502)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=4.0)
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt) <= 4.0
+        assert policy.backoff(0, "3") == 3.0
+        assert policy.backoff(0, "120") == 4.0
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=FakeClock())
+        breaker.failure("h")
+        breaker.failure("h")
+        breaker.success("h")
+        breaker.failure("h")
+        breaker.failure("h")
+        breaker.check("h")
+        breaker.failure("h")
+        assert breaker.is_open("h")
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.check("h")
+        assert excinfo.value.retry_in == 10
+        breaker.check("other")
+
+    def test_probe_after_timeout(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.failure("h")
+        clock.now = 10
+        breaker.check("h")  # the probe
+        with pytest.raises(CircuitOpenError):
+            breaker.check("h")  # everyone else waits for it
+        breaker.failure("h")
+        clock.now = 15
+        with pytest.raises(CircuitOpenError):
+            breaker.check("h")
+        clock.now = 20
+        breaker.check("h")
+        breaker.success("h")
+        breaker.check("h")
+        assert not breaker.is_open("h")
+
+    def test_zero_threshold_disables(self):
+        breaker = CircuitBreaker(failure_threshold=0)
+        for _ in range(10):
+            breaker.failure("h")
+        breaker.check("h")
@@ -0,0 +1,93 @@
+"""Tests for full-text card search."""
+
+from unittest.mock import AsyncMock
+
+from trello_mcp.models import TrelloCard
+from trello_mcp.search import CardSearch, CardSearchIndex
+
+
+def _card(card_id: str, name: str, desc: str = "", **kwargs) -> TrelloCard:
+    return TrelloCard(id=card_id, name=name, desc=desc, idBoard="board1", **kwargs)
+
+
+def _ids(hits):
+    return [card.id for card, _ in hits]
+
+
+def test_ranks_name_matches_above_description_matches():
+    index = CardSearchIndex()
+    index.put(_card("c1", "Release notes", "mention the login fix"))
+    index.put(_card("c2", "Login page crash"))
+    index.put(_card("c3", "Unrelated"))
+    assert _ids(index.search("login")) == ["c2", "c1"]
+
+
+def test_rare_terms_weigh_more():
+    index = CardSearchIndex()
+    index.put(_card("c1", "bug in export"))
+    index.put(_card("c2", "bug in import"))
+    index.put(_card("c3", "bug in sync"))
+    assert _ids(index.search("bug export"))[0] == "c1"
+
+
+def test_updates_replace_old_terms():
+    index = CardSearchIndex()
+    index.put(_card("c1", "Draft"))
+    index.put(_card("c1", "Final"))
+    assert index.search("draft") == []
+    assert _ids(index.search("final")) == ["c1"]
+
+
+def test_archived_and_removed_cards_drop_out():
+    index = CardSearchIndex()
+    index.put(_card("c1", "Alpha"))
+    index.put(_card("c2", "Alpha"))
+    index.put(_card("c1", "Alpha", closed=True))
+    index.remove("c2")
+    assert index.search("alpha") == []
+    assert len(index) == 0
+
+
+def test_comments_are_searchable_and_survive_card_updates():
+    index = CardSearchIndex()
+    index.add_comment("c1", "Blocked on the vendor")
+    index.put(_card("c1", "Integration"))
+    assert _ids(index.search("vendor")) == ["c1"]
+    index.put(_card("c1", "Integration v2"))
+    assert _ids(index.search("vendor")) == ["c1"]
+
+
+async def test_registry_builds_once_and_follows_writes():
+    client = AsyncMock()
+    client.get_board_cards.return_value = [_card("c1", "Write docs")]
+    client.get_board_comments.return_value = [
+        {"data": {"card": {"id": "c1"}, "text": "see the wiki"}}
+    ]
+    search = CardSearch()
+    index = await search.get(client, "board1")
+    assert _ids(index.search("wiki")) == ["c1"]
+
+    search.observe(_card("c2", "Write tests"))
+    search.comment({"data": {"board": {"id": "board1"}, "card": {"id": "c2"}, "text": "pytest"}})
+    assert await search.get(client, "board1") is index
+    assert _ids(index.search("pytest")) == ["c2"]
+    client.get_board_cards.assert_awaited_once()
+
+    search.observe(TrelloCard(id="c2", name="Write tests", idBoard="board2"))
+    assert "c2" not in index
+
+
+async def test_registry_drops_old_and_least_recently_used_boards():
+    client = AsyncMock()
+    client.get_board_cards.return_value = []
+    client.get_board_comments.return_value = []
+    search = CardSearch(max_indexes=2)
+    await search.get(client, "board1")
+    await search.get(client, "board2")
+    await search.get(client, "board1")
+    await search.get(client, "board3")
+    assert "board1" in search and "board3" in search and "board2" not in search
+
+    search.max_age = 0
+    await search.get(client, "board3")
+    assert "board1" not in search
@@ -0,0 +1,25 @@
+"""Tests for startup profiling helpers."""
+
+from trello_mcp.startup import parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:        50 |      70000 | site
+import time:       100 |        100 |     pydantic.fields
+import time:       500 |     900000 |   fastmcp
+import time:       200 |        300 |   trello_mcp.models
+import time:      1000 |    1000000 | trello_mcp.server
+"""
+
+
+def test_parse_importtime_ranks_shallow_imports():
+    assert parse_importtime(IMPORTTIME) == [
+        ("trello_mcp.server", 1.0),
+        ("fastmcp", 0.9),
+        ("site", 0.07),
+        ("trello_mcp.models", 0.0003),
+    ]
+
+
+def test_parse_importtime_depth_and_top():
+    assert parse_importtime(IMPORTTIME, top=1, depth=1) == [("trello_mcp.server", 1.0)]
@@ -0,0 +1,63 @@
+"""Tests for the write-behind card update queue."""
+
+import asyncio
+
+import httpx
+
+from trello_mcp.writes import WriteQueue
+
+
+async def test_updates_to_one_card_are_merged():
+    sent = []
+
+    async def send(params: dict):
+        sent.append(params)
+
+    queue = WriteQueue(delay=0.01)
+    queue.enqueue("card1", {"name": "a"}, send)
+    queue.enqueue("card1", {"idList": "list2"}, send)
+    queue.enqueue("card1", {"name": "b"}, send)
+    queue.enqueue("card2", {"due": "2026-01-01"}, send)
+    assert len(queue) == 2
+    await asyncio.sleep(0.05)
+    assert sorted(sent, key=len) == [{"due": "2026-01-01"}, {"name": "b", "idList": "list2"}]
+    assert (queue.sent, queue.merged, len(queue)) == (2, 2, 0)
+
+
+async def test_flush_sends_without_waiting_for_the_delay():
+    sent = []
+
+    async def send(params: dict):
+        sent.append(params)
+
+    queue = WriteQueue(delay=60)
+    queue.enqueue("card1", {"name": "a"}, send)
+    assert await asyncio.wait_for(queue.flush(), 1) == []
+    assert sent == [{"name": "a"}]
+
+
+async def test_updates_queued_while_sending_keep_their_order():
+    sent = []
+    queue = WriteQueue(delay=0)
+
+    async def send(params: dict):
+        sent.append(params)
+        if params == {"name": "a"}:
+            queue.enqueue("card1", {"name": "b"}, send)
+
+    queue.enqueue("card1", {"name": "a"}, send)
+    await queue.flush()
+    assert sent == [{"name": "a"}, {"name": "b"}]
+
+
+async def test_failures_are_reported_to_their_scope_once():
+    async def send(params: dict):
+        raise httpx.ConnectError("down")
+
+    queue = WriteQueue(delay=0)
+    queue.enqueue("card1", {"name": "a"}, send, scope="alice")
+    queue.enqueue("card2", {"name": "b"}, send, scope="bob")
+    failed = await queue.flush("alice")
+    assert failed == [{"card_id": "card1", "params": {"name": "a"}, "error": "down"}]
+    assert await queue.flush("alice") == []
+    assert [f["card_id"] for f in await queue.flush("bob")] == ["card2"]